@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import timedelta
+import hashlib
 import hmac
 import itertools
 from logging import getLogger
@@ -42,6 +43,10 @@ INITIAL_LOAD_SAVE_DELAY = 300
 
 DEFAULT_SAVE_DELAY = 1
 
+# Refresh tokens are used all the time by clients connecting, the usage is
+# saved along with the next change or at the latest after this delay
+TOKEN_USAGE_SAVE_DELAY = 300
+
 
 class AuthStore:
     """Stores authentication info.
@@ -63,6 +68,10 @@ class AuthStore:
             hass, STORAGE_VERSION, STORAGE_KEY, private=True, atomic_writes=True
         )
         self._token_id_to_user_id: dict[str, str] = {}
+        # Digest of the token -> token id
+        self._token_digest_to_token_id: dict[bytes, str] = {}
+        # Loop time the pending save of the store is written at
+        self._save_at = 0.0
 
     async def async_get_groups(self) -> list[models.Group]:
         """Retrieve all users."""
@@ -141,8 +150,8 @@ class AuthStore:
     async def async_remove_user(self, user: models.User) -> None:
         """Remove a user."""
         user = self._users.pop(user.id)
-        for refresh_token_id in user.refresh_tokens:
-            del self._token_id_to_user_id[refresh_token_id]
+        for refresh_token in user.refresh_tokens.values():
+            self._async_unindex_refresh_token(refresh_token)
         user.refresh_tokens.clear()
         self._async_schedule_save()
 
@@ -229,6 +238,7 @@ class AuthStore:
         token_id = refresh_token.id
         user.refresh_tokens[token_id] = refresh_token
         self._token_id_to_user_id[token_id] = user.id
+        self._token_digest_to_token_id[_token_digest(refresh_token.token)] = token_id
 
         self._async_schedule_save()
         return refresh_token
@@ -239,9 +249,17 @@ class AuthStore:
         refresh_token_id = refresh_token.id
         if user_id := self._token_id_to_user_id.get(refresh_token_id):
             del self._users[user_id].refresh_tokens[refresh_token_id]
-            del self._token_id_to_user_id[refresh_token_id]
+            self._async_unindex_refresh_token(refresh_token)
             self._async_schedule_save()
 
+    @callback
+    def _async_unindex_refresh_token(self, refresh_token: models.RefreshToken) -> None:
+        """Remove a refresh token from the lookup maps."""
+        del self._token_id_to_user_id[refresh_token.id]
+        digest = _token_digest(refresh_token.token)
+        if self._token_digest_to_token_id.get(digest) == refresh_token.id:
+            del self._token_digest_to_token_id[digest]
+
     @callback
     def async_get_refresh_token(self, token_id: str) -> models.RefreshToken | None:
         """Get refresh token by id."""
@@ -254,14 +272,16 @@ class AuthStore:
         self, token: str
     ) -> models.RefreshToken | None:
         """Get refresh token by token."""
-        found = None
-
-        for user in self._users.values():
-            for refresh_token in user.refresh_tokens.values():
-                if hmac.compare_digest(refresh_token.token, token):
-                    found = refresh_token
-
-        return found
+        # The lookup is done by digest, so looking up a token does not
+        # compare it with the tokens in a way that leaks timing information
+        if (
+            (token_id := self._token_digest_to_token_id.get(_token_digest(token)))
+            is None
+            or (refresh_token := self.async_get_refresh_token(token_id)) is None
+            or not hmac.compare_digest(refresh_token.token, token)
+        ):
+            return None
+        return refresh_token
 
     @callback
     def async_get_refresh_tokens(self) -> list[models.RefreshToken]:
@@ -283,7 +303,10 @@ class AuthStore:
             refresh_token.expire_at = (
                 refresh_token.last_used_at.timestamp() + REFRESH_TOKEN_EXPIRATION
             )
-        self._async_schedule_save()
+        # A pending save includes the usage. Scheduling the save again with
+        # the longer delay would postpone it.
+        if self.hass.loop.time() >= self._save_at:
+            self._async_schedule_save(TOKEN_USAGE_SAVE_DELAY)
 
     @callback
     def async_set_expiry(
@@ -499,21 +522,28 @@ class AuthStore:
 
         self._groups = groups
         self._users = users
-        self._build_token_id_to_user_id()
+        self._build_refresh_token_maps()
         self._async_schedule_save(INITIAL_LOAD_SAVE_DELAY)
 
     @callback
-    def _build_token_id_to_user_id(self) -> None:
-        """Build a map of token id to user id."""
+    def _build_refresh_token_maps(self) -> None:
+        """Build the maps of token id to user id and token digest to token id."""
         self._token_id_to_user_id = {
             token_id: user_id
             for user_id, user in self._users.items()
             for token_id in user.refresh_tokens
         }
+        self._token_digest_to_token_id = {
+            _token_digest(refresh_token.token): token_id
+            for user in self._users.values()
+            for token_id, refresh_token in user.refresh_tokens.items()
+        }
 
     @callback
     def _async_schedule_save(self, delay: float = DEFAULT_SAVE_DELAY) -> None:
         """Save users."""
+        # The store writes at the delay of the latest call
+        self._save_at = self.hass.loop.time() + delay
         self._store.async_delay_save(self._data_to_save, delay)
 
     @callback
@@ -604,7 +634,12 @@ class AuthStore:
         read_only_group = _system_read_only_group()
         groups[read_only_group.id] = read_only_group
         self._groups = groups
-        self._build_token_id_to_user_id()
+        self._build_refresh_token_maps()
+
+
+def _token_digest(token: str) -> bytes:
+    """Return the digest of a refresh token used to look it up."""
+    return hashlib.sha256(token.encode()).digest()
 
 
 def _system_admin_group() -> models.Group:
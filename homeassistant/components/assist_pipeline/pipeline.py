@@ -8,6 +8,7 @@ from collections import defaultdict, deque
 from collections.abc import AsyncGenerator, AsyncIterable, Callable
 from dataclasses import asdict, dataclass, field
 from enum import StrEnum
+from functools import lru_cache
 import logging
 from pathlib import Path
 from queue import Empty, Queue
@@ -33,7 +34,7 @@ from homeassistant.components.tts import (
 from homeassistant.const import MATCH_ALL
 from homeassistant.core import Context, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import intent
+from homeassistant.helpers import device_registry as dr, intent
 from homeassistant.helpers.collection import (
     CHANGE_UPDATED,
     CollectionError,
@@ -621,6 +622,21 @@ class PipelineRun:
             return
         pipeline_data.pipeline_debug[self.pipeline.id][self.id].events.append(event)
 
+    @callback
+    def async_get_wake_up_key(self, wake_word_phrase: str) -> tuple[str | None, str]:
+        """Return the key of the wake up cooldown of a wake word phrase.
+
+        Satellites in the same area hearing the same wake word share the
+        cooldown, so only the first one to detect it continues. Satellites in
+        different areas can be woken up at the same time.
+        """
+        area_id: str | None = None
+        if self._device_id is not None and (
+            device := dr.async_get(self.hass).async_get(self._device_id)
+        ):
+            area_id = device.area_id
+        return (area_id, wake_word_phrase)
+
     def start(self, device_id: str | None) -> None:
         """Emit run start event."""
         self._device_id = device_id
@@ -763,9 +779,8 @@ class PipelineRun:
             wake_word_output: dict[str, Any] = {}
         else:
             # Avoid duplicate detections by checking cooldown
-            last_wake_up = self.hass.data[DATA_LAST_WAKE_UP].get(
-                result.wake_word_phrase
-            )
+            wake_up_key = self.async_get_wake_up_key(result.wake_word_phrase)
+            last_wake_up = self.hass.data[DATA_LAST_WAKE_UP].get(wake_up_key)
             if last_wake_up is not None:
                 sec_since_last_wake_up = time.monotonic() - last_wake_up
                 if sec_since_last_wake_up < WAKE_WORD_COOLDOWN:
@@ -776,9 +791,7 @@ class PipelineRun:
                     raise DuplicateWakeUpDetectedError(result.wake_word_phrase)
 
             # Record last wake up time to block duplicate detections
-            self.hass.data[DATA_LAST_WAKE_UP][result.wake_word_phrase] = (
-                time.monotonic()
-            )
+            self.hass.data[DATA_LAST_WAKE_UP][wake_up_key] = time.monotonic()
 
             if result.queued_audio:
                 # Add audio that was pending at detection.
@@ -1276,10 +1289,18 @@ class PipelineRun:
         self.debug_recording_queue = None
         self.debug_recording_thread = None
 
+    async def _async_prepare_volume_table(self) -> None:
+        """Build the table for the volume multiplier outside the event loop."""
+        if self.audio_settings.volume_multiplier != 1.0:
+            await self.hass.async_add_executor_job(
+                _volume_table, self.audio_settings.volume_multiplier
+            )
+
     async def process_volume_only(
         self, audio_stream: AsyncIterable[bytes]
     ) -> AsyncGenerator[EnhancedAudioChunk]:
         """Apply volume transformation only (no VAD/audio enhancements) with optional chunking."""
+        await self._async_prepare_volume_table()
         timestamp_ms = 0
         async for chunk in audio_stream:
             if self.audio_settings.volume_multiplier != 1.0:
@@ -1301,6 +1322,7 @@ class PipelineRun:
         """Split audio into chunks and apply VAD/noise suppression/auto gain/volume transformation."""
         assert self.audio_enhancer is not None
 
+        await self._async_prepare_volume_table()
         timestamp_ms = 0
         async for dirty_samples in audio_stream:
             if self.audio_settings.volume_multiplier != 1.0:
@@ -1317,16 +1339,24 @@ class PipelineRun:
                 timestamp_ms += MS_PER_CHUNK
 
 
-def _multiply_volume(chunk: bytes, volume_multiplier: float) -> bytes:
-    """Multiplies 16-bit PCM samples by a constant."""
+@lru_cache(maxsize=4)
+def _volume_table(volume_multiplier: float) -> array.array[int]:
+    """Return a table of 16-bit samples multiplied by a constant.
 
-    def _clamp(val: float) -> float:
-        """Clamp to signed 16-bit."""
-        return max(-32768, min(32767, val))
+    The table is indexed by the sample, negative samples index it from the end.
+    """
+    values = [
+        max(-32768, min(32767, int(sample * volume_multiplier)))
+        for sample in range(-32768, 32768)
+    ]
+    return array.array("h", values[32768:] + values[:32768])
 
+
+def _multiply_volume(chunk: bytes, volume_multiplier: float) -> bytes:
+    """Multiplies 16-bit PCM samples by a constant."""
     return array.array(
         "h",
-        (int(_clamp(value * volume_multiplier)) for value in array.array("h", chunk)),
+        map(_volume_table(volume_multiplier).__getitem__, array.array("h", chunk)),
     ).tobytes()
 
 
@@ -1431,8 +1461,9 @@ class PipelineInput:
 
                 if self.wake_word_phrase is not None:
                     # Avoid duplicate wake-ups by checking cooldown
+                    wake_up_key = self.run.async_get_wake_up_key(self.wake_word_phrase)
                     last_wake_up = self.run.hass.data[DATA_LAST_WAKE_UP].get(
-                        self.wake_word_phrase
+                        wake_up_key
                     )
                     if last_wake_up is not None:
                         sec_since_last_wake_up = time.monotonic() - last_wake_up
@@ -1444,7 +1475,7 @@ class PipelineInput:
                             raise DuplicateWakeUpDetectedError(self.wake_word_phrase)
 
                     # Record last wake up time to block duplicate detections
-                    self.run.hass.data[DATA_LAST_WAKE_UP][self.wake_word_phrase] = (
+                    self.run.hass.data[DATA_LAST_WAKE_UP][wake_up_key] = (
                         time.monotonic()
                     )
 
@@ -31,27 +31,30 @@ class RingBuffer:
     def put(self, data: bytes) -> None:
         """Put a chunk of data into the buffer, possibly wrapping around."""
         data_len = len(data)
+        # Split through a view to not copy the chunks before writing them
+        view = memoryview(data)
         new_pos = self._pos + data_len
         if new_pos >= self._maxlen:
             # Split into two chunks
             num_bytes_1 = self._maxlen - self._pos
             num_bytes_2 = new_pos - self._maxlen
 
-            self._buffer[self._pos : self._maxlen] = data[:num_bytes_1]
-            self._buffer[:num_bytes_2] = data[num_bytes_1:]
+            self._buffer[self._pos : self._maxlen] = view[:num_bytes_1]
+            self._buffer[:num_bytes_2] = view[num_bytes_1:]
             new_pos = new_pos - self._maxlen
         else:
             # Entire chunk fits at current position
-            self._buffer[self._pos : self._pos + data_len] = data
+            self._buffer[self._pos : self._pos + data_len] = view
 
         self._pos = new_pos
         self._length = min(self._maxlen, self._length + data_len)
 
     def getvalue(self) -> bytes:
         """Get bytes written to the buffer."""
+        buffer = memoryview(self._buffer)
         if (self._pos + self._length) <= self._maxlen:
             # Single chunk
-            return bytes(self._buffer[: self._length])
+            return bytes(buffer[: self._length])
 
-        # Two chunks
-        return bytes(self._buffer[self._pos :] + self._buffer[: self._pos])
+        # Two chunks, joined with a single copy
+        return b"".join((buffer[self._pos :], buffer[: self._pos]))
@@ -49,7 +49,7 @@ class AudioBuffer:
         """Clear the buffer."""
         self._length = 0
 
-    def append(self, data: bytes) -> None:
+    def append(self, data: bytes | memoryview) -> None:
         """Append bytes to the buffer, increasing the internal length."""
         data_len = len(data)
         if (self._length + data_len) > len(self._buffer):
@@ -60,7 +60,8 @@ class AudioBuffer:
 
     def bytes(self) -> bytes:
         """Convert written portion of buffer to bytes."""
-        return bytes(self._buffer[: self._length])
+        # Slicing the bytearray itself would copy the data twice
+        return bytes(memoryview(self._buffer)[: self._length])
 
     def __len__(self) -> int:
         """Get the number of bytes currently in the buffer."""
@@ -303,11 +304,14 @@ def chunk_samples(
         return
 
     next_chunk_idx = 0
+    # Leftover samples are copied into the buffer through a view, without
+    # slicing them into intermediate bytes first
+    samples_view = memoryview(samples)
 
     if leftover_chunk_buffer:
         # Add to leftover chunk from previous call(s).
         bytes_to_copy = bytes_per_chunk - len(leftover_chunk_buffer)
-        leftover_chunk_buffer.append(samples[:bytes_to_copy])
+        leftover_chunk_buffer.append(samples_view[:bytes_to_copy])
         next_chunk_idx = bytes_to_copy
 
         # Process full chunk in buffer
@@ -320,5 +324,5 @@ def chunk_samples(
         next_chunk_idx += bytes_per_chunk
 
     # Capture leftover chunks
-    if rest_samples := samples[next_chunk_idx:]:
+    if rest_samples := samples_view[next_chunk_idx:]:
         leftover_chunk_buffer.append(rest_samples)
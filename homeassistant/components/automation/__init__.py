@@ -14,6 +14,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.blueprint import CONF_USE_BLUEPRINT
+from homeassistant.components.trace import async_remove_trace_samples
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_MODE,
@@ -77,6 +78,7 @@ from homeassistant.helpers.trace import (
     script_execution_set,
     trace_append_element,
     trace_get,
+    trace_is_enabled,
     trace_path,
 )
 from homeassistant.helpers.trigger import async_initialize_triggers
@@ -662,23 +664,26 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
                     variables = self._variables.async_render(self.hass, variables)
                 except TemplateError as err:
                     self._logger.error("Error rendering variables: %s", err)
-                    automation_trace.set_error(err)
+                    if automation_trace is not None:
+                        automation_trace.set_error(err)
                     return None
 
-            # Prepare tracing the automation
-            automation_trace.set_trace(trace_get())
+            if automation_trace is not None:
+                # Prepare tracing the automation
+                automation_trace.set_trace(trace_get())
 
-            # Set trigger reason
-            trigger_description = variables.get("trigger", {}).get("description")
-            automation_trace.set_trigger_description(trigger_description)
+                # Set trigger reason
+                trigger_description = variables.get("trigger", {}).get("description")
+                automation_trace.set_trigger_description(trigger_description)
 
             # Add initial variables as the trigger step
             if "trigger" in variables and "idx" in variables["trigger"]:
                 trigger_path = f"trigger/{variables['trigger']['idx']}"
             else:
                 trigger_path = "trigger"
-            trace_element = TraceElement(variables, trigger_path)
-            trace_append_element(trace_element)
+            if trace_is_enabled():
+                trace_element = TraceElement(variables, trigger_path)
+                trace_append_element(trace_element)
 
             if (
                 not skip_condition
@@ -734,17 +739,20 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
                         "edit": f"/config/automation/edit/{self.unique_id}",
                     },
                 )
-                automation_trace.set_error(err)
+                if automation_trace is not None:
+                    automation_trace.set_error(err)
             except (vol.Invalid, HomeAssistantError) as err:
                 self._logger.error(
                     "Error while executing automation %s: %s",
                     self.entity_id,
                     err,
                 )
-                automation_trace.set_error(err)
+                if automation_trace is not None:
+                    automation_trace.set_error(err)
             except Exception as err:
                 self._logger.exception("While executing automation %s", self.entity_id)
-                automation_trace.set_error(err)
+                if automation_trace is not None:
+                    automation_trace.set_error(err)
 
             return None
 
@@ -752,6 +760,7 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
         """Remove listeners when removing automation from Home Assistant."""
         await super().async_will_remove_from_hass()
         await self._async_disable()
+        async_remove_trace_samples(self.hass, f"{DOMAIN}.{self.unique_id}")
 
     async def _async_enable_automation(self, event: Event) -> None:
         """Start automation on startup."""
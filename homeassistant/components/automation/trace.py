@@ -8,10 +8,16 @@ from typing import Any
 
 from homeassistant.components.trace import (
     CONF_STORED_TRACES,
+    TRACE_MODE_ALWAYS,
+    TRACE_MODE_OFF,
+    TRACE_MODE_ON_ERROR,
     ActionTrace,
+    async_get_trace_mode,
     async_store_trace,
 )
 from homeassistant.core import Context, HomeAssistant
+from homeassistant.helpers.script import DATA_SCRIPT_BREAKPOINTS
+from homeassistant.helpers.trace import trace_enabled, trace_id_cv
 from homeassistant.helpers.typing import ConfigType
 
 from .const import DOMAIN
@@ -55,13 +61,29 @@ def trace_automation(
     blueprint_inputs: ConfigType | None,
     context: Context,
     trace_config: ConfigType,
-) -> Generator[AutomationTrace]:
+) -> Generator[AutomationTrace | None]:
     """Trace action execution of automation with automation_id."""
+    key = f"{DOMAIN}.{automation_id}"
+    trace_mode = async_get_trace_mode(hass, key, trace_config)
+    if trace_mode == TRACE_MODE_OFF and key not in hass.data.get(
+        DATA_SCRIPT_BREAKPOINTS, {}
+    ):
+        # Nothing is stored and no breakpoint can be hit, skip building a trace
+        token = trace_id_cv.set(None)
+        try:
+            with trace_enabled(False):
+                yield None
+        finally:
+            trace_id_cv.reset(token)
+        return
+
     trace = AutomationTrace(automation_id, config, blueprint_inputs, context)
-    async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    if trace_mode == TRACE_MODE_ALWAYS:
+        async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
 
     try:
-        yield trace
+        with trace_enabled(trace_mode != TRACE_MODE_OFF):
+            yield trace
     except Exception as ex:
         if automation_id:
             trace.set_error(ex)
@@ -69,3 +91,5 @@ def trace_automation(
     finally:
         if automation_id:
             trace.finished()
+        if trace_mode == TRACE_MODE_ON_ERROR and trace.error is not None:
+            async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
@@ -163,6 +163,7 @@ class BinarySensorEntity(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_)
     _attr_device_class: BinarySensorDeviceClass | None
     _attr_is_on: bool | None = None
     _attr_state: None = None
+    _state_value_properties = frozenset({"is_on", "state"})
 
     async def async_internal_added_to_hass(self) -> None:
         """Call when the binary sensor entity is added to hass."""
@@ -112,6 +112,9 @@ def async_register_callback(
     callback: BluetoothCallback,
     match_dict: BluetoothCallbackMatcher | None,
     mode: BluetoothScanningMode,
+    *,
+    dedup_window: float | None = None,
+    min_interval: float | None = None,
 ) -> Callable[[], None]:
     """Register to receive a callback on bluetooth change.
 
@@ -120,9 +123,15 @@ def async_register_callback(
     is required to be present to avoid a future breaking change
     when we support passive scanning.
 
+    With dedup_window, a payload of an address delivered to the callback
+    within the window is not delivered again. With min_interval, at most
+    one advertisement per address is delivered within the interval.
+
     Returns a callback that can be used to cancel the registration.
     """
-    return _get_manager(hass).async_register_callback(callback, match_dict)
+    return _get_manager(hass).async_register_callback(
+        callback, match_dict, dedup_window, min_interval
+    )
 
 
 async def async_process_advertisements(
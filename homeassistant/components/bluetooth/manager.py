@@ -6,6 +6,7 @@ from collections.abc import Callable, Iterable
 from functools import partial
 import itertools
 import logging
+from typing import Any
 
 from bleak_retry_connector import BleakSlotManager
 from bluetooth_adapters import BluetoothAdapters
@@ -34,6 +35,7 @@ from .match import (
     ble_device_matches,
 )
 from .models import BluetoothCallback, BluetoothChange, BluetoothServiceInfoBleak
+from .shaping import AdvertisementCounters, AdvertisementShaper
 from .storage import BluetoothStorage
 from .util import async_load_history_from_system
 
@@ -46,6 +48,7 @@ class HomeAssistantBluetoothManager(BluetoothManager):
     __slots__ = (
         "hass",
         "storage",
+        "advertisement_counters",
         "_integration_matcher",
         "_callback_index",
         "_cancel_logging_listener",
@@ -62,6 +65,7 @@ class HomeAssistantBluetoothManager(BluetoothManager):
         """Init bluetooth manager."""
         self.hass = hass
         self.storage = storage
+        self.advertisement_counters = AdvertisementCounters()
         self._integration_matcher = integration_matcher
         self._callback_index = BluetoothCallbackMatcherIndex()
         self._cancel_logging_listener: CALLBACK_TYPE | None = None
@@ -102,6 +106,8 @@ class HomeAssistantBluetoothManager(BluetoothManager):
             self._async_trigger_matching_discovery(service_info)
 
     def _discover_service_info(self, service_info: BluetoothServiceInfoBleak) -> None:
+        counters = self.advertisement_counters
+        counters.received += 1
         matched_domains = self._integration_matcher.match_domains(service_info)
         if self._debug:
             _LOGGER.debug(
@@ -113,6 +119,7 @@ class HomeAssistantBluetoothManager(BluetoothManager):
 
         for match in self._callback_index.match_callbacks(service_info):
             callback = match[CALLBACK]
+            counters.dispatched += 1
             try:
                 callback(service_info, BluetoothChange.ADVERTISEMENT)
             except Exception:
@@ -144,6 +151,13 @@ class HomeAssistantBluetoothManager(BluetoothManager):
         ):
             self.hass.config_entries.flow.async_abort(flow["flow_id"])
 
+    async def async_diagnostics(self) -> dict[str, Any]:
+        """Diagnostics for the manager."""
+        return {
+            **await super().async_diagnostics(),
+            "advertisement_counters": self.advertisement_counters.as_dict(),
+        }
+
     async def async_setup(self) -> None:
         """Set up the bluetooth manager."""
         await super().async_setup()
@@ -172,8 +186,19 @@ class HomeAssistantBluetoothManager(BluetoothManager):
         self,
         callback: BluetoothCallback,
         matcher: BluetoothCallbackMatcher | None,
+        dedup_window: float | None = None,
+        min_interval: float | None = None,
     ) -> Callable[[], None]:
-        """Register a callback."""
+        """Register a callback.
+
+        With a dedup window, payloads of an address already delivered to the
+        callback within the window are dropped. With a minimum interval, at
+        most one advertisement per address is delivered within the interval.
+        """
+        if dedup_window is not None or min_interval is not None:
+            callback = AdvertisementShaper(
+                callback, self.advertisement_counters, dedup_window, min_interval
+            )
         callback_matcher = BluetoothCallbackMatcherWithCallback(callback=callback)
         if not matcher:
             callback_matcher[CONNECTABLE] = True
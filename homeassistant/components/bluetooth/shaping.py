@@ -0,0 +1,125 @@
+"""Deduplication and rate shaping of advertisements delivered to callbacks."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from typing import Any, Final
+
+from lru import LRU
+
+from .match import MAX_REMEMBER_ADDRESSES
+from .models import BluetoothCallback, BluetoothChange, BluetoothServiceInfoBleak
+
+# Payloads remembered per address to drop repeated payloads
+MAX_REMEMBER_PAYLOADS: Final = 8
+
+
+@dataclass(slots=True)
+class AdvertisementCounters:
+    """Counters of the advertisements processed by the manager."""
+
+    # Advertisements with changed data passed on by the scanners
+    received: int = 0
+    # Advertisements dispatched to matching callbacks, including the ones
+    # dropped by the shaping of a callback
+    dispatched: int = 0
+    # Advertisements dropped as a payload was already delivered to a callback
+    deduped: int = 0
+    # Advertisements dropped by the minimum interval of a callback
+    rate_limited: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters as a dict."""
+        return asdict(self)
+
+
+def _payload_hash(service_info: BluetoothServiceInfoBleak) -> int:
+    """Return the hash of the payload of an advertisement."""
+    return hash(
+        (
+            service_info.name,
+            tuple(service_info.manufacturer_data.items()),
+            tuple(service_info.service_data.items()),
+            tuple(service_info.service_uuids),
+        )
+    )
+
+
+class _AddressHistory:
+    """Payloads delivered for an address."""
+
+    __slots__ = ("last_delivery", "payloads")
+
+    def __init__(self) -> None:
+        """Initialize the history."""
+        self.last_delivery: float | None = None
+        # payload hash -> time the payload was delivered
+        self.payloads: dict[int, float] = {}
+
+
+class AdvertisementShaper:
+    """Drop advertisements of an address a callback does not need.
+
+    The scanners already drop advertisements with the same payload as the
+    last one seen for an address, but devices alternating between payloads
+    still produce an advertisement each time. With a dedup window, a payload
+    delivered within the window is not delivered again. With a minimum
+    interval, at most one advertisement per address is delivered within
+    the interval.
+    """
+
+    __slots__ = (
+        "_callback",
+        "_counters",
+        "_dedup_window",
+        "_history",
+        "_min_interval",
+    )
+
+    def __init__(
+        self,
+        callback: BluetoothCallback,
+        counters: AdvertisementCounters,
+        dedup_window: float | None,
+        min_interval: float | None,
+    ) -> None:
+        """Initialize the shaper."""
+        self._callback = callback
+        self._counters = counters
+        self._dedup_window = dedup_window
+        self._min_interval = min_interval
+        self._history: LRU[str, _AddressHistory] = LRU(MAX_REMEMBER_ADDRESSES)
+
+    def __call__(
+        self, service_info: BluetoothServiceInfoBleak, change: BluetoothChange
+    ) -> None:
+        """Deliver the advertisement unless it is dropped."""
+        address = service_info.address
+        now = service_info.time
+        if (history := self._history.get(address)) is None:
+            history = self._history[address] = _AddressHistory()
+        elif (
+            self._min_interval is not None
+            and history.last_delivery is not None
+            and now - history.last_delivery < self._min_interval
+        ):
+            self._counters.rate_limited += 1
+            return
+
+        if (dedup_window := self._dedup_window) is not None:
+            payloads = history.payloads
+            payload_hash = _payload_hash(service_info)
+            if (
+                delivered := payloads.get(payload_hash)
+            ) is not None and now - delivered < dedup_window:
+                self._counters.deduped += 1
+                return
+            # Keep the payloads in delivery order
+            payloads.pop(payload_hash, None)
+            payloads[payload_hash] = now
+            if len(payloads) > MAX_REMEMBER_PAYLOADS:
+                # Payloads are kept in delivery order, drop the oldest
+                del payloads[next(iter(payloads))]
+
+        history.last_delivery = now
+        self._callback(service_info, change)
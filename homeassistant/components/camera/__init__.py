@@ -84,6 +84,7 @@ from .const import (
 from .helper import get_camera_from_entity_id
 from .img_util import scale_jpeg_camera_image
 from .prefs import CameraPreferences, DynamicStreamSettings  # noqa: F401
+from .snapshot import SNAPSHOT_CACHE_TTL, SnapshotCache
 from .webrtc import (
     DATA_ICE_SERVERS,
     CameraWebRTCLegacyProvider,
@@ -197,32 +198,49 @@ async def _async_get_image(
     """
     with suppress(asyncio.CancelledError, TimeoutError):
         async with asyncio.timeout(timeout):
-            image_bytes = (
-                await _async_get_stream_image(
-                    camera, width=width, height=height, wait_for_next_keyframe=False
-                )
-                if camera.use_stream_for_stills
-                else await camera.async_camera_image(width=width, height=height)
-            )
-            if image_bytes:
-                content_type = camera.content_type
-                image = Image(content_type, image_bytes)
-                if (
-                    width is not None
-                    and height is not None
-                    and ("jpeg" in content_type or "jpg" in content_type)
-                ):
-                    assert width is not None
-                    assert height is not None
-                    return Image(
-                        content_type, scale_jpeg_camera_image(image, width, height)
-                    )
-
+            # Stream images only change with a new keyframe, so they are shared
+            # with later requests as well
+            if image := await camera.snapshot_cache.async_get(
+                (width, height),
+                partial(_async_fetch_image, camera, width, height),
+                SNAPSHOT_CACHE_TTL if camera.use_stream_for_stills else 0,
+            ):
                 return image
 
     raise HomeAssistantError("Unable to get image")
 
 
+async def _async_fetch_image(
+    camera: Camera, width: int | None, height: int | None
+) -> Image | None:
+    """Fetch a snapshot image from a camera, scaling it if possible."""
+    image_bytes = (
+        await _async_get_stream_image(
+            camera, width=width, height=height, wait_for_next_keyframe=False
+        )
+        if camera.use_stream_for_stills
+        else await camera.async_camera_image(width=width, height=height)
+    )
+    if not image_bytes:
+        return None
+    content_type = camera.content_type
+    image = Image(content_type, image_bytes)
+    if (
+        width is not None
+        and height is not None
+        and ("jpeg" in content_type or "jpg" in content_type)
+    ):
+        return Image(
+            content_type,
+            camera.snapshot_cache.async_scale(
+                image_bytes,
+                (width, height),
+                partial(scale_jpeg_camera_image, image, width, height),
+            ),
+        )
+    return image
+
+
 @bind_hass
 async def async_get_image(
     hass: HomeAssistant,
@@ -479,6 +497,7 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         self._warned_old_signature = False
         self.async_update_token()
         self._create_stream_lock: asyncio.Lock | None = None
+        self.snapshot_cache = SnapshotCache()
         self._webrtc_provider: CameraWebRTCProvider | None = None
         self._legacy_webrtc_provider: CameraWebRTCLegacyProvider | None = None
         self._supports_native_sync_webrtc = (
@@ -0,0 +1,154 @@
+"""Cache of the snapshot images of a camera."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from functools import partial
+import time
+from typing import TYPE_CHECKING, Any, Final
+
+if TYPE_CHECKING:
+    from . import Image
+
+# Seconds a snapshot of a stream is served from the cache
+SNAPSHOT_CACHE_TTL: Final = 1.0
+# Number of image sizes cached per camera
+MAX_SNAPSHOT_SIZES: Final = 8
+
+type SnapshotSize = tuple[int | None, int | None]
+
+
+@dataclass(slots=True)
+class SnapshotCacheStats:
+    """Statistics of a snapshot cache."""
+
+    # Requests served from the cache
+    hits: int = 0
+    # Requests that waited for the fetch of another request
+    coalesced: int = 0
+    # Requests that fetched an image from the camera
+    misses: int = 0
+    # Fetched images that did not have to be scaled again
+    scaled_hits: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dict."""
+        requests = self.hits + self.coalesced + self.misses
+        return {
+            "hits": self.hits,
+            "coalesced": self.coalesced,
+            "misses": self.misses,
+            "scaled_hits": self.scaled_hits,
+            "hit_rate": (self.hits + self.coalesced) / requests if requests else None,
+        }
+
+
+@dataclass(slots=True)
+class _PendingSnapshot:
+    """A snapshot being fetched and the number of requests waiting for it."""
+
+    task: asyncio.Task[Image | None]
+    waiters: int = 0
+
+
+class SnapshotCache:
+    """Share the snapshots of a camera between requests.
+
+    Requests for the same size arriving while a snapshot is fetched share
+    the fetch. The fetch continues when the request that started it is
+    cancelled, and is only cancelled when no request waits for it anymore.
+    Snapshots stored with a time to live are also shared with the requests
+    arriving shortly after. Scaled images are kept per size along with the
+    image they were scaled from, so the same image is not scaled again for
+    each request.
+    """
+
+    __slots__ = ("_images", "_pending", "_scaled", "stats")
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        # size -> (time the image expires, image), oldest first
+        self._images: dict[SnapshotSize, tuple[float, Image]] = {}
+        self._pending: dict[SnapshotSize, _PendingSnapshot] = {}
+        # size -> (image scaled from, scaled image), oldest first
+        self._scaled: dict[tuple[int, int], tuple[bytes, bytes]] = {}
+        self.stats = SnapshotCacheStats()
+
+    async def async_get(
+        self,
+        size: SnapshotSize,
+        fetch: Callable[[], Awaitable[Image | None]],
+        ttl: float = 0,
+    ) -> Image | None:
+        """Return the cached image of a size or fetch it.
+
+        The fetched image is cached for ttl seconds.
+        """
+        cached = self._images.get(size)
+        if cached is not None and time.monotonic() < cached[0]:
+            self.stats.hits += 1
+            return cached[1]
+
+        if (pending := self._pending.get(size)) is not None:
+            self.stats.coalesced += 1
+        else:
+            self.stats.misses += 1
+            task = asyncio.get_running_loop().create_task(
+                self._async_fetch(size, fetch, ttl)
+            )
+            task.add_done_callback(partial(self._async_fetch_done, size))
+            pending = self._pending[size] = _PendingSnapshot(task)
+
+        pending.waiters += 1
+        try:
+            return await asyncio.shield(pending.task)
+        finally:
+            pending.waiters -= 1
+            if not pending.waiters and pending.task.cancel():
+                # No request waits for the image anymore, later requests
+                # must not wait for the cancelled fetch
+                del self._pending[size]
+
+    async def _async_fetch(
+        self,
+        size: SnapshotSize,
+        fetch: Callable[[], Awaitable[Image | None]],
+        ttl: float,
+    ) -> Image | None:
+        """Fetch the image of a size and cache it for ttl seconds."""
+        image = await fetch()
+        if image is not None and ttl > 0:
+            _async_store(self._images, size, (time.monotonic() + ttl, image))
+        return image
+
+    def _async_fetch_done(
+        self, size: SnapshotSize, task: asyncio.Task[Image | None]
+    ) -> None:
+        """Remove a finished fetch, later requests fetch the image again."""
+        if (pending := self._pending.get(size)) is not None and pending.task is task:
+            del self._pending[size]
+        if not task.cancelled():
+            # Requests waiting for the image get the exception, do not warn
+            # when there are none
+            task.exception()
+
+    def async_scale(
+        self, content: bytes, size: tuple[int, int], scale: Callable[[], bytes]
+    ) -> bytes:
+        """Return the scaled image of the content, scaling it if needed."""
+        if (scaled := self._scaled.get(size)) is not None and scaled[0] == content:
+            self.stats.scaled_hits += 1
+            return scaled[1]
+        scaled_content = scale()
+        _async_store(self._scaled, size, (content, scaled_content))
+        return scaled_content
+
+
+def _async_store[_KT, _VT](cache: dict[_KT, _VT], key: _KT, value: _VT) -> None:
+    """Store a value as the newest of a cache, dropping the oldest values."""
+    cache.pop(key, None)
+    cache[key] = value
+    while len(cache) > MAX_SNAPSHOT_SIZES:
+        del cache[next(iter(cache))]
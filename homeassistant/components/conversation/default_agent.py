@@ -14,14 +14,8 @@ import re
 import time
 from typing import IO, Any, cast
 
-from hassil.expression import Expression, ListReference, Sequence, TextChunk
-from hassil.intents import (
-    Intents,
-    SlotList,
-    TextSlotList,
-    TextSlotValue,
-    WildcardSlotList,
-)
+from hassil.expression import Expression, ListReference, Sequence
+from hassil.intents import Intents, SlotList, TextSlotList, WildcardSlotList
 from hassil.recognize import (
     MISSING_ENTITY,
     RecognizeResult,
@@ -29,7 +23,6 @@ from hassil.recognize import (
     recognize_best,
 )
 from hassil.string_matcher import UnmatchedRangeEntity, UnmatchedTextEntity
-from hassil.trie import Trie
 from hassil.util import merge_dict
 from home_assistant_intents import ErrorKey, get_intents, get_languages
 import yaml
@@ -62,6 +55,7 @@ from .const import (
 )
 from .entity import ConversationEntity
 from .models import ConversationInput, ConversationResult
+from .name_index import EntityNameIndex
 from .trace import ConversationTraceEventType, async_conversation_trace_append
 
 _LOGGER = logging.getLogger(__name__)
@@ -242,8 +236,10 @@ class DefaultAgent(ConversationEntity):
         self._slot_lists: dict[str, SlotList] | None = None
 
         # Used to filter slot lists before intent matching
-        self._exposed_names_trie: Trie | None = None
-        self._unexposed_names_trie: Trie | None = None
+        self._exposed_names: EntityNameIndex | None = None
+        self._unexposed_names: EntityNameIndex | None = None
+        # Entities with names or exposure changed since the indexes were updated
+        self._pending_name_updates: set[str] = set()
 
         # Sentences that will trigger a callback (skipping intent recognition)
         self.trigger_sentences: list[TriggerData] = []
@@ -289,12 +285,12 @@ class DefaultAgent(ConversationEntity):
             ),
             self.hass.bus.async_listen(
                 er.EVENT_ENTITY_REGISTRY_UPDATED,
-                self._async_clear_slot_list,
+                self._async_entity_names_changed,
                 event_filter=self._filter_entity_registry_changes,
             ),
             self.hass.bus.async_listen(
                 EVENT_STATE_CHANGED,
-                self._async_clear_slot_list,
+                self._async_entity_names_changed,
                 event_filter=self._filter_state_changes,
             ),
             async_listen_entity_updates(self.hass, DOMAIN, self._async_clear_slot_list),
@@ -313,17 +309,24 @@ class DefaultAgent(ConversationEntity):
             return None
 
         slot_lists = self._make_slot_lists()
+        self._async_update_entity_names()
         intent_context = self._make_intent_context(user_input)
 
-        if self._exposed_names_trie is not None:
+        if self._exposed_names is not None:
             # Filter by input string
-            text_lower = user_input.text.strip().lower()
-            slot_lists["name"] = TextSlotList(
-                name="name",
-                values=[
-                    result[2] for result in self._exposed_names_trie.find(text_lower)
-                ],
-            )
+            slot_lists = {
+                **slot_lists,
+                "name": self._exposed_names.find(user_input.text),
+            }
+
+        # The name indexes are only used on the event loop, where they are
+        # kept up to date, so the unexposed names are filtered here as well
+        unexposed_slot_lists: dict[str, SlotList] | None = None
+        if not strict_intents_only:
+            unexposed_slot_lists = {
+                **slot_lists,
+                "name": self._async_get_unexposed_entity_names(user_input.text),
+            }
 
         start = time.monotonic()
 
@@ -332,6 +335,7 @@ class DefaultAgent(ConversationEntity):
             user_input,
             lang_intents,
             slot_lists,
+            unexposed_slot_lists,
             intent_context,
             language,
             strict_intents_only,
@@ -509,11 +513,16 @@ class DefaultAgent(ConversationEntity):
         user_input: ConversationInput,
         lang_intents: LanguageIntents,
         slot_lists: dict[str, SlotList],
+        unexposed_slot_lists: dict[str, SlotList] | None,
         intent_context: dict[str, Any] | None,
         language: str,
         strict_intents_only: bool,
     ) -> RecognizeResult | None:
-        """Search intents for a match to user input."""
+        """Search intents for a match to user input.
+
+        The slot lists with unexposed entity names are only needed, and only
+        passed, when not matching strict intents only.
+        """
         skip_exposed_match = False
 
         # Try cache first
@@ -555,7 +564,7 @@ class DefaultAgent(ConversationEntity):
                 # Successful strict match with exposed entities
                 return strict_result
 
-        if strict_intents_only:
+        if strict_intents_only or unexposed_slot_lists is None:
             # Don't try matching against all entities or doing a fuzzy match
             return None
 
@@ -573,16 +582,11 @@ class DefaultAgent(ConversationEntity):
             skip_unexposed_entities_match = True
 
         if not skip_unexposed_entities_match:
-            unexposed_entities_slot_lists = {
-                **slot_lists,
-                "name": self._get_unexposed_entity_names(user_input.text),
-            }
-
             start_time = time.monotonic()
             strict_result = self._recognize_strict(
                 user_input,
                 lang_intents,
-                unexposed_entities_slot_lists,
+                unexposed_slot_lists,
                 intent_context,
                 language,
             )
@@ -703,63 +707,48 @@ class DefaultAgent(ConversationEntity):
 
         return maybe_result
 
-    def _get_unexposed_entity_names(self, text: str) -> TextSlotList:
+    @core.callback
+    def _async_get_unexposed_entity_names(self, text: str) -> TextSlotList:
         """Get filtered slot list with unexposed entity names in Home Assistant."""
-        if self._unexposed_names_trie is None:
-            # Build trie
-            self._unexposed_names_trie = Trie()
-            for name_tuple in self._get_entity_name_tuples(exposed=False):
-                self._unexposed_names_trie.insert(
-                    name_tuple[0].lower(),
-                    TextSlotValue.from_tuple(name_tuple, allow_template=False),
+        if self._unexposed_names is None:
+            # Build index
+            unexposed_names = EntityNameIndex()
+            entity_registry = er.async_get(self.hass)
+            for state in self.hass.states.async_all():
+                if async_should_expose(self.hass, DOMAIN, state.entity_id):
+                    continue
+                unexposed_names.async_set(
+                    state.entity_id,
+                    self._get_entity_name_tuples(state, entity_registry),
                 )
+            self._unexposed_names = unexposed_names
 
         # Build filtered slot list
-        text_lower = text.strip().lower()
-        return TextSlotList(
-            name="name",
-            values=[
-                result[2] for result in self._unexposed_names_trie.find(text_lower)
-            ],
-        )
+        return self._unexposed_names.find(text)
 
     def _get_entity_name_tuples(
-        self, exposed: bool
+        self, state: core.State, entity_registry: er.EntityRegistry
     ) -> Iterable[tuple[str, str, dict[str, Any]]]:
-        """Yield (input name, output name, context) tuples for entities."""
-        entity_registry = er.async_get(self.hass)
-
-        for state in self.hass.states.async_all():
-            entity_exposed = async_should_expose(self.hass, DOMAIN, state.entity_id)
-            if exposed and (not entity_exposed):
-                # Required exposed, entity is not
-                continue
-
-            if (not exposed) and entity_exposed:
-                # Required not exposed, entity is
-                continue
+        """Yield (input name, output name, context) tuples for an entity."""
+        # Checked against "requires_context" and "excludes_context" in hassil
+        context = {"domain": state.domain}
+        if state.attributes:
+            # Include some attributes
+            for attr in DEFAULT_EXPOSED_ATTRIBUTES:
+                if attr not in state.attributes:
+                    continue
+                context[attr] = state.attributes[attr]
 
-            # Checked against "requires_context" and "excludes_context" in hassil
-            context = {"domain": state.domain}
-            if state.attributes:
-                # Include some attributes
-                for attr in DEFAULT_EXPOSED_ATTRIBUTES:
-                    if attr not in state.attributes:
-                        continue
-                    context[attr] = state.attributes[attr]
-
-            if (
-                entity := entity_registry.async_get(state.entity_id)
-            ) and entity.aliases:
-                for alias in entity.aliases:
-                    alias = alias.strip()
-                    if not alias:
-                        continue
+        if (entity := entity_registry.async_get(state.entity_id)) and entity.aliases:
+            for alias in entity.aliases:
+                alias = alias.strip()
+                if not alias:
+                    continue
 
-                    yield (alias, alias, context)
+                yield (alias, alias, context)
 
-            # Default name
-            yield (state.name, state.name, context)
+        # Default name
+        yield (state.name, state.name, context)
 
     def _recognize_strict(
         self,
@@ -1051,8 +1040,9 @@ class DefaultAgent(ConversationEntity):
         if self._unsub_clear_slot_list is None:
             return
         self._slot_lists = None
-        self._exposed_names_trie = None
-        self._unexposed_names_trie = None
+        self._exposed_names = None
+        self._unexposed_names = None
+        self._pending_name_updates.clear()
         for unsub in self._unsub_clear_slot_list:
             unsub()
         self._unsub_clear_slot_list = None
@@ -1060,9 +1050,48 @@ class DefaultAgent(ConversationEntity):
         # Slot lists have changed, so we must clear the cache
         self._intent_cache.clear()
 
+    @core.callback
+    def _async_entity_names_changed(self, event: core.Event[Any]) -> None:
+        """Queue an update of the names of an entity that was changed."""
+        if self._unsub_clear_slot_list is None:
+            return
+        self._pending_name_updates.add(event.data["entity_id"])
+
+        # Slot lists have changed, so we must clear the cache
+        self._intent_cache.clear()
+
+    @core.callback
+    def _async_update_entity_names(self) -> None:
+        """Update the name indexes with the names of the changed entities."""
+        if not self._pending_name_updates or self._exposed_names is None:
+            return
+
+        entity_registry = er.async_get(self.hass)
+        for entity_id in self._pending_name_updates:
+            names: EntityNameIndex | None = self._exposed_names
+            other_names: EntityNameIndex | None = self._unexposed_names
+            if (state := self.hass.states.get(entity_id)) is not None and (
+                not async_should_expose(self.hass, DOMAIN, entity_id)
+            ):
+                names, other_names = other_names, names
+            if other_names is not None:
+                other_names.async_remove(entity_id)
+            if names is None:
+                # The unexposed names are indexed when they are first needed
+                continue
+            if state is None:
+                names.async_remove(entity_id)
+            else:
+                names.async_set(
+                    entity_id, self._get_entity_name_tuples(state, entity_registry)
+                )
+
+        _LOGGER.debug("Updated names of %s entities", len(self._pending_name_updates))
+        self._pending_name_updates.clear()
+
     @core.callback
     def _make_slot_lists(self) -> dict[str, SlotList]:
-        """Create slot lists with areas and entity names/aliases."""
+        """Create slot lists with areas and the index of entity names/aliases."""
         if self._slot_lists is not None:
             return self._slot_lists
 
@@ -1075,8 +1104,15 @@ class DefaultAgent(ConversationEntity):
         # have the same name. The intent matcher doesn't gather all matching
         # values for a list, just the first. So we will need to match by name no
         # matter what.
-        exposed_entity_names = list(self._get_entity_name_tuples(exposed=True))
-        _LOGGER.debug("Exposed entities: %s", exposed_entity_names)
+        exposed_names = EntityNameIndex()
+        entity_registry = er.async_get(self.hass)
+        for state in self.hass.states.async_all():
+            if not async_should_expose(self.hass, DOMAIN, state.entity_id):
+                continue
+            exposed_names.async_set(
+                state.entity_id, self._get_entity_name_tuples(state, entity_registry)
+            )
+        _LOGGER.debug("Exposed entities: %s", len(exposed_names))
 
         # Expose all areas.
         areas = ar.async_get(self.hass)
@@ -1108,17 +1144,12 @@ class DefaultAgent(ConversationEntity):
 
                 floor_names.append((alias, floor.name))
 
-        # Build trie
-        self._exposed_names_trie = Trie()
-        name_list = TextSlotList.from_tuples(exposed_entity_names, allow_template=False)
-        for name_value in name_list.values:
-            assert isinstance(name_value.text_in, TextChunk)
-            name_text = name_value.text_in.text.strip().lower()
-            self._exposed_names_trie.insert(name_text, name_value)
+        self._exposed_names = exposed_names
+        self._pending_name_updates.clear()
 
+        # The name list is filtered by the input text with the name index
         self._slot_lists = {
             "area": TextSlotList.from_tuples(area_names, allow_template=False),
-            "name": name_list,
             "floor": TextSlotList.from_tuples(floor_names, allow_template=False),
         }
 
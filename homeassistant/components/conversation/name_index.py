@@ -0,0 +1,140 @@
+"""Index of entity names used to filter the name slot list of the default agent."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+from hassil.intents import TextSlotList, TextSlotValue
+
+
+def normalize_name(text: str) -> str:
+    """Normalize a name or sentence for lookups in the name index."""
+    return " ".join(text.casefold().split())
+
+
+class _TrieNode:
+    """Node of a name trie."""
+
+    __slots__ = ("children", "text", "values")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TrieNode] = {}
+        self.text: str | None = None
+        self.values: list[Any] = []
+
+
+class NameTrie:
+    """Trie that finds all known names contained in a text.
+
+    Works like the hassil trie, but values can also be removed, so the trie
+    can be kept up to date when a single entity changes.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _TrieNode()
+
+    def insert(self, text: str, value: Any) -> None:
+        """Insert a name and its value."""
+        node = self._root
+        for char in text:
+            if (child := node.children.get(char)) is None:
+                child = node.children[char] = _TrieNode()
+            node = child
+        node.text = text
+        node.values.append(value)
+
+    def remove(self, text: str, value: Any) -> None:
+        """Remove a value of a name."""
+        node = self._root
+        path: list[tuple[_TrieNode, str]] = []
+        for char in text:
+            if (child := node.children.get(char)) is None:
+                return
+            path.append((node, char))
+            node = child
+        for idx, node_value in enumerate(node.values):
+            if node_value is value:
+                del node.values[idx]
+                break
+        else:
+            return
+        if node.values:
+            return
+        node.text = None
+        # Prune the nodes no other name goes through
+        while path and not node.values and not node.children:
+            parent, char = path.pop()
+            del parent.children[char]
+            node = parent
+
+    def find(self, text: str) -> Iterator[tuple[int, str, Any]]:
+        """Yield (end_pos, name, value) of all names found in the text.
+
+        Each name is only yielded once, at its first end position.
+        """
+        roots = self._root.children
+        text_len = len(text)
+        queue = deque(
+            (roots, position) for position in range(text_len) if text[position] in roots
+        )
+        found: set[int] = set()
+        while queue:
+            children, position = queue.popleft()
+            if (node := children.get(text[position])) is None:
+                continue
+            if node.values and id(node) not in found:
+                found.add(id(node))
+                if TYPE_CHECKING:
+                    # Nodes with values are the end of a name
+                    assert node.text is not None
+                for value in node.values:
+                    yield (position + 1, node.text, value)
+            if node.children and position + 1 < text_len:
+                queue.append((node.children, position + 1))
+
+
+class EntityNameIndex:
+    """Slot values of the names and aliases of entities.
+
+    The values are kept per entity, so the index is updated with the names of
+    a changed entity instead of being rebuilt from all entities.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self._trie = NameTrie()
+        self._entity_values: dict[str, list[tuple[str, TextSlotValue]]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of entities with names in the index."""
+        return len(self._entity_values)
+
+    def async_set(
+        self, entity_id: str, name_tuples: Iterable[tuple[str, str, dict[str, Any]]]
+    ) -> None:
+        """Set the (input name, output name, context) tuples of an entity."""
+        self.async_remove(entity_id)
+        values: list[tuple[str, TextSlotValue]] = []
+        for name_tuple in name_tuples:
+            key = normalize_name(name_tuple[0])
+            value = TextSlotValue.from_tuple(name_tuple, allow_template=False)
+            self._trie.insert(key, value)
+            values.append((key, value))
+        if values:
+            self._entity_values[entity_id] = values
+
+    def async_remove(self, entity_id: str) -> None:
+        """Remove the names of an entity."""
+        for key, value in self._entity_values.pop(entity_id, ()):
+            self._trie.remove(key, value)
+
+    def find(self, text: str) -> TextSlotList:
+        """Return a name slot list with the names contained in the text."""
+        return TextSlotList(
+            name="name",
+            values=[result[2] for result in self._trie.find(normalize_name(text))],
+        )
@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+from bisect import bisect_left, insort
 from collections import Counter, deque
 from copy import copy
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from functools import partial
 import logging
+import math
 from numbers import Number
-import statistics
 from typing import Any, cast
 
 import voluptuous as vol
@@ -50,6 +51,7 @@ from homeassistant.helpers.start import async_at_started
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType, StateType
 from homeassistant.util.decorator import Registry
 import homeassistant.util.dt as dt_util
+from homeassistant.util.hass_dict import HassKey
 
 from . import DOMAIN, PLATFORMS
 
@@ -63,6 +65,8 @@ FILTER_NAME_TIME_THROTTLE = "time_throttle"
 FILTER_NAME_TIME_SMA = "time_simple_moving_average"
 FILTERS: Registry[str, type[Filter]] = Registry()
 
+DATA_HISTORY_LOADER: HassKey[FilterHistoryLoader] = HassKey(f"{DOMAIN}_history_loader")
+
 CONF_FILTERS = "filters"
 CONF_FILTER_NAME = "filter"
 CONF_FILTER_WINDOW_SIZE = "window_size"
@@ -199,6 +203,113 @@ async def async_setup_platform(
     async_add_entities([SensorFilter(name, unique_id, entity_id, filters)])
 
 
+class FilterHistoryLoader:
+    """Load the history of filter sources in batches.
+
+    Requests made in the same event loop iteration, like those of the filter
+    sensors added by a platform setup, are loaded in one recorder job that
+    queries the history of each source entity once for the largest windows
+    requested.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the history loader."""
+        self.hass = hass
+        self._requests: dict[str, tuple[int, timedelta]] = {}
+        self._batch: (
+            asyncio.Future[dict[str, tuple[datetime, list[State], list[State]]]] | None
+        ) = None
+
+    async def async_load(
+        self, entity_id: str, window_items: int, window_time: timedelta
+    ) -> list[State]:
+        """Return the last states of the entity and its states in the window time.
+
+        The states are sorted by the time they were last updated.
+        """
+        items, time = self._requests.get(entity_id, (0, timedelta(0)))
+        self._requests[entity_id] = (max(items, window_items), max(time, window_time))
+        if (batch := self._batch) is None:
+            batch = self._batch = self.hass.loop.create_future()
+            self.hass.loop.call_soon(self._async_load_batch)
+        # Shield the batch so a cancelled request does not cancel the others
+        now, last_states, period_states = (await asyncio.shield(batch))[entity_id]
+
+        # Both queries can return the same state changes
+        states: dict[tuple[float, float, str], State] = {}
+        if window_items > 0:
+            for state in last_states[-window_items:]:
+                states[_state_key(state)] = state
+        if window_time > timedelta(seconds=0):
+            # The states were loaded for the largest window time requested,
+            # keep the state at the start of this window and the changes after
+            start = now - window_time
+            start_index = 0
+            for index, state in enumerate(period_states):
+                if state.last_updated < start:
+                    start_index = index
+            for state in period_states[start_index:]:
+                states.setdefault(_state_key(state), state)
+        return sorted(states.values(), key=lambda s: s.last_updated)
+
+    @callback
+    def _async_load_batch(self) -> None:
+        """Start loading the requested history."""
+        requests, self._requests = self._requests, {}
+        batch, self._batch = cast(asyncio.Future, self._batch), None
+        self.hass.async_create_task(
+            self._async_run_batch(requests, batch), "filter load history"
+        )
+
+    async def _async_run_batch(
+        self,
+        requests: dict[str, tuple[int, timedelta]],
+        batch: asyncio.Future[dict[str, tuple[datetime, list[State], list[State]]]],
+    ) -> None:
+        """Load the requested history in one recorder job."""
+        try:
+            result = await get_instance(self.hass).async_add_executor_job(
+                self._load_history, requests
+            )
+        except Exception as err:  # noqa: BLE001
+            batch.set_exception(err)
+        else:
+            batch.set_result(result)
+
+    def _load_history(
+        self, requests: dict[str, tuple[int, timedelta]]
+    ) -> dict[str, tuple[datetime, list[State], list[State]]]:
+        """Load the last states and the states in the window time of the entities."""
+        now = dt_util.utcnow()
+        result: dict[str, tuple[datetime, list[State], list[State]]] = {}
+        for entity_id, (window_items, window_time) in requests.items():
+            last_states: list[State] = []
+            period_states: list[State] = []
+            if window_items > 0:
+                last_states = history.get_last_state_changes(
+                    self.hass, window_items, entity_id=entity_id
+                ).get(entity_id, [])
+            if window_time > timedelta(seconds=0):
+                period_states = history.state_changes_during_period(
+                    self.hass, now - window_time, entity_id=entity_id
+                ).get(entity_id, [])
+            result[entity_id] = (now, last_states, period_states)
+        return result
+
+
+def _state_key(state: State) -> tuple[float, float, str]:
+    """Return a key identifying a state change of an entity."""
+    return (state.last_updated_timestamp, state.last_changed_timestamp, state.state)
+
+
+@callback
+def async_get_history_loader(hass: HomeAssistant) -> FilterHistoryLoader:
+    """Return the filter history loader."""
+    if (loader := hass.data.get(DATA_HISTORY_LOADER)) is None:
+        loader = hass.data[DATA_HISTORY_LOADER] = FilterHistoryLoader(hass)
+    return loader
+
+
 class SensorFilter(SensorEntity):
     """Representation of a Filter Sensor."""
 
@@ -299,12 +410,10 @@ class SensorFilter(SensorEntity):
 
     async def async_added_to_hass(self) -> None:
         """Register callbacks."""
+        largest_window_items = 0
+        largest_window_time = timedelta(0)
 
         if "recorder" in self.hass.config.components:
-            history_list = []
-            largest_window_items = 0
-            largest_window_time = timedelta(0)
-
             # Determine the largest window_size by type
             for filt in self._filters:
                 if (
@@ -318,48 +427,50 @@ class SensorFilter(SensorEntity):
                 ):
                     largest_window_time = val
 
-            # Retrieve the largest window_size of each type
-            if largest_window_items > 0:
-                filter_history = await get_instance(self.hass).async_add_executor_job(
-                    partial(
-                        history.get_last_state_changes,
-                        self.hass,
-                        largest_window_items,
-                        entity_id=self._entity,
-                    )
-                )
-                if self._entity in filter_history:
-                    history_list.extend(filter_history[self._entity])
-            if largest_window_time > timedelta(seconds=0):
-                start = dt_util.utcnow() - largest_window_time
-                filter_history = await get_instance(self.hass).async_add_executor_job(
-                    partial(
-                        history.state_changes_during_period,
-                        self.hass,
-                        start,
-                        entity_id=self._entity,
-                    )
-                )
-                if self._entity in filter_history:
-                    history_list.extend(
-                        [
-                            state
-                            for state in filter_history[self._entity]
-                            if state not in history_list
-                        ]
-                    )
-
-            # Sort the window states
-            history_list = sorted(history_list, key=lambda s: s.last_updated)
-            _LOGGER.debug(
-                "Loading from history: %s",
-                [(s.state, s.last_updated) for s in history_list],
+        if largest_window_items > 0 or largest_window_time > timedelta(seconds=0):
+            # Load the history in the background, so the history of all filter
+            # sensors being added is loaded in one batch
+            task = self.hass.async_create_task(
+                self._async_load_history(largest_window_items, largest_window_time),
+                f"filter {self.entity_id} load history",
+            )
+
+            @callback
+            def _async_cancel_load_history() -> None:
+                task.cancel()
+
+            self.async_on_remove(_async_cancel_load_history)
+        else:
+            self._async_track_source()
+
+    async def _async_load_history(
+        self, window_items: int, window_time: timedelta
+    ) -> None:
+        """Replay the history through the filter chain and track the source."""
+        try:
+            history_list = await async_get_history_loader(self.hass).async_load(
+                self._entity, window_items, window_time
             )
+        except Exception:
+            # Filter the new states of the source even without its history
+            _LOGGER.exception("Error loading the history of %s", self._entity)
+            history_list = []
+        _LOGGER.debug(
+            "Loading from history: %s",
+            [(s.state, s.last_updated) for s in history_list],
+        )
 
-            # Replay history through the filter chain
-            for state in history_list:
-                if state.state not in [STATE_UNKNOWN, STATE_UNAVAILABLE, None]:
-                    self._update_filter_sensor_state(state, False)
+        # Replay history through the filter chain
+        for state in history_list:
+            if state.state not in [STATE_UNKNOWN, STATE_UNAVAILABLE, None]:
+                self._update_filter_sensor_state(state, False)
+        if history_list:
+            self.async_write_ha_state()
+        self._async_track_source()
+
+    @callback
+    def _async_track_source(self) -> None:
+        """Start tracking the source entity once Home Assistant has started."""
 
         @callback
         def _async_hass_started(hass: HomeAssistant) -> None:
@@ -575,19 +686,41 @@ class OutlierFilter(Filter, SensorEntity):
         self._radius = radius
         self._stats_internal: Counter = Counter()
         self._store_raw = True
+        # The finite values of the states in the window in sorted order
+        self._sorted_values: list[float] = []
+
+    def reset(self) -> None:
+        """Reset filter."""
+        super().reset()
+        self._sorted_values.clear()
 
     def _filter_state(self, new_state: FilterState) -> FilterState:
         """Implement the outlier filter."""
 
         # We can cast safely here thanks to self._only_numbers = True
-        previous_state_values = [cast(float, s.state) for s in self.states]
         new_state_value = cast(float, new_state.state)
+        values = self._sorted_values
+        window_full = len(self.states) == self.states.maxlen
 
-        median = statistics.median(previous_state_values) if self.states else 0
-        if (
-            len(self.states) == self.states.maxlen
-            and abs(new_state_value - median) > self._radius
-        ):
+        if not values:
+            median = 0.0
+        elif (size := len(values)) % 2:
+            median = values[size // 2]
+        else:
+            median = (values[size // 2 - 1] + values[size // 2]) / 2
+
+        # The raw state is added to the window after filtering, keep the
+        # sorted values in sync with it. Values which are not finite cannot be
+        # ordered and are left out.
+        if self.states.maxlen:
+            if window_full and math.isfinite(
+                oldest_value := cast(float, self.states[0].state)
+            ):
+                del values[bisect_left(values, oldest_value)]
+            if math.isfinite(new_state_value):
+                insort(values, new_state_value)
+
+        if window_full and abs(new_state_value - median) > self._radius:
             self._stats_internal["erasures"] += 1
 
             _LOGGER.debug(
@@ -657,14 +790,24 @@ class TimeSMAFilter(Filter, SensorEntity):
             FILTER_NAME_TIME_SMA, window_size, precision=precision, entity=entity
         )
         self._time_window = window_size
+        self._time_window_seconds = window_size.total_seconds()
         self.last_leak: FilterState | None = None
         self.queue = deque[FilterState]()
+        # Time weighted sum of the values between the first and last queued state
+        self._queue_sum = 0.0
 
     def _leak(self, left_boundary: datetime) -> None:
         """Remove timeouted elements."""
         while self.queue:
             if self.queue[0].timestamp + self._time_window <= left_boundary:
                 self.last_leak = self.queue.popleft()
+                if len(self.queue) > 1:
+                    # We can cast safely here thanks to self._only_numbers = True
+                    self._queue_sum -= (
+                        self.queue[0].timestamp - self.last_leak.timestamp
+                    ).total_seconds() * cast(float, self.last_leak.state)
+                else:
+                    self._queue_sum = 0.0
             else:
                 return
 
@@ -672,19 +815,22 @@ class TimeSMAFilter(Filter, SensorEntity):
         """Implement the Simple Moving Average filter."""
 
         self._leak(new_state.timestamp)
+        if self.queue:
+            last_state = self.queue[-1]
+            self._queue_sum += (
+                new_state.timestamp - last_state.timestamp
+            ).total_seconds() * cast(float, last_state.state)
         self.queue.append(copy(new_state))
 
-        moving_sum: float = 0
+        # The value before the first queued state is the last leaked one
+        first_state = self.queue[0]
+        prev_state = self.last_leak if self.last_leak is not None else first_state
         start = new_state.timestamp - self._time_window
-        prev_state = self.last_leak if self.last_leak is not None else self.queue[0]
-        for state in self.queue:
-            # We can cast safely here thanks to self._only_numbers = True
-            prev_state_value = cast(float, prev_state.state)
-            moving_sum += (state.timestamp - start).total_seconds() * prev_state_value
-            start = state.timestamp
-            prev_state = state
-
-        new_state.state = moving_sum / self._time_window.total_seconds()
+        moving_sum = (first_state.timestamp - start).total_seconds() * cast(
+            float, prev_state.state
+        ) + self._queue_sum
+
+        new_state.state = moving_sum / self._time_window_seconds
 
         return new_state
 
@@ -410,8 +410,14 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         ("frontend_latest", not is_dev),
         ("frontend_es5", not is_dev),
     ):
+        # The files of the installed frontend only change with an update
         static_paths_configs.append(
-            StaticPathConfig(f"/{path}", str(root_path / path), should_cache)
+            StaticPathConfig(
+                f"/{path}",
+                str(root_path / path),
+                should_cache,
+                immutable=should_cache,
+            )
         )
 
     static_paths_configs.append(
@@ -24,12 +24,13 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant, State, callback
 from homeassistant.helpers import config_validation as cv, entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
 from .entity import GroupEntity
+from .util import MemberStateCounter, count_mode
 
 DEFAULT_NAME = "Binary Sensor Group"
 
@@ -125,28 +126,38 @@ class BinarySensorGroup(GroupEntity, BinarySensorEntity):
         self.mode = any
         if mode:
             self.mode = all
+        self._member_states = MemberStateCounter()
+
+    @callback
+    def async_update_member_state(
+        self,
+        entity_id: str,
+        new_state: State | None,
+    ) -> None:
+        """Update the member state counts."""
+        self._member_states.set(entity_id, new_state)
 
     @callback
     def async_update_group_state(self) -> None:
-        """Query all members and determine the binary sensor group state."""
-        states = [
-            state.state
-            for entity_id in self._entity_ids
-            if (state := self.hass.states.get(entity_id)) is not None
-        ]
+        """Determine the binary sensor group state from the member state counts."""
+        member_states = self._member_states
+        total = len(member_states)
+        unavailable = member_states.count(STATE_UNAVAILABLE)
 
         # Set group as unavailable if all members are unavailable or missing
-        self._attr_available = any(state != STATE_UNAVAILABLE for state in states)
+        self._attr_available = total > unavailable
 
-        valid_state = self.mode(
-            state not in (STATE_UNKNOWN, STATE_UNAVAILABLE) for state in states
+        valid_state = count_mode(
+            self.mode, total - unavailable - member_states.count(STATE_UNKNOWN), total
         )
         if not valid_state:
             # Set as unknown if any / all member is not unknown or unavailable
             self._attr_is_on = None
         else:
             # Set as ON if any / all member is ON
-            self._attr_is_on = self.mode(state == STATE_ON for state in states)
+            self._attr_is_on = count_mode(
+                self.mode, member_states.count(STATE_ON), total
+            )
 
     @property
     def device_class(self) -> BinarySensorDeviceClass | None:
@@ -24,6 +24,7 @@ from homeassistant.helpers.event import async_track_state_change_event
 
 from .const import ATTR_AUTO, ATTR_ORDER, DATA_COMPONENT, DOMAIN, GROUP_ORDER, REG_KEY
 from .registry import GroupIntegrationRegistry, SingleStateType
+from .util import count_mode
 
 ENTITY_ID_FORMAT = DOMAIN + ".{}"
 
@@ -50,6 +51,7 @@ class GroupEntity(Entity):
         for entity_id in self._entity_ids:
             if (state := self.hass.states.get(entity_id)) is None:
                 continue
+            self.async_update_member_state(entity_id, state)
             self.async_update_supported_features(entity_id, state)
 
         @callback
@@ -57,6 +59,10 @@ class GroupEntity(Entity):
             event: Event[EventStateChangedData] | None,
         ) -> None:
             """Handle child updates."""
+            if event:
+                self.async_update_member_state(
+                    event.data["entity_id"], event.data["new_state"]
+                )
             self.async_update_group_state()
             if event:
                 self.async_update_supported_features(
@@ -75,6 +81,7 @@ class GroupEntity(Entity):
         for entity_id in self._entity_ids:
             if (state := self.hass.states.get(entity_id)) is None:
                 continue
+            self.async_update_member_state(entity_id, state)
             self.async_update_supported_features(entity_id, state)
 
         @callback
@@ -83,9 +90,10 @@ class GroupEntity(Entity):
         ) -> None:
             """Handle child updates."""
             self.async_set_context(event.context)
-            self.async_update_supported_features(
-                event.data["entity_id"], event.data["new_state"]
-            )
+            entity_id = event.data["entity_id"]
+            new_state = event.data["new_state"]
+            self.async_update_member_state(entity_id, new_state)
+            self.async_update_supported_features(entity_id, new_state)
             self.async_defer_or_update_ha_state()
 
         self.async_on_remove(
@@ -115,6 +123,18 @@ class GroupEntity(Entity):
     def async_update_group_state(self) -> None:
         """Abstract method to update the entity."""
 
+    @callback
+    def async_update_member_state(
+        self,
+        entity_id: str,
+        new_state: State | None,
+    ) -> None:
+        """Update the aggregated state with the new state of a member.
+
+        Called for each member state change before the group state is updated,
+        allowing the group to keep its aggregates up to date incrementally.
+        """
+
     @callback
     def async_update_supported_features(
         self,
@@ -157,6 +177,9 @@ class Group(Entity):
         self._entity_ids = entity_ids
         self._on_off: dict[str, bool] = {}
         self._assumed: dict[str, bool] = {}
+        # Running counts of the members that are on or have an assumed state
+        self._on_count = 0
+        self._assumed_count = 0
         self._on_states: set[str] = set()
         self.created_by_service = created_by_service
         self.mode = any
@@ -397,6 +420,8 @@ class Group(Entity):
         """Reset tracked state."""
         self._on_off = {}
         self._assumed = {}
+        self._on_count = 0
+        self._assumed_count = 0
         self._on_states = set()
 
         for entity_id in self.trackable:
@@ -409,7 +434,9 @@ class Group(Entity):
         domain = new_state.domain
         state = new_state.state
         registry = self._registry
-        self._assumed[entity_id] = bool(new_state.attributes.get(ATTR_ASSUMED_STATE))
+        assumed = bool(new_state.attributes.get(ATTR_ASSUMED_STATE))
+        self._assumed_count += assumed - self._assumed.get(entity_id, False)
+        self._assumed[entity_id] = assumed
 
         if domain not in registry.on_states_by_domain:
             # Handle the group of a group case
@@ -417,12 +444,14 @@ class Group(Entity):
                 self._on_states.add(state)
             elif state in registry.off_on_mapping:
                 self._on_states.add(registry.off_on_mapping[state])
-            self._on_off[entity_id] = state in registry.on_off_mapping
+            is_on = state in registry.on_off_mapping
         else:
             entity_on_state = registry.on_states_by_domain[domain]
             if domain in registry.on_states_by_domain:
                 self._on_states.update(entity_on_state)
-            self._on_off[entity_id] = state in entity_on_state
+            is_on = state in entity_on_state
+        self._on_count += is_on - self._on_off.get(entity_id, False)
+        self._on_off[entity_id] = is_on
 
     @callback
     def _async_update_group_state(self, tr_state: State | None = None) -> None:
@@ -445,7 +474,9 @@ class Group(Entity):
             or self._assumed_state
             and not tr_state.attributes.get(ATTR_ASSUMED_STATE)
         ):
-            self._assumed_state = self.mode(self._assumed.values())
+            self._assumed_state = count_mode(
+                self.mode, self._assumed_count, len(self._assumed)
+            )
 
         elif tr_state.attributes.get(ATTR_ASSUMED_STATE):
             self._assumed_state = True
@@ -467,7 +498,7 @@ class Group(Entity):
         # on state, we use STATE_ON/STATE_OFF
         else:
             on_state = STATE_ON
-        group_is_on = self.mode(self._on_off.values())
+        group_is_on = count_mode(self.mode, self._on_count, len(self._on_off))
         if group_is_on:
             self._state = on_state
         elif self.single_state_type_key:
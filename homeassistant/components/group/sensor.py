@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from collections.abc import Callable
 from datetime import datetime
+from fractions import Fraction
+from functools import partial
 import logging
+import math
 import statistics
 from typing import TYPE_CHECKING, Any
 
@@ -50,10 +54,11 @@ from homeassistant.helpers.issue_registry import (
     async_create_issue,
     async_delete_issue,
 )
-from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType, StateType
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
 from .const import CONF_IGNORE_NON_NUMERIC, DOMAIN as GROUP_DOMAIN
 from .entity import GroupEntity
+from .util import count_mode
 
 DEFAULT_NAME = "Sensor Group"
 
@@ -313,6 +318,146 @@ CALC_TYPES: dict[
 }
 
 
+_RANKS: dict[str, Callable[[int, float, State], tuple[Any, int]]] = {
+    "min": lambda order, value, state: (-value, -order),
+    "max": lambda order, value, state: (value, -order),
+    "last": lambda order, value, state: (state.last_updated, -order),
+}
+# The ranks tracked for each sensor type, types without ranks or a running
+# sum are calculated from all member values
+_TYPE_RANKS: dict[str, tuple[str, ...]] = {
+    "min": ("min",),
+    "max": ("max",),
+    "range": ("min", "max"),
+    "last": ("last",),
+}
+_LEADER_ATTRIBUTES = {
+    "min": ATTR_MIN_ENTITY_ID,
+    "max": ATTR_MAX_ENTITY_ID,
+    "last": ATTR_LAST_ENTITY_ID,
+}
+_RUNNING_SUM_TYPES = {"mean", "sum"}
+
+
+class SensorGroupValues:
+    """Numeric values of the members of a sensor group.
+
+    The values are updated one member at a time. An exact running sum and the
+    members ranking highest for min, max and last are kept up to date with
+    each change, so these sensor types are calculated without iterating all
+    member values. A ranking member that drops out is searched for again the
+    next time the value is calculated.
+    """
+
+    def __init__(self, entity_ids: list[str], sensor_type: str) -> None:
+        """Initialize the values."""
+        self._entity_ids = entity_ids
+        self._sensor_type = sensor_type
+        self._state_calc = CALC_TYPES[sensor_type]
+        # Ties are won by the member listed first
+        self._order: dict[str, int] = {}
+        for idx, entity_id in enumerate(entity_ids):
+            self._order.setdefault(entity_id, idx)
+        # Members listed more than once are counted once per listing
+        self._weights = Counter(entity_ids)
+        self._running_sum = sensor_type in _RUNNING_SUM_TYPES
+        self._ranks = {kind: _RANKS[kind] for kind in _TYPE_RANKS.get(sensor_type, ())}
+        self._values: dict[str, tuple[float, State]] = {}
+        self._total = Fraction(0)
+        self._count = 0
+        self._leaders: dict[str, str | None] = dict.fromkeys(self._ranks)
+        self._stale: set[str] = set()
+
+    def __len__(self) -> int:
+        """Return the number of members with a numeric value."""
+        return len(self._values)
+
+    def clear(self) -> None:
+        """Remove all values."""
+        self._values.clear()
+        self._total = Fraction(0)
+        self._count = 0
+        self._leaders = dict.fromkeys(self._ranks)
+        self._stale.clear()
+
+    def _rank(self, kind: str, entity_id: str) -> tuple[Any, int]:
+        """Return the rank of a member."""
+        return self._ranks[kind](self._order[entity_id], *self._values[entity_id])
+
+    def set(self, entity_id: str, value: float, state: State) -> None:
+        """Set the value of a member."""
+        old = self._values.get(entity_id)
+        if self._running_sum:
+            weight = self._weights[entity_id]
+            self._total += Fraction(value) * weight
+            if old is None:
+                self._count += weight
+            else:
+                self._total -= Fraction(old[0]) * weight
+        order = self._order[entity_id]
+        for kind, rank in self._ranks.items():
+            if kind in self._stale:
+                continue
+            leader = self._leaders[kind]
+            if leader is None:
+                self._leaders[kind] = entity_id
+            elif leader == entity_id:
+                if old is not None and rank(order, value, state) < rank(order, *old):
+                    self._stale.add(kind)
+            elif rank(order, value, state) > self._rank(kind, leader):
+                self._leaders[kind] = entity_id
+        self._values[entity_id] = (value, state)
+
+    def remove(self, entity_id: str) -> None:
+        """Remove the value of a member."""
+        if (old := self._values.pop(entity_id, None)) is None:
+            return
+        if self._running_sum:
+            weight = self._weights[entity_id]
+            self._total -= Fraction(old[0]) * weight
+            self._count -= weight
+        for kind, leader in self._leaders.items():
+            if leader == entity_id:
+                self._stale.add(kind)
+
+    def _leader(self, kind: str) -> str | None:
+        """Return the member ranking highest."""
+        if kind in self._stale:
+            self._stale.discard(kind)
+            self._leaders[kind] = max(
+                self._values, key=partial(self._rank, kind), default=None
+            )
+        return self._leaders[kind]
+
+    def calculate(self) -> tuple[dict[str, str | None], float | None]:
+        """Calculate the group value and extra attributes from the member values."""
+        sensor_type = self._sensor_type
+        if not self._values:
+            return self._state_calc([])
+        if sensor_type == "sum":
+            return {}, float(self._total)
+        if sensor_type == "mean":
+            return {}, float(self._total / self._count)
+        if sensor_type == "range":
+            max_id = self._leader("max")
+            min_id = self._leader("min")
+            if TYPE_CHECKING:
+                assert max_id is not None and min_id is not None
+            return {}, self._values[max_id][0] - self._values[min_id][0]
+        if (attribute := _LEADER_ATTRIBUTES.get(sensor_type)) is not None:
+            leader = self._leader(sensor_type)
+            if TYPE_CHECKING:
+                assert leader is not None
+            return {attribute: leader}, self._values[leader][0]
+        return self._state_calc(
+            [
+                (entity_id, *value)
+                for entity_id in self._entity_ids
+                if (value := self._values.get(entity_id)) is not None
+            ]
+        )
+
+
 class SensorGroup(GroupEntity, SensorEntity):
     """Representation of a sensor group."""
 
@@ -347,10 +492,15 @@ class SensorGroup(GroupEntity, SensorEntity):
         self._attr_unique_id = unique_id
         self._ignore_non_numeric = ignore_non_numeric
         self.mode = all if ignore_non_numeric is False else any
-        self._state_calc: Callable[
-            [list[tuple[str, float, State]]],
-            tuple[dict[str, str | None], float | None],
-        ] = CALC_TYPES[self._sensor_type]
+        self._values = SensorGroupValues(entity_ids, sensor_type)
+        # Members with a state and members with an unknown or unavailable state
+        self._present: set[str] = set()
+        self._unknown: set[str] = set()
+        # The state attributes of each member the calculated attributes of the
+        # group depend on, all members are updated when one of them changes
+        self._member_attributes: dict[str, tuple[Any, ...] | None] = {}
+        # Members changed since the last update, None to update all members
+        self._changed: set[str] | None = None
         self._state_incorrect: set[str] = set()
         self._extra_state_attribute: dict[str, Any] = {}
 
@@ -368,88 +518,140 @@ class SensorGroup(GroupEntity, SensorEntity):
         self._valid_units = self._get_valid_units()
 
     @callback
-    def async_update_group_state(self) -> None:
-        """Query all members and determine the sensor group state."""
-        self.calculate_state_attributes(self._get_valid_entities())
-        states: list[StateType] = []
-        valid_units = self._valid_units
-        valid_states: list[bool] = []
-        sensor_values: list[tuple[str, float, State]] = []
-        for entity_id in self._entity_ids:
-            if (state := self.hass.states.get(entity_id)) is not None:
-                states.append(state.state)
-                try:
-                    numeric_state = float(state.state)
-                    uom = state.attributes.get("unit_of_measurement")
-
-                    # Convert the state to the native unit of measurement when we have valid units
-                    # and a correct device class
-                    if valid_units and uom in valid_units and self._can_convert is True:
-                        numeric_state = UNIT_CONVERTERS[self.device_class].convert(
-                            numeric_state, uom, self.native_unit_of_measurement
-                        )
-
-                    # If we have valid units and the entity's unit does not match
-                    # we raise which skips the state and log a warning once
-                    if valid_units and uom not in valid_units:
-                        raise HomeAssistantError("Not a valid unit")  # noqa: TRY301
-
-                    sensor_values.append((entity_id, numeric_state, state))
-                    if entity_id in self._state_incorrect:
-                        self._state_incorrect.remove(entity_id)
-                    valid_states.append(True)
-                except ValueError:
-                    valid_states.append(False)
-                    # Log invalid states unless ignoring non numeric values
-                    if (
-                        not self._ignore_non_numeric
-                        and entity_id not in self._state_incorrect
-                    ):
-                        self._state_incorrect.add(entity_id)
-                        _LOGGER.warning(
-                            "Unable to use state. Only numerical states are supported,"
-                            " entity %s with value %s excluded from calculation in %s",
-                            entity_id,
-                            state.state,
-                            self.entity_id,
-                        )
-                    continue
-                except (KeyError, HomeAssistantError):
-                    # This exception handling can be simplified
-                    # once sensor entity doesn't allow incorrect unit of measurement
-                    # with a device class, implementation see PR #107639
-                    valid_states.append(False)
-                    if entity_id not in self._state_incorrect:
-                        self._state_incorrect.add(entity_id)
-                        _LOGGER.warning(
-                            "Unable to use state. Only entities with correct unit of measurement"
-                            " is supported,"
-                            " entity %s, value %s with device class %s"
-                            " and unit of measurement %s excluded from calculation in %s",
-                            entity_id,
-                            state.state,
-                            self.device_class,
-                            state.attributes.get("unit_of_measurement"),
-                            self.entity_id,
-                        )
+    def async_update_member_state(
+        self,
+        entity_id: str,
+        new_state: State | None,
+    ) -> None:
+        """Record the changed member."""
+        if self._changed is not None:
+            self._changed.add(entity_id)
 
+    @callback
+    def async_update_group_state(self) -> None:
+        """Determine the sensor group state from the changed members."""
+        changed = self._changed
+        self._changed = set()
+        if changed is None or any(
+            self._member_attributes.get(entity_id)
+            != self._get_member_attributes(entity_id)
+            for entity_id in changed
+        ):
+            # The calculated attributes, and with them the valid units, may
+            # change, so all member values are updated
+            self.calculate_state_attributes(self._get_valid_entities())
+            self._values.clear()
+            self._member_attributes = {
+                entity_id: self._get_member_attributes(entity_id)
+                for entity_id in self._entity_ids
+            }
+            changed = set(self._entity_ids)
+
+        for entity_id in changed:
+            self._async_update_member_value(entity_id)
+
+        num_present = len(self._present)
+        num_numeric = len(self._values)
         # Set group as unavailable if all members do not have numeric values
-        self._attr_available = any(numeric_state for numeric_state in valid_states)
+        self._attr_available = num_numeric > 0
 
-        valid_state = self.mode(
-            state not in (STATE_UNKNOWN, STATE_UNAVAILABLE) for state in states
+        valid_state = count_mode(
+            self.mode, num_present - len(self._unknown), num_present
         )
-        valid_state_numeric = self.mode(numeric_state for numeric_state in valid_states)
+        valid_state_numeric = count_mode(self.mode, num_numeric, num_present)
 
         if not valid_state or not valid_state_numeric:
             self._attr_native_value = None
             return
 
         # Calculate values
-        self._extra_state_attribute, self._attr_native_value = self._state_calc(
-            sensor_values
+        self._extra_state_attribute, self._attr_native_value = self._values.calculate()
+
+    def _get_member_attributes(self, entity_id: str) -> tuple[Any, ...] | None:
+        """Return the member state attributes the group attributes depend on."""
+        if (state := self.hass.states.get(entity_id)) is None:
+            return None
+        try:
+            float(state.state)
+        except ValueError:
+            numeric = False
+        else:
+            numeric = True
+        attributes = state.attributes
+        return (
+            numeric,
+            attributes.get("state_class"),
+            attributes.get("device_class"),
+            attributes.get("unit_of_measurement"),
         )
 
+    def _async_update_member_value(self, entity_id: str) -> None:
+        """Update the numeric value of a member."""
+        if (state := self.hass.states.get(entity_id)) is None:
+            self._present.discard(entity_id)
+            self._unknown.discard(entity_id)
+            self._values.remove(entity_id)
+            return
+
+        self._present.add(entity_id)
+        if state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+            self._unknown.add(entity_id)
+        else:
+            self._unknown.discard(entity_id)
+        valid_units = self._valid_units
+        try:
+            numeric_state = float(state.state)
+            # The exact running sum cannot hold values which are not finite
+            if not math.isfinite(numeric_state):
+                raise ValueError("Not a finite number")  # noqa: TRY301
+            uom = state.attributes.get("unit_of_measurement")
+
+            # Convert the state to the native unit of measurement when we have valid units
+            # and a correct device class
+            if valid_units and uom in valid_units and self._can_convert is True:
+                numeric_state = UNIT_CONVERTERS[self.device_class].convert(
+                    numeric_state, uom, self.native_unit_of_measurement
+                )
+
+            # If we have valid units and the entity's unit does not match
+            # we raise which skips the state and log a warning once
+            if valid_units and uom not in valid_units:
+                raise HomeAssistantError("Not a valid unit")  # noqa: TRY301
+
+            self._values.set(entity_id, numeric_state, state)
+            if entity_id in self._state_incorrect:
+                self._state_incorrect.remove(entity_id)
+        except ValueError:
+            self._values.remove(entity_id)
+            # Log invalid states unless ignoring non numeric values
+            if not self._ignore_non_numeric and entity_id not in self._state_incorrect:
+                self._state_incorrect.add(entity_id)
+                _LOGGER.warning(
+                    "Unable to use state. Only numerical states are supported,"
+                    " entity %s with value %s excluded from calculation in %s",
+                    entity_id,
+                    state.state,
+                    self.entity_id,
+                )
+        except (KeyError, HomeAssistantError):
+            # This exception handling can be simplified
+            # once sensor entity doesn't allow incorrect unit of measurement
+            # with a device class, implementation see PR #107639
+            self._values.remove(entity_id)
+            if entity_id not in self._state_incorrect:
+                self._state_incorrect.add(entity_id)
+                _LOGGER.warning(
+                    "Unable to use state. Only entities with correct unit of measurement"
+                    " is supported,"
+                    " entity %s, value %s with device class %s"
+                    " and unit of measurement %s excluded from calculation in %s",
+                    entity_id,
+                    state.state,
+                    self.device_class,
+                    state.attributes.get("unit_of_measurement"),
+                    self.entity_id,
+                )
+
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes of the sensor."""
@@ -24,12 +24,13 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant, State, callback
 from homeassistant.helpers import config_validation as cv, entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
 from .entity import GroupEntity
+from .util import MemberStateCounter, count_mode
 
 DEFAULT_NAME = "Switch Group"
 CONF_ALL = "all"
@@ -125,6 +126,7 @@ class SwitchGroup(GroupEntity, SwitchEntity):
         self.mode = any
         if mode:
             self.mode = all
+        self._member_states = MemberStateCounter()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Forward the turn_on command to all switches in the group."""
@@ -150,17 +152,24 @@ class SwitchGroup(GroupEntity, SwitchEntity):
             context=self._context,
         )
 
+    @callback
+    def async_update_member_state(
+        self,
+        entity_id: str,
+        new_state: State | None,
+    ) -> None:
+        """Update the member state counts."""
+        self._member_states.set(entity_id, new_state)
+
     @callback
     def async_update_group_state(self) -> None:
-        """Query all members and determine the switch group state."""
-        states = [
-            state.state
-            for entity_id in self._entity_ids
-            if (state := self.hass.states.get(entity_id)) is not None
-        ]
+        """Determine the switch group state from the member state counts."""
+        member_states = self._member_states
+        total = len(member_states)
+        unavailable = member_states.count(STATE_UNAVAILABLE)
 
-        valid_state = self.mode(
-            state not in (STATE_UNKNOWN, STATE_UNAVAILABLE) for state in states
+        valid_state = count_mode(
+            self.mode, total - unavailable - member_states.count(STATE_UNKNOWN), total
         )
 
         if not valid_state:
@@ -168,7 +177,9 @@ class SwitchGroup(GroupEntity, SwitchEntity):
             self._attr_is_on = None
         else:
             # Set as ON if any / all member is ON
-            self._attr_is_on = self.mode(state == STATE_ON for state in states)
+            self._attr_is_on = count_mode(
+                self.mode, member_states.count(STATE_ON), total
+            )
 
         # Set group as unavailable if all members are unavailable or missing
-        self._attr_available = any(state != STATE_UNAVAILABLE for state in states)
+        self._attr_available = total > unavailable
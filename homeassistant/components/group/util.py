@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterator
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
 from itertools import groupby
 from typing import Any
 
@@ -83,3 +84,43 @@ def reduce_attribute(
         return attrs[0]
 
     return reduce(*attrs)
+
+
+def count_mode(mode: Callable[[Iterable[Any]], bool], count: int, total: int) -> bool:
+    """Return the any / all mode applied to count matching members out of total."""
+    if mode is all:
+        return count == total
+    return count > 0
+
+
+class MemberStateCounter:
+    """Keep running counts of the states of the members of a group.
+
+    The counts are updated with the state of the changed member only, so the
+    group state can be determined without iterating all member states.
+    """
+
+    __slots__ = ("_counts", "_states")
+
+    def __init__(self) -> None:
+        """Initialize the counter."""
+        self._states: dict[str, str] = {}
+        self._counts: Counter[str] = Counter()
+
+    def __len__(self) -> int:
+        """Return the number of members with a state."""
+        return len(self._states)
+
+    def set(self, entity_id: str, new_state: State | None) -> None:
+        """Update the counts with the new state of a member."""
+        counts = self._counts
+        if (old := self._states.pop(entity_id, None)) is not None:
+            counts[old] -= 1
+        if new_state is not None:
+            self._states[entity_id] = new_state.state
+            counts[new_state.state] += 1
+
+    def count(self, *states: str) -> int:
+        """Return the number of members in one of the states."""
+        counts = self._counts
+        return sum(counts[state] for state in states)
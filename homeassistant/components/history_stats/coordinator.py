@@ -42,6 +42,7 @@ class HistoryStatsUpdateCoordinator(DataUpdateCoordinator[HistoryStatsState]):
         self._subscriber_count = 0
         self._at_start_listener: CALLBACK_TYPE | None = None
         self._track_events_listener: CALLBACK_TYPE | None = None
+        self._stop_tracking: CALLBACK_TYPE | None = None
         super().__init__(
             hass,
             _LOGGER,
@@ -73,6 +74,9 @@ class HistoryStatsUpdateCoordinator(DataUpdateCoordinator[HistoryStatsState]):
         if self._track_events_listener:
             self._track_events_listener()
             self._track_events_listener = None
+        if self._stop_tracking:
+            self._stop_tracking()
+            self._stop_tracking = None
         if self._at_start_listener:
             self._at_start_listener()
             self._at_start_listener = None
@@ -88,6 +92,9 @@ class HistoryStatsUpdateCoordinator(DataUpdateCoordinator[HistoryStatsState]):
     def _async_add_events_listener(self, *_: Any) -> None:
         """Handle hass starting and start tracking events."""
         self._at_start_listener = None
+        # Start tracking the shared history first, so it has the state
+        # change when the stats are updated from the event
+        self._stop_tracking = self._history_stats.async_start_tracking()
         self._track_events_listener = async_track_state_change_event(
             self.hass, [self._history_stats.entity_id], self._async_update_from_event
         )
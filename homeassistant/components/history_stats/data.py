@@ -2,22 +2,38 @@
 
 from __future__ import annotations
 
+import asyncio
+from bisect import bisect_right
 from dataclasses import dataclass
 import datetime
 import logging
 import math
 
 from homeassistant.components.recorder import get_instance, history
-from homeassistant.core import Event, EventStateChangedData, HomeAssistant, State
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.template import Template
 import homeassistant.util.dt as dt_util
+from homeassistant.util.hass_dict import HassKey
 
+from .const import DOMAIN
 from .helpers import async_calculate_period, floored_timestamp
 
 MIN_TIME_UTC = datetime.datetime.min.replace(tzinfo=dt_util.UTC)
 
 _LOGGER = logging.getLogger(__name__)
 
+DATA_SOURCE_HISTORY: HassKey[dict[str, SourceHistory]] = HassKey(
+    f"{DOMAIN}_source_history"
+)
+
 
 @dataclass
 class HistoryStatsState:
@@ -28,12 +44,135 @@ class HistoryStatsState:
     period: tuple[datetime.datetime, datetime.datetime]
 
 
-@dataclass
-class HistoryState:
-    """A minimal state to avoid holding on to State objects."""
+class SourceHistory:
+    """State changes of a source entity, shared by its history stats.
+
+    While tracked, the history is extended from state changed events and
+    trimmed when the windows of the history stats move forward, so it only
+    needs to be loaded from the database when a window starts before the
+    history that is kept.
+    """
+
+    def __init__(self, hass: HomeAssistant, entity_id: str) -> None:
+        """Init the source history."""
+        self.hass = hass
+        self.entity_id = entity_id
+        # Timestamps of the state changes and the states they changed to.
+        # The first state is the state at the start of the history.
+        self.timestamps: list[float] = []
+        self.states: list[str] = []
+        # Timestamp the history is complete from, None if not loaded
+        self.start: float | None = None
+        self._window_starts: dict[HistoryStats, float | None] = {}
+        self._unsub_state_changes: CALLBACK_TYPE | None = None
+        self._pending: list[State] | None = None
+        self._load_lock = asyncio.Lock()
+
+    @callback
+    def async_track(self, history_stats: HistoryStats) -> CALLBACK_TYPE:
+        """Keep the history up to date for the history stats."""
+        if self._unsub_state_changes is None:
+            # History loaded before tracking may have missed state changes
+            self._async_clear()
+            self._unsub_state_changes = async_track_state_change_event(
+                self.hass, self.entity_id, self._async_state_changed
+            )
+        self._window_starts[history_stats] = None
+
+        @callback
+        def _async_untrack() -> None:
+            del self._window_starts[history_stats]
+            if not self._window_starts and self._unsub_state_changes:
+                self._unsub_state_changes()
+                self._unsub_state_changes = None
+                self._async_clear()
+                self.hass.data[DATA_SOURCE_HISTORY].pop(self.entity_id, None)
+
+        return _async_untrack
+
+    async def async_ensure_loaded(self, start_timestamp: float) -> None:
+        """Load the history from the database if it does not cover the start."""
+        async with self._load_lock:
+            if self.start is None or start_timestamp < self.start:
+                await self.async_load(start_timestamp)
+
+    async def async_load(self, start_timestamp: float) -> None:
+        """Load the history from the start timestamp from the database."""
+        self._pending = []
+        try:
+            states = await get_instance(self.hass).async_add_executor_job(
+                self._state_changes_since, start_timestamp
+            )
+        finally:
+            pending, self._pending = self._pending, None
+        self.timestamps = [state.last_changed_timestamp for state in states]
+        self.states = [state.state for state in states]
+        self.start = start_timestamp
+        # Add the state changes that happened while loading
+        for state in pending:
+            self._async_add_state(state)
+
+    def _state_changes_since(self, start_ts: float) -> list[State]:
+        """Return state changes since the start timestamp."""
+        return history.state_changes_during_period(
+            self.hass,
+            dt_util.utc_from_timestamp(start_ts),
+            None,
+            self.entity_id,
+            include_start_time_state=True,
+            no_attributes=True,
+        ).get(self.entity_id, [])
+
+    @callback
+    def async_set_window_start(
+        self, history_stats: HistoryStats, start_timestamp: float
+    ) -> None:
+        """Set the start of the window of the history stats.
+
+        State changes no longer needed by any of the windows are trimmed. History
+        stats without a window yet are not considered, they load the history they
+        need when they compute their first window.
+        """
+        self._window_starts[history_stats] = start_timestamp
+        if self.start is None:
+            return
+        trim_timestamp = min(
+            start for start in self._window_starts.values() if start is not None
+        )
+        # Keep the state at the start of the earliest window
+        if (index := bisect_right(self.timestamps, trim_timestamp) - 1) > 0:
+            del self.timestamps[:index]
+            del self.states[:index]
+            self.start = trim_timestamp
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Add a state change of the source entity."""
+        if (new_state := event.data["new_state"]) is None:
+            return
+        if self._pending is not None:
+            self._pending.append(new_state)
+        elif self.start is not None:
+            self._async_add_state(new_state)
+
+    @callback
+    def _async_add_state(self, state: State) -> None:
+        """Add a state unless the history already has it."""
+        timestamp = state.last_changed_timestamp
+        if self.timestamps and (
+            timestamp < self.timestamps[-1]
+            or (timestamp == self.timestamps[-1] and state.state == self.states[-1])
+        ):
+            return
+        self.timestamps.append(timestamp)
+        self.states.append(state.state)
 
-    state: str
-    last_changed: float
+    @callback
+    def _async_clear(self) -> None:
+        """Clear the history."""
+        self.timestamps = []
+        self.states = []
+        self.start = None
 
 
 class HistoryStats:
@@ -53,13 +192,33 @@ class HistoryStats:
         self.entity_id = entity_id
         self._period = (MIN_TIME_UTC, MIN_TIME_UTC)
         self._state: HistoryStatsState = HistoryStatsState(None, None, self._period)
-        self._history_current_period: list[HistoryState] = []
+        self._source: SourceHistory | None = None
         self._previous_run_before_start = False
         self._entity_states = set(entity_states)
         self._duration = duration
         self._start = start
         self._end = end
 
+    @callback
+    def async_start_tracking(self) -> CALLBACK_TYPE:
+        """Start tracking state changes of the source entity.
+
+        The history of the source entity is shared by all history stats
+        tracking it.
+        """
+        sources = self.hass.data.setdefault(DATA_SOURCE_HISTORY, {})
+        if (source := sources.get(self.entity_id)) is None:
+            source = sources[self.entity_id] = SourceHistory(self.hass, self.entity_id)
+        self._source = source
+        untrack = source.async_track(self)
+
+        @callback
+        def _async_stop_tracking() -> None:
+            self._source = None
+            untrack()
+
+        return _async_stop_tracking
+
     async def async_update(
         self, event: Event[EventStateChangedData] | None
     ) -> HistoryStatsState:
@@ -87,108 +246,72 @@ class HistoryStats:
 
         if current_period_start_timestamp > now_timestamp:
             # History cannot tell the future
-            self._history_current_period = []
             self._previous_run_before_start = True
             self._state = HistoryStatsState(None, None, self._period)
             return self._state
-        #
-        # We avoid querying the database if the below did NOT happen:
-        #
-        # - The previous run happened before the start time
-        # - The start time changed
-        # - The period shrank in size
-        # - The previous period ended before now
-        #
-        if (
-            not self._previous_run_before_start
-            and current_period_start_timestamp == previous_period_start_timestamp
-            and (
-                current_period_end_timestamp == previous_period_end_timestamp
-                or (
-                    current_period_end_timestamp >= previous_period_end_timestamp
-                    and previous_period_end_timestamp <= now_timestamp
-                )
-            )
-        ):
-            new_data = False
-            if event and (new_state := event.data["new_state"]) is not None:
-                if (
-                    current_period_start_timestamp
+
+        if (source := self._source) is None:
+            # State changes are not tracked yet, load the period on its own
+            source = SourceHistory(self.hass, self.entity_id)
+            await source.async_load(current_period_start_timestamp)
+        else:
+            #
+            # The value cannot have changed if the period has not changed,
+            # ended before now and the event is not in the period
+            #
+            if (
+                not self._previous_run_before_start
+                and current_period_start_timestamp == previous_period_start_timestamp
+                and current_period_end_timestamp == previous_period_end_timestamp
+                and current_period_end_timestamp < now_timestamp
+                and not (
+                    event
+                    and (new_state := event.data["new_state"]) is not None
+                    and current_period_start_timestamp
                     <= floored_timestamp(new_state.last_changed)
                     <= current_period_end_timestamp
-                ):
-                    self._history_current_period.append(
-                        HistoryState(
-                            new_state.state, new_state.last_changed.timestamp()
-                        )
-                    )
-                    new_data = True
-            if not new_data and current_period_end_timestamp < now_timestamp:
-                # If period has not changed and current time after the period end...
-                # Don't compute anything as the value cannot have changed
+                )
+            ):
                 return self._state
-        else:
-            await self._async_history_from_db(
-                current_period_start_timestamp, current_period_end_timestamp
-            )
-            self._previous_run_before_start = False
+            await source.async_ensure_loaded(current_period_start_timestamp)
+        self._previous_run_before_start = False
 
         seconds_matched, match_count = self._async_compute_seconds_and_changes(
+            source,
             now_timestamp,
             current_period_start_timestamp,
             current_period_end_timestamp,
         )
+        if source is self._source:
+            source.async_set_window_start(self, current_period_start_timestamp)
         self._state = HistoryStatsState(seconds_matched, match_count, self._period)
         return self._state
 
-    async def _async_history_from_db(
-        self,
-        current_period_start_timestamp: float,
-        current_period_end_timestamp: float,
-    ) -> None:
-        """Update history data for the current period from the database."""
-        instance = get_instance(self.hass)
-        states = await instance.async_add_executor_job(
-            self._state_changes_during_period,
-            current_period_start_timestamp,
-            current_period_end_timestamp,
-        )
-        self._history_current_period = [
-            HistoryState(state.state, state.last_changed.timestamp())
-            for state in states
-        ]
-
-    def _state_changes_during_period(
-        self, start_ts: float, end_ts: float
-    ) -> list[State]:
-        """Return state changes during a period."""
-        start = dt_util.utc_from_timestamp(start_ts)
-        end = dt_util.utc_from_timestamp(end_ts)
-        return history.state_changes_during_period(
-            self.hass,
-            start,
-            end,
-            self.entity_id,
-            include_start_time_state=True,
-            no_attributes=True,
-        ).get(self.entity_id, [])
-
     def _async_compute_seconds_and_changes(
-        self, now_timestamp: float, start_timestamp: float, end_timestamp: float
+        self,
+        source: SourceHistory,
+        now_timestamp: float,
+        start_timestamp: float,
+        end_timestamp: float,
     ) -> tuple[float, int]:
-        """Compute the seconds matched and changes from the history list and first state."""
-        # state_changes_during_period is called with include_start_time_state=True
-        # which is the default and always provides the state at the start
-        # of the period
+        """Compute the seconds matched and changes from the history of the period."""
+        timestamps = source.timestamps
+        states = source.states
+        # The history has the state at its start, start from the state at
+        # the start of the period and stop at the last change in the period
+        first = max(bisect_right(timestamps, start_timestamp) - 1, 0)
+        last = bisect_right(timestamps, end_timestamp, first)
+        while last < len(timestamps) and math.floor(timestamps[last]) <= end_timestamp:
+            last += 1
         previous_state_matches = False
         last_state_change_timestamp = 0.0
         elapsed = 0.0
         match_count = 0
 
         # Make calculations
-        for history_state in self._history_current_period:
-            current_state_matches = history_state.state in self._entity_states
-            state_change_timestamp = history_state.last_changed
+        for index in range(first, last):
+            current_state_matches = states[index] in self._entity_states
+            state_change_timestamp = timestamps[index]
 
             if math.floor(state_change_timestamp) > now_timestamp:
                 # Shouldn't count states that are in the future
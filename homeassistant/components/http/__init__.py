@@ -147,12 +147,9 @@ class StaticPathConfig:
     url_path: str
     path: str
     cache_headers: bool = True
-
-
-_STATIC_CLASSES = {
-    True: CachingStaticResource,
-    False: web.StaticResource,
-}
+    # Files of the path do not change while Home Assistant runs, so small
+    # files can be served from memory
+    immutable: bool = False
 
 
 class ConfData(TypedDict, total=False):
@@ -342,6 +339,17 @@ async def _serve_file(path: str, request: web.Request) -> web.FileResponse:
     return web.FileResponse(path)
 
 
+def _make_static_resource(
+    config: StaticPathConfig,
+) -> CachingStaticResource | web.StaticResource:
+    """Create the static resource of a static path."""
+    if config.cache_headers:
+        return CachingStaticResource(
+            config.url_path, config.path, immutable=config.immutable
+        )
+    return web.StaticResource(config.url_path, config.path)
+
+
 class HomeAssistantHTTP:
     """HTTP server for Home Assistant."""
 
@@ -462,9 +470,7 @@ class HomeAssistantHTTP:
     ) -> dict[str, CachingStaticResource | web.StaticResource | None]:
         """Create a list of static resources."""
         return {
-            config.url_path: _STATIC_CLASSES[config.cache_headers](
-                config.url_path, config.path
-            )
+            config.url_path: _make_static_resource(config)
             if os.path.isdir(config.path)
             else None
             for config in configs
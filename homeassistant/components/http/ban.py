@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import deque
 from collections.abc import Awaitable, Callable, Coroutine
 from contextlib import suppress
 from datetime import datetime
 from http import HTTPStatus
-from ipaddress import IPv4Address, IPv6Address, ip_address
+from ipaddress import (
+    IPv4Address,
+    IPv4Network,
+    IPv6Address,
+    IPv6Network,
+    ip_address,
+    ip_network,
+)
 import logging
 from socket import gethostbyaddr, herror
+import time
 from typing import Any, Concatenate, Final
 
 from aiohttp.web import (
@@ -21,6 +29,7 @@ from aiohttp.web import (
     middleware,
 )
 from aiohttp.web_exceptions import HTTPForbidden, HTTPUnauthorized
+from lru import LRU
 import voluptuous as vol
 
 from homeassistant.config import load_yaml_config_file
@@ -36,9 +45,7 @@ from .view import HomeAssistantView
 _LOGGER: Final = logging.getLogger(__name__)
 
 KEY_BAN_MANAGER = AppKey["IpBanManager"]("ha_banned_ips_manager")
-KEY_FAILED_LOGIN_ATTEMPTS = AppKey[defaultdict[IPv4Address | IPv6Address, int]](
-    "ha_failed_login_attempts"
-)
+KEY_FAILED_LOGIN_ATTEMPTS = AppKey["FailedLoginAttempts"]("ha_failed_login_attempts")
 KEY_LOGIN_THRESHOLD = AppKey[int]("ban_manager.ip_bans_lookup")
 
 NOTIFICATION_ID_BAN: Final = "ip-ban"
@@ -51,12 +58,20 @@ SCHEMA_IP_BAN_ENTRY: Final = vol.Schema(
     {vol.Optional("banned_at"): vol.Any(None, cv.datetime)}
 )
 
+# Seconds failed login attempts are counted for
+LOGIN_ATTEMPTS_WINDOW: Final = 86400
+# Number of remote addresses failed login attempts are counted for
+MAX_LOGIN_ATTEMPTS_ADDRESSES: Final = 4096
+# Length of the prefix IPv6 addresses are grouped by, as a client can
+# usually use any address of its prefix
+IPV6_LOGIN_ATTEMPTS_PREFIX: Final = 64
+
 
 @callback
 def setup_bans(hass: HomeAssistant, app: Application, login_threshold: int) -> None:
     """Create IP Ban middleware for the app."""
     app.middlewares.append(ban_middleware)
-    app[KEY_FAILED_LOGIN_ATTEMPTS] = defaultdict[IPv4Address | IPv6Address, int](int)
+    app[KEY_FAILED_LOGIN_ATTEMPTS] = FailedLoginAttempts(login_threshold)
     app[KEY_LOGIN_THRESHOLD] = login_threshold
     app[KEY_BAN_MANAGER] = IpBanManager(hass)
 
@@ -76,10 +91,10 @@ async def ban_middleware(
         _LOGGER.error("IP Ban middleware loaded but banned IPs not loaded")
         return await handler(request)
 
-    if ip_bans_lookup := ban_manager.ip_bans_lookup:
+    if ban_manager.ip_bans_lookup or ban_manager.ip_network_bans_lookup:
         # Verify if IP is not banned
         ip_address_ = ip_address(request.remote)  # type: ignore[arg-type]
-        if ip_address_ in ip_bans_lookup:
+        if ban_manager.async_is_banned(ip_address_):
             raise HTTPForbidden
 
     try:
@@ -147,16 +162,13 @@ async def process_wrong_login(request: Request) -> None:
     if KEY_BAN_MANAGER not in request.app or request.app[KEY_LOGIN_THRESHOLD] < 1:
         return
 
-    request.app[KEY_FAILED_LOGIN_ATTEMPTS][remote_addr] += 1
+    attempts = request.app[KEY_FAILED_LOGIN_ATTEMPTS].async_add(remote_addr)
 
     # Supervisor IP should never be banned
     if is_hassio(hass) and str(remote_addr) == get_supervisor_ip():
         return
 
-    if (
-        request.app[KEY_FAILED_LOGIN_ATTEMPTS][remote_addr]
-        >= request.app[KEY_LOGIN_THRESHOLD]
-    ):
+    if attempts >= request.app[KEY_LOGIN_THRESHOLD]:
         ban_manager = request.app[KEY_BAN_MANAGER]
         _LOGGER.warning("Banned IP %s for too many login attempts", remote_addr)
         await ban_manager.async_add_ban(remote_addr)
@@ -183,26 +195,96 @@ def process_success_login(request: Request) -> None:
         return
 
     remote_addr = ip_address(request.remote)  # type: ignore[arg-type]
-    login_attempt_history = app[KEY_FAILED_LOGIN_ATTEMPTS]
-    if remote_addr in login_attempt_history and login_attempt_history[remote_addr] > 0:
+    if app[KEY_FAILED_LOGIN_ATTEMPTS].async_reset(remote_addr):
         _LOGGER.debug(
             "Login success, reset failed login attempts counter from %s", remote_addr
         )
-        login_attempt_history.pop(remote_addr)
+
+
+class FailedLoginAttempts:
+    """Count the recent failed login attempts of remote addresses.
+
+    Attempts are counted within a sliding window, for a bounded number of
+    addresses. The addresses which failed to log in the longest time ago are
+    forgotten first, so a flood of attempts from many addresses does not grow
+    the memory used. Attempts from IPv6 addresses are counted per prefix.
+    """
+
+    __slots__ = ("_attempts", "_max_attempts")
+
+    def __init__(self, max_attempts: int) -> None:
+        """Initialize the counter."""
+        # Attempts over the maximum are not needed to decide on a ban
+        self._max_attempts = max(max_attempts, 1)
+        # address or prefix -> times of the attempts, oldest first
+        self._attempts: LRU[IPv4Address | IPv6Network, deque[float]] = LRU(
+            MAX_LOGIN_ATTEMPTS_ADDRESSES
+        )
+
+    def __getitem__(self, remote_addr: IPv4Address | IPv6Address) -> int:
+        """Return the number of recent failed login attempts of an address."""
+        if (attempts := self._attempts.get(_login_attempts_key(remote_addr))) is None:
+            return 0
+        _remove_expired_attempts(attempts, time.monotonic())
+        return len(attempts)
+
+    @callback
+    def async_add(self, remote_addr: IPv4Address | IPv6Address) -> int:
+        """Add a failed login attempt of an address.
+
+        Returns the number of recent failed login attempts of the address.
+        """
+        key = _login_attempts_key(remote_addr)
+        now = time.monotonic()
+        if (attempts := self._attempts.get(key)) is None:
+            attempts = self._attempts[key] = deque(maxlen=self._max_attempts)
+        else:
+            _remove_expired_attempts(attempts, now)
+        attempts.append(now)
+        return len(attempts)
+
+    @callback
+    def async_reset(self, remote_addr: IPv4Address | IPv6Address) -> bool:
+        """Forget the failed login attempts of an address.
+
+        Returns if there were any.
+        """
+        return self._attempts.pop(_login_attempts_key(remote_addr), None) is not None
+
+
+def _login_attempts_key(
+    remote_addr: IPv4Address | IPv6Address,
+) -> IPv4Address | IPv6Network:
+    """Return the key the failed login attempts of an address are counted by."""
+    if isinstance(remote_addr, IPv6Address):
+        return IPv6Network((remote_addr, IPV6_LOGIN_ATTEMPTS_PREFIX), strict=False)
+    return remote_addr
+
+
+def _remove_expired_attempts(attempts: deque[float], now: float) -> None:
+    """Remove the attempts which are no longer counted."""
+    expired = now - LOGIN_ATTEMPTS_WINDOW
+    while attempts and attempts[0] < expired:
+        attempts.popleft()
 
 
 class IpBan:
-    """Represents banned IP address."""
+    """Represents banned IP address or network."""
 
     def __init__(
         self,
-        ip_ban: str | IPv4Address | IPv6Address,
+        ip_ban: str | IPv4Address | IPv6Address | IPv4Network | IPv6Network,
         banned_at: datetime | None = None,
     ) -> None:
         """Initialize IP Ban object."""
-        self.ip_address = ip_address(ip_ban)
+        self.ip_network = ip_network(ip_ban)
         self.banned_at = banned_at or dt_util.utcnow()
 
+    @property
+    def ip_address(self) -> IPv4Address | IPv6Address:
+        """Return the banned IP address, the first address of a network."""
+        return self.ip_network.network_address
+
 
 class IpBanManager:
     """Manage IP bans."""
@@ -212,6 +294,10 @@ class IpBanManager:
         self.hass = hass
         self.path = hass.config.path(IP_BANS_FILE)
         self.ip_bans_lookup: dict[IPv4Address | IPv6Address, IpBan] = {}
+        # (IP version, prefix length) -> banned networks
+        self.ip_network_bans_lookup: dict[
+            tuple[int, int], dict[IPv4Network | IPv6Network, IpBan]
+        ] = {}
 
     async def async_load(self) -> None:
         """Load the existing IP bans."""
@@ -226,16 +312,41 @@ class IpBanManager:
             return
 
         ip_bans_lookup: dict[IPv4Address | IPv6Address, IpBan] = {}
+        ip_network_bans_lookup: dict[
+            tuple[int, int], dict[IPv4Network | IPv6Network, IpBan]
+        ] = {}
         for ip_ban, ip_info in list_.items():
             try:
                 ip_info = SCHEMA_IP_BAN_ENTRY(ip_info)
                 ban = IpBan(ip_ban, ip_info["banned_at"])
-                ip_bans_lookup[ban.ip_address] = ban
-            except vol.Invalid as err:
+            except (vol.Invalid, ValueError) as err:
                 _LOGGER.error("Failed to load IP ban %s: %s", ip_info, err)
                 continue
+            network = ban.ip_network
+            if network.prefixlen == network.max_prefixlen:
+                ip_bans_lookup[ban.ip_address] = ban
+            else:
+                ip_network_bans_lookup.setdefault(
+                    (network.version, network.prefixlen), {}
+                )[network] = ban
 
         self.ip_bans_lookup = ip_bans_lookup
+        self.ip_network_bans_lookup = ip_network_bans_lookup
+
+    @callback
+    def async_is_banned(self, remote_addr: IPv4Address | IPv6Address) -> bool:
+        """Return if an address is banned or in a banned network."""
+        if remote_addr in self.ip_bans_lookup:
+            return True
+        # Look up the network of the address for each banned prefix length
+        version = remote_addr.version
+        for (ban_version, prefixlen), networks in self.ip_network_bans_lookup.items():
+            if (
+                ban_version == version
+                and ip_network((remote_addr, prefixlen), strict=False) in networks
+            ):
+                return True
+        return False
 
     def _add_ban(self, ip_ban: IpBan) -> None:
         """Update config file with new banned IP address."""
@@ -2,13 +2,31 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+import gzip
+from http import HTTPStatus
+import math
 from pathlib import Path
+from stat import S_ISREG
 import sys
-from typing import Final
+import time
+from typing import Any, Final
 
-from aiohttp.hdrs import CACHE_CONTROL, CONTENT_TYPE
-from aiohttp.web import FileResponse, Request, StreamResponse
+from aiohttp.hdrs import (
+    ACCEPT_ENCODING,
+    CACHE_CONTROL,
+    CONTENT_ENCODING,
+    CONTENT_TYPE,
+    ETAG,
+    LAST_MODIFIED,
+    RANGE,
+    VARY,
+)
+from aiohttp.helpers import ETAG_ANY
+from aiohttp.web import FileResponse, Request, Response, StreamResponse
 from aiohttp.web_fileresponse import CONTENT_TYPES, FALLBACK_CONTENT_TYPE
 from aiohttp.web_urldispatcher import StaticResource
 from lru import LRU
@@ -17,6 +35,22 @@ CACHE_TIME: Final = 31 * 86400  # = 1 month
 CACHE_HEADER = f"public, max-age={CACHE_TIME}"
 CACHE_HEADERS: Mapping[str, str] = {CACHE_CONTROL: CACHE_HEADER}
 RESPONSE_CACHE: LRU[tuple[str, Path], tuple[Path, str]] = LRU(512)
+# Files up to this size are kept in memory, larger files are sent from disk
+MAX_MEMORY_FILE_SIZE: Final = 128 * 1024
+MEMORY_FILE_CACHE: LRU[tuple[str, Path], StaticFile | None] = LRU(256)
+# Smaller files are not worth compressing
+MIN_COMPRESS_SIZE: Final = 256
+COMPRESSIBLE_CONTENT_TYPES: Final = {
+    "application/javascript",
+    "application/json",
+    "application/manifest+json",
+    "application/xml",
+    "image/svg+xml",
+}
+# Variants of a file which may be stored next to it, in order of preference
+COMPRESSED_VARIANTS: Final = ((".br", "br"), (".gz", "gzip"))
+IDENTITY: Final = "identity"
+_LOADING: dict[Path, asyncio.Future[StaticFile | None]] = {}
 
 if sys.version_info >= (3, 13):
     # guess_type is soft-deprecated in 3.13
@@ -28,29 +62,200 @@ else:
     _GUESSER = CONTENT_TYPES.guess_type
 
 
+@dataclass(slots=True)
+class StaticFile:
+    """A static file kept in memory."""
+
+    content_type: str
+    etag: str
+    last_modified: float
+    # HTTP date of the last modification
+    last_modified_header: str
+    # content encoding -> body, in order of preference
+    bodies: dict[str, bytes]
+
+    def make_response(self, request: Request) -> Response | None:
+        """Return the response to a request, if it can be served from memory."""
+        if RANGE in request.headers:
+            return None
+        accepted = _accepted_encodings(request.headers.get(ACCEPT_ENCODING, ""))
+        for encoding in self.bodies:
+            if encoding == IDENTITY or encoding in accepted or "*" in accepted:
+                break
+        else:
+            # The uncompressed body is only kept when there is no variant
+            return None
+
+        response = Response(status=HTTPStatus.NOT_MODIFIED)
+        response.headers[CACHE_CONTROL] = CACHE_HEADER
+        if encoding != IDENTITY:
+            response.headers[VARY] = ACCEPT_ENCODING
+        # A variant is a different representation with its own entity tag
+        etag = self.etag if encoding == IDENTITY else f"{self.etag}-{encoding}"
+        response.headers[ETAG] = f'"{etag}"'
+        response.headers[LAST_MODIFIED] = self.last_modified_header
+        if (if_none_match := request.if_none_match) is not None:
+            if any(tag.value in (etag, ETAG_ANY) for tag in if_none_match):
+                return response
+        elif (
+            if_modified_since := request.if_modified_since
+        ) is not None and self.last_modified <= if_modified_since.timestamp():
+            return response
+
+        response.set_status(HTTPStatus.OK)
+        response.body = self.bodies[encoding]
+        response.headers[CONTENT_TYPE] = self.content_type
+        if encoding != IDENTITY:
+            response.headers[CONTENT_ENCODING] = encoding
+        return response
+
+
+def _load_static_file(file_path: Path, content_type: str) -> StaticFile | None:
+    """Load a static file into memory, compressing it if needed.
+
+    Returns None if the file is not kept in memory.
+    """
+    try:
+        st = file_path.stat()
+    except OSError:
+        return None
+    if not S_ISREG(st.st_mode) or st.st_size > MAX_MEMORY_FILE_SIZE:
+        return None
+
+    bodies: dict[str, bytes] = {}
+    for extension, encoding in COMPRESSED_VARIANTS:
+        try:
+            bodies[encoding] = file_path.with_name(
+                file_path.name + extension
+            ).read_bytes()
+        except OSError:
+            continue
+    if not bodies:
+        try:
+            body = file_path.read_bytes()
+        except OSError:
+            return None
+        if len(body) >= MIN_COMPRESS_SIZE and (
+            content_type.startswith("text/")
+            or content_type in COMPRESSIBLE_CONTENT_TYPES
+        ):
+            bodies["gzip"] = gzip.compress(body, mtime=0)
+        else:
+            bodies[IDENTITY] = body
+
+    return StaticFile(
+        content_type,
+        f"{st.st_mtime_ns:x}-{st.st_size:x}",
+        st.st_mtime,
+        # Formatted like aiohttp formats the Last-Modified header
+        time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime(math.ceil(st.st_mtime))),
+        bodies,
+    )
+
+
+@lru_cache(maxsize=64)
+def _accepted_encodings(accept_encoding: str) -> frozenset[str]:
+    """Return the content encodings accepted by an Accept-Encoding header.
+
+    Encodings with a quality value of 0 are not accepted.
+    """
+    accepted: set[str] = set()
+    for coding in accept_encoding.lower().split(","):
+        name, _, params = coding.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0 and (name := name.strip()):
+            accepted.add(name)
+    return frozenset(accepted)
+
+
 class CachingStaticResource(StaticResource):
-    """Static Resource handler that will add cache headers."""
+    """Static Resource handler that will add cache headers.
+
+    When the files of the directory are immutable, small files are kept in
+    memory along with a compressed variant, so they are served without
+    touching the disk. Only directories whose files do not change while Home
+    Assistant runs, like the frontend, must be marked immutable.
+    """
+
+    def __init__(
+        self,
+        prefix: str,
+        directory: str | Path,
+        *,
+        immutable: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the resource."""
+        super().__init__(prefix, directory, **kwargs)
+        self._immutable = immutable
 
     async def _handle(self, request: Request) -> StreamResponse:
-        """Wrap base handler to cache file path resolution and content type guess."""
+        """Serve a file from memory or from disk."""
         rel_url = request.match_info["filename"]
         key = (rel_url, self._directory)
-        response: StreamResponse
 
-        if key in RESPONSE_CACHE:
-            file_path, content_type = RESPONSE_CACHE[key]
-            response = FileResponse(file_path, chunk_size=self._chunk_size)
-            response.headers[CONTENT_TYPE] = content_type
+        if not self._immutable:
+            static_file = None
+        elif key in MEMORY_FILE_CACHE:
+            static_file = MEMORY_FILE_CACHE[key]
         else:
-            response = await super()._handle(request)
-            if not isinstance(response, FileResponse):
-                # Must be directory index; ignore caching
-                return response
-            file_path = response._path  # noqa: SLF001
-            response.content_type = _GUESSER(file_path)[0] or FALLBACK_CONTENT_TYPE
-            # Cache actual header after setter construction.
-            content_type = response.headers[CONTENT_TYPE]
-            RESPONSE_CACHE[key] = (file_path, content_type)
+            resolved = await self._async_resolve(request, key)
+            if isinstance(resolved, StreamResponse):
+                return resolved
+            static_file = MEMORY_FILE_CACHE[key] = await _async_load_static_file(
+                *resolved
+            )
 
+        if (
+            static_file is not None
+            and (memory_response := static_file.make_response(request)) is not None
+        ):
+            return memory_response
+
+        resolved = await self._async_resolve(request, key)
+        if isinstance(resolved, StreamResponse):
+            return resolved
+        file_path, content_type = resolved
+        response = FileResponse(file_path, chunk_size=self._chunk_size)
+        response.headers[CONTENT_TYPE] = content_type
         response.headers[CACHE_CONTROL] = CACHE_HEADER
         return response
+
+    async def _async_resolve(
+        self, request: Request, key: tuple[str, Path]
+    ) -> tuple[Path, str] | StreamResponse:
+        """Wrap base handler to cache file path resolution and content type guess.
+
+        Returns the response of the base handler if it is not a file.
+        """
+        if key in RESPONSE_CACHE:
+            return RESPONSE_CACHE[key]
+
+        response = await super()._handle(request)
+        if not isinstance(response, FileResponse):
+            # Must be directory index; ignore caching
+            return response
+        file_path = response._path  # noqa: SLF001
+        response.content_type = _GUESSER(file_path)[0] or FALLBACK_CONTENT_TYPE
+        # Cache actual header after setter construction.
+        resolved = RESPONSE_CACHE[key] = (file_path, response.headers[CONTENT_TYPE])
+        return resolved
+
+
+async def _async_load_static_file(
+    file_path: Path, content_type: str
+) -> StaticFile | None:
+    """Load a static file, sharing the load between concurrent requests."""
+    if (loading := _LOADING.get(file_path)) is None:
+        loading = _LOADING[file_path] = asyncio.get_running_loop().run_in_executor(
+            None, _load_static_file, file_path, content_type
+        )
+        loading.add_done_callback(lambda _: _LOADING.pop(file_path, None))
+    return await asyncio.shield(loading)
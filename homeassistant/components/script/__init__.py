@@ -13,6 +13,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.blueprint import CONF_USE_BLUEPRINT
+from homeassistant.components.trace import async_remove_trace_samples
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_MODE,
@@ -697,8 +698,9 @@ class ScriptEntity(BaseScriptEntity, RestoreEntity):
             context,
             self._trace_config,
         ) as script_trace:
-            # Prepare tracing the execution of the script's sequence
-            script_trace.set_trace(trace_get())
+            if script_trace is not None:
+                # Prepare tracing the execution of the script's sequence
+                script_trace.set_trace(trace_get())
             with trace_path("sequence"):
                 this = None
                 if state := self.hass.states.get(self.entity_id):
@@ -757,6 +759,7 @@ class ScriptEntity(BaseScriptEntity, RestoreEntity):
 
         # remove service
         self.hass.services.async_remove(DOMAIN, self._attr_unique_id)
+        async_remove_trace_samples(self.hass, f"{DOMAIN}.{self._attr_unique_id}")
 
 
 @websocket_api.websocket_command({"type": "script/config", "entity_id": str})
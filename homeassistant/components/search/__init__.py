@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from enum import StrEnum
 import logging
 from typing import Any
@@ -12,7 +12,15 @@ import voluptuous as vol
 
 from homeassistant.components import automation, group, person, script, websocket_api
 from homeassistant.components.homeassistant import scene
-from homeassistant.core import HomeAssistant, callback, split_entity_id
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+    split_entity_id,
+)
 from homeassistant.helpers import (
     area_registry as ar,
     config_validation as cv,
@@ -23,13 +31,22 @@ from homeassistant.helpers.entity import (
     EntityInfo,
     entity_sources as get_entity_sources,
 )
+from homeassistant.helpers.event import (
+    async_track_state_added_domain,
+    async_track_state_change_event,
+    async_track_state_removed_domain,
+)
+from homeassistant.helpers.singleton import singleton
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util.hass_dict import HassKey
 
 DOMAIN = "search"
 _LOGGER = logging.getLogger(__name__)
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
 
+DATA_REFERENCE_INDEX: HassKey[ReferenceIndex] = HassKey(f"{DOMAIN}_reference_index")
+
 
 # enum of item types
 class ItemType(StrEnum):
@@ -51,6 +68,44 @@ class ItemType(StrEnum):
     SCRIPT_BLUEPRINT = "script_blueprint"
 
 
+# Lookups of the items referenced by an item, by the type of the item and the
+# type of the referenced items. The domain of the item entities is the item type.
+_REFERENCE_LOOKUPS: dict[
+    ItemType,
+    dict[ItemType, Callable[[HomeAssistant, str], Iterable[str] | str | None]],
+] = {
+    ItemType.AUTOMATION: {
+        ItemType.AREA: automation.areas_in_automation,
+        ItemType.AUTOMATION_BLUEPRINT: automation.blueprint_in_automation,
+        ItemType.DEVICE: automation.devices_in_automation,
+        ItemType.ENTITY: automation.entities_in_automation,
+        ItemType.FLOOR: automation.floors_in_automation,
+        ItemType.LABEL: automation.labels_in_automation,
+    },
+    ItemType.GROUP: {ItemType.ENTITY: group.get_entity_ids},
+    ItemType.PERSON: {ItemType.ENTITY: person.entities_in_person},
+    ItemType.SCENE: {ItemType.ENTITY: scene.entities_in_scene},
+    ItemType.SCRIPT: {
+        ItemType.AREA: script.areas_in_script,
+        ItemType.DEVICE: script.devices_in_script,
+        ItemType.ENTITY: script.entities_in_script,
+        ItemType.FLOOR: script.floors_in_script,
+        ItemType.LABEL: script.labels_in_script,
+        ItemType.SCRIPT_BLUEPRINT: script.blueprint_in_script,
+    },
+}
+
+# State attributes listing the members of an item. The references of the other
+# items only change when their entities are reloaded.
+_MEMBER_ATTRIBUTES: dict[ItemType, str] = {
+    ItemType.GROUP: ATTR_ENTITY_ID,
+    ItemType.PERSON: person.ATTR_DEVICE_TRACKERS,
+    ItemType.SCENE: ATTR_ENTITY_ID,
+}
+
+_NO_REFERENCES: set[str] = set()
+
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Search component."""
     websocket_api.async_register_command(hass, websocket_search_related)
@@ -77,6 +132,122 @@ def websocket_search_related(
     )
 
 
+class ReferenceIndex:
+    """Index of the items referencing an item.
+
+    Automations, scripts, groups, persons and scenes are indexed by the items
+    they reference the first time they are searched. The index is kept up to
+    date when their entities are added or removed and when the members of
+    groups, persons and scenes change.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self.hass = hass
+        self._indexed: set[ItemType] = set()
+        # Items by (item type, referenced item type, referenced item id)
+        self._index: dict[tuple[ItemType, ItemType, str], set[str]] = {}
+        # Index keys of the references of the indexed items
+        self._references: dict[str, list[tuple[ItemType, ItemType, str]]] = {}
+        self._unsub_members: dict[str, CALLBACK_TYPE] = {}
+        domains = [str(item_type) for item_type in _REFERENCE_LOOKUPS]
+        async_track_state_added_domain(hass, domains, self._async_item_added)
+        async_track_state_removed_domain(hass, domains, self._async_item_removed)
+
+    @callback
+    def async_referencing(
+        self, item_type: ItemType, referenced_type: ItemType, referenced_id: str
+    ) -> set[str]:
+        """Return the items of the item type referencing the item.
+
+        The returned set must not be modified.
+        """
+        if item_type not in self._indexed:
+            self._indexed.add(item_type)
+            for entity_id in self.hass.states.async_entity_ids(item_type):
+                self._async_index_item(item_type, entity_id)
+        return self._index.get(
+            (item_type, referenced_type, referenced_id), _NO_REFERENCES
+        )
+
+    @callback
+    def _async_index_item(self, item_type: ItemType, entity_id: str) -> None:
+        """Add an item to the index."""
+        self._async_add_references(item_type, entity_id)
+        if item_type in _MEMBER_ATTRIBUTES:
+            self._unsub_members[entity_id] = async_track_state_change_event(
+                self.hass, entity_id, self._async_members_changed
+            )
+
+    @callback
+    def _async_unindex_item(self, entity_id: str) -> None:
+        """Remove an item from the index."""
+        self._async_remove_references(entity_id)
+        if unsub := self._unsub_members.pop(entity_id, None):
+            unsub()
+
+    @callback
+    def _async_add_references(self, item_type: ItemType, entity_id: str) -> None:
+        """Add the references of an item to the index."""
+        keys: list[tuple[ItemType, ItemType, str]] = []
+        for referenced_type, lookup in _REFERENCE_LOOKUPS[item_type].items():
+            if not (referenced := lookup(self.hass, entity_id)):
+                continue
+            if isinstance(referenced, str):
+                referenced = (referenced,)
+            keys.extend(
+                (item_type, referenced_type, referenced_id)
+                for referenced_id in referenced
+            )
+        for key in keys:
+            if (items := self._index.get(key)) is None:
+                items = self._index[key] = set()
+            items.add(entity_id)
+        self._references[entity_id] = keys
+
+    @callback
+    def _async_remove_references(self, entity_id: str) -> None:
+        """Remove the references of an item from the index."""
+        for key in self._references.pop(entity_id, ()):
+            items = self._index[key]
+            items.discard(entity_id)
+            if not items:
+                del self._index[key]
+
+    @callback
+    def _async_item_added(self, event: Event[EventStateChangedData]) -> None:
+        """Add an item to the index when its entity is added."""
+        entity_id = event.data["entity_id"]
+        if (item_type := ItemType(split_entity_id(entity_id)[0])) in self._indexed:
+            self._async_index_item(item_type, entity_id)
+
+    @callback
+    def _async_item_removed(self, event: Event[EventStateChangedData]) -> None:
+        """Remove an item from the index when its entity is removed."""
+        self._async_unindex_item(event.data["entity_id"])
+
+    @callback
+    def _async_members_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Update the references of an item when its members change."""
+        old_state = event.data["old_state"]
+        new_state = event.data["new_state"]
+        if old_state is None or new_state is None:
+            return
+        entity_id = event.data["entity_id"]
+        item_type = ItemType(new_state.domain)
+        attribute = _MEMBER_ATTRIBUTES[item_type]
+        if old_state.attributes.get(attribute) != new_state.attributes.get(attribute):
+            self._async_remove_references(entity_id)
+            self._async_add_references(item_type, entity_id)
+
+
+@callback
+@singleton(DATA_REFERENCE_INDEX)
+def async_get_reference_index(hass: HomeAssistant) -> ReferenceIndex:
+    """Return the reference index."""
+    return ReferenceIndex(hass)
+
+
 class Searcher:
     """Find related things."""
 
@@ -93,6 +264,7 @@ class Searcher:
         self._device_registry = dr.async_get(hass)
         self._entity_registry = er.async_get(hass)
         self._entity_sources = entity_sources
+        self._index = async_get_reference_index(hass)
         self.results: defaultdict[ItemType, set[str]] = defaultdict(set)
 
     @callback
@@ -131,11 +303,15 @@ class Searcher:
 
         # Automations referencing this area
         self._add(
-            ItemType.AUTOMATION, automation.automations_with_area(self.hass, area_id)
+            ItemType.AUTOMATION,
+            self._index.async_referencing(ItemType.AUTOMATION, ItemType.AREA, area_id),
         )
 
         # Scripts referencing this area
-        self._add(ItemType.SCRIPT, script.scripts_with_area(self.hass, area_id))
+        self._add(
+            ItemType.SCRIPT,
+            self._index.async_referencing(ItemType.SCRIPT, ItemType.AREA, area_id),
+        )
 
         # Entity in this area, will extend this with the entities of the devices in this area
         entity_entries = er.async_entries_for_area(self._entity_registry, area_id)
@@ -151,11 +327,18 @@ class Searcher:
             # Automations referencing this device
             self._add(
                 ItemType.AUTOMATION,
-                automation.automations_with_device(self.hass, device.id),
+                self._index.async_referencing(
+                    ItemType.AUTOMATION, ItemType.DEVICE, device.id
+                ),
             )
 
             # Scripts referencing this device
-            self._add(ItemType.SCRIPT, script.scripts_with_device(self.hass, device.id))
+            self._add(
+                ItemType.SCRIPT,
+                self._index.async_referencing(
+                    ItemType.SCRIPT, ItemType.DEVICE, device.id
+                ),
+            )
 
             # Entities of this device
             for entity_entry in er.async_entries_for_device(
@@ -177,31 +360,41 @@ class Searcher:
             # Automations referencing this entity
             self._add(
                 ItemType.AUTOMATION,
-                automation.automations_with_entity(self.hass, entity_entry.entity_id),
+                self._index.async_referencing(
+                    ItemType.AUTOMATION, ItemType.ENTITY, entity_entry.entity_id
+                ),
             )
 
             # Scripts referencing this entity
             self._add(
                 ItemType.SCRIPT,
-                script.scripts_with_entity(self.hass, entity_entry.entity_id),
+                self._index.async_referencing(
+                    ItemType.SCRIPT, ItemType.ENTITY, entity_entry.entity_id
+                ),
             )
 
             # Groups that have this entity as a member
             self._add(
                 ItemType.GROUP,
-                group.groups_with_entity(self.hass, entity_entry.entity_id),
+                self._index.async_referencing(
+                    ItemType.GROUP, ItemType.ENTITY, entity_entry.entity_id
+                ),
             )
 
             # Persons that use this entity
             self._add(
                 ItemType.PERSON,
-                person.persons_with_entity(self.hass, entity_entry.entity_id),
+                self._index.async_referencing(
+                    ItemType.PERSON, ItemType.ENTITY, entity_entry.entity_id
+                ),
             )
 
             # Scenes that reference this entity
             self._add(
                 ItemType.SCENE,
-                scene.scenes_with_entity(self.hass, entity_entry.entity_id),
+                self._index.async_referencing(
+                    ItemType.SCENE, ItemType.ENTITY, entity_entry.entity_id
+                ),
             )
 
             # Config entries for entities in this area
@@ -273,7 +466,9 @@ class Searcher:
         """Find results for an automation blueprint."""
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_blueprint(self.hass, blueprint_path),
+            self._index.async_referencing(
+                ItemType.AUTOMATION, ItemType.AUTOMATION_BLUEPRINT, blueprint_path
+            ),
         )
 
     @callback
@@ -304,11 +499,16 @@ class Searcher:
         # Automations referencing this device
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_device(self.hass, device_id),
+            self._index.async_referencing(
+                ItemType.AUTOMATION, ItemType.DEVICE, device_id
+            ),
         )
 
         # Scripts referencing this device
-        self._add(ItemType.SCRIPT, script.scripts_with_device(self.hass, device_id))
+        self._add(
+            ItemType.SCRIPT,
+            self._index.async_referencing(ItemType.SCRIPT, ItemType.DEVICE, device_id),
+        )
 
         # Entities of this device
         for entity_entry in er.async_entries_for_device(
@@ -331,20 +531,34 @@ class Searcher:
         # Automations referencing this entity
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_entity(self.hass, entity_id),
+            self._index.async_referencing(
+                ItemType.AUTOMATION, ItemType.ENTITY, entity_id
+            ),
         )
 
         # Scripts referencing this entity
-        self._add(ItemType.SCRIPT, script.scripts_with_entity(self.hass, entity_id))
+        self._add(
+            ItemType.SCRIPT,
+            self._index.async_referencing(ItemType.SCRIPT, ItemType.ENTITY, entity_id),
+        )
 
         # Groups that have this entity as a member
-        self._add(ItemType.GROUP, group.groups_with_entity(self.hass, entity_id))
+        self._add(
+            ItemType.GROUP,
+            self._index.async_referencing(ItemType.GROUP, ItemType.ENTITY, entity_id),
+        )
 
         # Persons referencing this entity
-        self._add(ItemType.PERSON, person.persons_with_entity(self.hass, entity_id))
+        self._add(
+            ItemType.PERSON,
+            self._index.async_referencing(ItemType.PERSON, ItemType.ENTITY, entity_id),
+        )
 
         # Scenes referencing this entity
-        self._add(ItemType.SCENE, scene.scenes_with_entity(self.hass, entity_id))
+        self._add(
+            ItemType.SCENE,
+            self._index.async_referencing(ItemType.SCENE, ItemType.ENTITY, entity_id),
+        )
 
     @callback
     def _async_search_floor(self, floor_id: str) -> None:
@@ -352,11 +566,16 @@ class Searcher:
         # Automations referencing this floor
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_floor(self.hass, floor_id),
+            self._index.async_referencing(
+                ItemType.AUTOMATION, ItemType.FLOOR, floor_id
+            ),
         )
 
         # Scripts referencing this floor
-        self._add(ItemType.SCRIPT, script.scripts_with_floor(self.hass, floor_id))
+        self._add(
+            ItemType.SCRIPT,
+            self._index.async_referencing(ItemType.SCRIPT, ItemType.FLOOR, floor_id),
+        )
 
         for area_entry in ar.async_entries_for_floor(self._area_registry, floor_id):
             self._add(ItemType.AREA, area_entry.id)
@@ -372,16 +591,26 @@ class Searcher:
         # Automations referencing this group
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_entity(self.hass, group_entity_id),
+            self._index.async_referencing(
+                ItemType.AUTOMATION, ItemType.ENTITY, group_entity_id
+            ),
         )
 
         # Scripts referencing this group
         self._add(
-            ItemType.SCRIPT, script.scripts_with_entity(self.hass, group_entity_id)
+            ItemType.SCRIPT,
+            self._index.async_referencing(
+                ItemType.SCRIPT, ItemType.ENTITY, group_entity_id
+            ),
         )
 
         # Scenes that reference this group
-        self._add(ItemType.SCENE, scene.scenes_with_entity(self.hass, group_entity_id))
+        self._add(
+            ItemType.SCENE,
+            self._index.async_referencing(
+                ItemType.SCENE, ItemType.ENTITY, group_entity_id
+            ),
+        )
 
         # Entities in this group
         for entity_id in group.get_entity_ids(self.hass, group_entity_id):
@@ -412,11 +641,16 @@ class Searcher:
         # Automations referencing this label
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_label(self.hass, label_id),
+            self._index.async_referencing(
+                ItemType.AUTOMATION, ItemType.LABEL, label_id
+            ),
         )
 
         # Scripts referencing this label
-        self._add(ItemType.SCRIPT, script.scripts_with_label(self.hass, label_id))
+        self._add(
+            ItemType.SCRIPT,
+            self._index.async_referencing(ItemType.SCRIPT, ItemType.LABEL, label_id),
+        )
 
     @callback
     def _async_search_person(self, person_entity_id: str) -> None:
@@ -429,12 +663,17 @@ class Searcher:
         # Automations referencing this person
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_entity(self.hass, person_entity_id),
+            self._index.async_referencing(
+                ItemType.AUTOMATION, ItemType.ENTITY, person_entity_id
+            ),
         )
 
         # Scripts referencing this person
         self._add(
-            ItemType.SCRIPT, script.scripts_with_entity(self.hass, person_entity_id)
+            ItemType.SCRIPT,
+            self._index.async_referencing(
+                ItemType.SCRIPT, ItemType.ENTITY, person_entity_id
+            ),
         )
 
         # Add all member entities of this person
@@ -453,12 +692,17 @@ class Searcher:
         # Automations referencing this scene
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_entity(self.hass, scene_entity_id),
+            self._index.async_referencing(
+                ItemType.AUTOMATION, ItemType.ENTITY, scene_entity_id
+            ),
         )
 
         # Scripts referencing this scene
         self._add(
-            ItemType.SCRIPT, script.scripts_with_entity(self.hass, scene_entity_id)
+            ItemType.SCRIPT,
+            self._index.async_referencing(
+                ItemType.SCRIPT, ItemType.ENTITY, scene_entity_id
+            ),
         )
 
         # Add all entities in this scene
@@ -530,7 +774,10 @@ class Searcher:
     def _async_search_script_blueprint(self, blueprint_path: str) -> None:
         """Find results for a script blueprint."""
         self._add(
-            ItemType.SCRIPT, script.scripts_with_blueprint(self.hass, blueprint_path)
+            ItemType.SCRIPT,
+            self._index.async_referencing(
+                ItemType.SCRIPT, ItemType.SCRIPT_BLUEPRINT, blueprint_path
+            ),
         )
 
     @callback
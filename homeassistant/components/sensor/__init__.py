@@ -154,6 +154,7 @@ class SensorEntity(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
     """Base class for sensor entities."""
 
     _entity_component_unrecorded_attributes = frozenset({ATTR_OPTIONS})
+    _state_value_properties = frozenset({"native_value", "state"})
 
     entity_description: SensorEntityDescription
     _attr_device_class: SensorDeviceClass | None
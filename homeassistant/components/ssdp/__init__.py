@@ -258,7 +258,7 @@ class IntegrationMatchers:
     def __init__(self) -> None:
         """Init optimized integration matching."""
         self._match_by_key: (
-            dict[str, dict[str, list[tuple[str, dict[str, str]]]]] | None
+            dict[str, dict[str, list[tuple[str, tuple[tuple[str, str], ...]]]]] | None
         ) = None
 
     @core_callback
@@ -270,28 +270,45 @@ class IntegrationMatchers:
         Here we convert the primary match keys into their own
         dicts so we can do lookups of the primary match
         key to find the match dict.
+
+        Each matcher is only indexed by the first primary match key
+        it has, as all of its keys have to match anyway. The other
+        keys of the matcher are kept to be compared on a lookup.
         """
         self._match_by_key = {}
-        for key in PRIMARY_MATCH_KEYS:
-            matchers_by_key = self._match_by_key[key] = {}
-            for domain, matchers in integration_matchers.items():
-                for matcher in matchers:
+        for domain, matchers in integration_matchers.items():
+            for matcher in matchers:
+                for key in PRIMARY_MATCH_KEYS:
                     if match_value := matcher.get(key):
-                        matchers_by_key.setdefault(match_value, []).append(
-                            (domain, matcher)
-                        )
+                        break
+                else:
+                    continue
+                self._match_by_key.setdefault(key, {}).setdefault(
+                    match_value, []
+                ).append(
+                    (
+                        domain,
+                        tuple(item for item in matcher.items() if item[0] != key),
+                    )
+                )
 
     @core_callback
     def async_matching_domains(self, info_with_desc: CaseInsensitiveDict) -> set[str]:
         """Find domains matching the passed CaseInsensitiveDict."""
         assert self._match_by_key is not None
-        return {
-            domain
-            for key, matchers_by_key in self._match_by_key.items()
-            if (match_value := info_with_desc.get(key))
-            for domain, matcher in matchers_by_key.get(match_value, ())
-            if info_with_desc.items() >= matcher.items()
-        }
+        domains: set[str] = set()
+        for key, matchers_by_key in self._match_by_key.items():
+            if not (match_value := info_with_desc.get(key)) or not (
+                matchers := matchers_by_key.get(match_value)
+            ):
+                continue
+            for domain, other_items in matchers:
+                if domain not in domains and all(
+                    info_with_desc.get(other_key) == other_value
+                    for other_key, other_value in other_items
+                ):
+                    domains.add(domain)
+        return domains
 
 
 class Scanner:
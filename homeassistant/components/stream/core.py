@@ -77,8 +77,8 @@ class Part:
 
     duration: float
     has_keyframe: bool
-    # video data (moof+mdat)
-    data: bytes
+    # video data (moof+mdat), a view of the segment data once it is complete
+    data: bytes | memoryview
 
 
 @dataclass(slots=True)
@@ -102,6 +102,8 @@ class Segment:
     hls_num_parts_rendered: int = 0
     # Set to true when all the parts are rendered
     hls_playlist_complete: bool = False
+    # Data of all parts of the complete segment, shared by all requests
+    _data: bytes | None = field(default=None, init=False)
 
     def __post_init__(self) -> None:
         """Run after init."""
@@ -121,6 +123,8 @@ class Segment:
     @property
     def data_size(self) -> int:
         """Return the size of all part data without init in bytes."""
+        if self._data is not None:
+            return len(self._data)
         return sum(len(part.data) for part in self.parts)
 
     @callback
@@ -135,13 +139,34 @@ class Segment:
         """
         self.parts.append(part)
         self.duration = duration
+        if duration:
+            self._join_data()
         for output in self._stream_outputs:
             output.part_put()
 
     def get_data(self) -> bytes:
         """Return reconstructed data for all parts as bytes, without init."""
+        if self._data is not None:
+            return self._data
+        if self.complete:
+            return self._join_data()
         return b"".join([part.data for part in self.parts])
 
+    def _join_data(self) -> bytes:
+        """Join the data of the parts of the complete segment once.
+
+        The parts are changed to views of the joined data, so the data of
+        the segment is only kept once.
+        """
+        self._data = data = b"".join([part.data for part in self.parts])
+        view = memoryview(data)
+        start = 0
+        for part in self.parts:
+            end = start + len(part.data)
+            part.data = view[start:end]
+            start = end
+        return data
+
     def _render_hls_template(self, last_stream_id: int, render_parts: bool) -> str:
         """Render the HLS playlist section for the Segment.
 
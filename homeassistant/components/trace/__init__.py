@@ -16,13 +16,23 @@ from homeassistant.helpers.typing import ConfigType
 
 from . import websocket_api
 from .const import (
+    CONF_SAMPLE_INTERVAL,
     CONF_STORED_TRACES,
+    CONF_TRACE_MODE,
     DATA_TRACE,
+    DATA_TRACE_CONFIG,
+    DATA_TRACE_SAMPLES,
     DATA_TRACE_STORE,
+    DEFAULT_SAMPLE_INTERVAL,
     DEFAULT_STORED_TRACES,
+    DEFAULT_TRACE_MODE,
+    TRACE_MODE_ALWAYS,
+    TRACE_MODE_OFF,
+    TRACE_MODE_ON_ERROR,
+    TRACE_MODES,
 )
 from .models import ActionTrace
-from .util import async_store_trace
+from .util import async_get_trace_mode, async_remove_trace_samples, async_store_trace
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,15 +42,35 @@ STORAGE_KEY = "trace.saved_traces"
 STORAGE_VERSION = 1
 
 TRACE_CONFIG_SCHEMA = {
-    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int
+    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int,
+    # The trace mode and sample interval default to the global trace config
+    vol.Optional(CONF_TRACE_MODE): vol.In(TRACE_MODES),
+    vol.Optional(CONF_SAMPLE_INTERVAL): cv.positive_int,
 }
 
-CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
+GLOBAL_TRACE_CONFIG_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_TRACE_MODE, default=DEFAULT_TRACE_MODE): vol.In(TRACE_MODES),
+        vol.Optional(
+            CONF_SAMPLE_INTERVAL, default=DEFAULT_SAMPLE_INTERVAL
+        ): cv.positive_int,
+    }
+)
+
+CONFIG_SCHEMA = vol.Schema(
+    {vol.Optional(DOMAIN): vol.Any(None, GLOBAL_TRACE_CONFIG_SCHEMA)},
+    extra=vol.ALLOW_EXTRA,
+)
 
 __all__ = [
     "CONF_STORED_TRACES",
     "TRACE_CONFIG_SCHEMA",
+    "TRACE_MODE_ALWAYS",
+    "TRACE_MODE_OFF",
+    "TRACE_MODE_ON_ERROR",
     "ActionTrace",
+    "async_get_trace_mode",
+    "async_remove_trace_samples",
     "async_store_trace",
 ]
 
@@ -48,6 +78,8 @@ __all__ = [
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Initialize the trace integration."""
     hass.data[DATA_TRACE] = {}
+    hass.data[DATA_TRACE_CONFIG] = config.get(DOMAIN) or GLOBAL_TRACE_CONFIG_SCHEMA({})
+    hass.data[DATA_TRACE_SAMPLES] = {}
     websocket_api.async_setup(hass)
     store = Store[dict[str, list]](
         hass, STORAGE_VERSION, STORAGE_KEY, encoder=ExtendedJSONEncoder
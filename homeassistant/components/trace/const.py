@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.util.hass_dict import HassKey
 
@@ -12,8 +12,25 @@ if TYPE_CHECKING:
     from .models import TraceData
 
 
+CONF_SAMPLE_INTERVAL = "sample_interval"
 CONF_STORED_TRACES = "stored_traces"
+CONF_TRACE_MODE = "mode"
 DATA_TRACE: HassKey[TraceData] = HassKey("trace")
+DATA_TRACE_CONFIG: HassKey[dict[str, Any]] = HassKey("trace_config")
+DATA_TRACE_SAMPLES: HassKey[dict[str, int]] = HassKey("trace_samples")
 DATA_TRACE_STORE: HassKey[Store[dict[str, list]]] = HassKey("trace_store")
 DATA_TRACES_RESTORED: HassKey[bool] = HassKey("trace_traces_restored")
 DEFAULT_STORED_TRACES = 5  # Stored traces per script or automation
+DEFAULT_SAMPLE_INTERVAL = 10  # Trace one out of this many runs when sampling
+
+TRACE_MODE_ALWAYS = "always"
+TRACE_MODE_ON_ERROR = "on_error"
+TRACE_MODE_SAMPLED = "sampled"
+TRACE_MODE_OFF = "off"
+TRACE_MODES = [
+    TRACE_MODE_ALWAYS,
+    TRACE_MODE_ON_ERROR,
+    TRACE_MODE_SAMPLED,
+    TRACE_MODE_OFF,
+]
+DEFAULT_TRACE_MODE = TRACE_MODE_ALWAYS
@@ -13,7 +13,8 @@ from homeassistant.helpers.trace import (
     script_execution_get,
     trace_id_get,
     trace_id_set,
-    trace_set_child_id,
+    trace_stack_cv,
+    trace_stack_top,
 )
 import homeassistant.util.dt as dt_util
 from homeassistant.util.limited_size_dict import LimitedSizeDict
@@ -71,14 +72,27 @@ class ActionTrace(BaseTrace):
         self.key = f"{self._domain}.{item_id}"
         self._dict: dict[str, Any] | None = None
         self._short_dict: dict[str, Any] | None = None
-        if trace_id_get():
-            trace_set_child_id(self.key, self.run_id)
+        # The step of the parent run this run was started by, it is linked to
+        # this run once the trace is stored
+        self._parent_element: TraceElement | None = (
+            trace_stack_top(trace_stack_cv) if trace_id_get() else None
+        )
         trace_id_set((self.key, self.run_id))
 
+    def link_to_parent(self) -> None:
+        """Link the step of the parent run which started this run to it."""
+        if self._parent_element is not None:
+            self._parent_element.set_child_id(self.key, self.run_id)
+
     def set_trace(self, trace: dict[str, deque[TraceElement]] | None) -> None:
         """Set action trace."""
         self._trace = trace
 
+    @property
+    def error(self) -> Exception | None:
+        """Return the error of the run, if any."""
+        return self._error
+
     def set_error(self, ex: Exception) -> None:
         """Set error."""
         self._error = ex
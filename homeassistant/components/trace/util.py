@@ -6,11 +6,22 @@ from collections.abc import Mapping
 import logging
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.util.limited_size_dict import LimitedSizeDict
 
-from .const import DATA_TRACE, DATA_TRACE_STORE, DATA_TRACES_RESTORED
+from .const import (
+    CONF_SAMPLE_INTERVAL,
+    CONF_TRACE_MODE,
+    DATA_TRACE,
+    DATA_TRACE_CONFIG,
+    DATA_TRACE_SAMPLES,
+    DATA_TRACE_STORE,
+    DATA_TRACES_RESTORED,
+    TRACE_MODE_ALWAYS,
+    TRACE_MODE_OFF,
+    TRACE_MODE_SAMPLED,
+)
 from .models import ActionTrace, BaseTrace, RestoredTrace, TraceData
 
 _LOGGER = logging.getLogger(__name__)
@@ -78,10 +89,39 @@ async def async_list_traces(
     return traces
 
 
+@callback
+def async_get_trace_mode(
+    hass: HomeAssistant, key: str, trace_config: Mapping[str, Any]
+) -> str:
+    """Return how a run of the script or automation should be traced.
+
+    Sampling is resolved here, so the returned mode is one of
+    TRACE_MODE_ALWAYS, TRACE_MODE_ON_ERROR or TRACE_MODE_OFF.
+    """
+    global_config = hass.data[DATA_TRACE_CONFIG]
+    mode: str = trace_config.get(CONF_TRACE_MODE) or global_config[CONF_TRACE_MODE]
+    if mode != TRACE_MODE_SAMPLED:
+        return mode
+    interval: int = (
+        trace_config.get(CONF_SAMPLE_INTERVAL) or global_config[CONF_SAMPLE_INTERVAL]
+    )
+    samples = hass.data[DATA_TRACE_SAMPLES]
+    count = samples.get(key, 0)
+    samples[key] = (count + 1) % interval
+    return TRACE_MODE_ALWAYS if count == 0 else TRACE_MODE_OFF
+
+
+@callback
+def async_remove_trace_samples(hass: HomeAssistant, key: str) -> None:
+    """Forget the sampled runs of a removed script or automation."""
+    if (samples := hass.data.get(DATA_TRACE_SAMPLES)) is not None:
+        samples.pop(key, None)
+
+
 def async_store_trace(
     hass: HomeAssistant, trace: ActionTrace, stored_traces: int
 ) -> None:
-    """Store a trace if its key is valid."""
+    """Store a trace if its key is valid and link it to its parent run."""
     if key := trace.key:
         traces = hass.data[DATA_TRACE]
         if key not in traces:
@@ -89,6 +129,7 @@ def async_store_trace(
         else:
             traces[key].size_limit = stored_traces
         traces[key][trace.run_id] = trace
+    trace.link_to_parent()
 
 
 def _async_store_restored_trace(hass: HomeAssistant, trace: RestoredTrace) -> None:
@@ -12,13 +12,14 @@ import io
 import logging
 import mimetypes
 import os
+from pathlib import Path
 import re
 import secrets
 import subprocess
 import tempfile
 from typing import Any, Final, TypedDict, final
 
-from aiohttp import web
+from aiohttp import hdrs, web
 import mutagen
 from mutagen.id3 import ID3, TextFrame as ID3Text
 from propcache import cached_property
@@ -41,13 +42,20 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
-from homeassistant.core import HassJob, HomeAssistant, ServiceCall, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    HassJob,
+    HomeAssistant,
+    ServiceCall,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.network import get_url
 from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import UNDEFINED, ConfigType
 from homeassistant.util import dt as dt_util, language as language_util
 
@@ -123,6 +131,14 @@ _RE_VOICE_FILE = re.compile(
 )
 KEY_PATTERN = "{0}_{1}_{2}_{3}"
 
+# Voice data kept in memory is limited to this number of bytes
+MEM_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+STORAGE_KEY = f"{DOMAIN}.cache_index"
+STORAGE_VERSION = 1
+# Delay before changes of the file cache are written to the cache index
+INDEX_SAVE_DELAY = 60
+
 SCHEMA_SERVICE_CLEAR_CACHE = vol.Schema({})
 
 
@@ -131,7 +147,16 @@ class TTSCache(TypedDict):
 
     filename: str
     voice: bytes
-    pending: asyncio.Task | None
+    pending: asyncio.Task[bytes] | None
+
+
+class TTSCacheIndex(TypedDict):
+    """Index of the file cache."""
+
+    cache_dir: str
+    # Modification time of the cache folder matching the files of the index
+    cache_dir_mtime: int | None
+    files: dict[str, str]
 
 
 @callback
@@ -540,41 +565,96 @@ class SpeechManager:
         self.time_memory = time_memory
         self.file_cache: dict[str, str] = {}
         self.mem_cache: dict[str, TTSCache] = {}
+        self.mem_cache_max_bytes = MEM_CACHE_MAX_BYTES
+
+        # Size of the voice data in the memory cache and expiry of the entries
+        self._mem_cache_bytes = 0
+        self._mem_cache_expiry: dict[str, CALLBACK_TYPE] = {}
+
+        # Modification time of the cache folder matching the file cache, the
+        # folder is only scanned at startup when it differs from the index
+        self._cache_dir_mtime: int | None = None
+        self._index_store = Store[TTSCacheIndex](hass, STORAGE_VERSION, STORAGE_KEY)
 
         # filename <-> token
         self.filename_to_token: dict[str, str] = {}
         self.token_to_filename: dict[str, str] = {}
 
-    def _init_cache(self) -> dict[str, str]:
-        """Init cache folder and fetch files."""
+    def _init_cache(
+        self, index: TTSCacheIndex | None
+    ) -> tuple[dict[str, str], int | None, bool]:
+        """Init cache folder and fetch files.
+
+        The files are taken from the cache index if the cache folder was not
+        modified since the index was updated, otherwise the folder is scanned.
+        Returns the files, the modification time of the folder and if the
+        folder was scanned.
+        """
         try:
             self.cache_dir = _init_tts_cache_dir(self.hass, self.cache_dir)
         except OSError as err:
             raise HomeAssistantError(f"Can't init cache dir {err}") from err
 
+        cache_dir_mtime = _get_cache_dir_mtime(self.cache_dir)
+        if (
+            cache_dir_mtime is not None
+            and index is not None
+            and index["cache_dir"] == self.cache_dir
+            and index["cache_dir_mtime"] == cache_dir_mtime
+        ):
+            return index["files"], cache_dir_mtime, False
+
         try:
-            return _get_cache_files(self.cache_dir)
+            return _get_cache_files(self.cache_dir), cache_dir_mtime, True
         except OSError as err:
             raise HomeAssistantError(f"Can't read cache dir {err}") from err
 
     async def async_init_cache(self) -> None:
         """Init config folder and load file cache."""
-        self.file_cache.update(await self.hass.async_add_executor_job(self._init_cache))
+        index = await self._index_store.async_load()
+        files, self._cache_dir_mtime, scanned = await self.hass.async_add_executor_job(
+            self._init_cache, index
+        )
+        self.file_cache.update(files)
+        if scanned:
+            self._async_schedule_save_index()
+
+    @callback
+    def _async_schedule_save_index(self) -> None:
+        """Schedule saving the cache index."""
+        self._index_store.async_delay_save(self._data_to_save, INDEX_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> TTSCacheIndex:
+        """Return the cache index to store."""
+        return {
+            "cache_dir": self.cache_dir,
+            "cache_dir_mtime": self._cache_dir_mtime,
+            "files": dict(self.file_cache),
+        }
+
+    @callback
+    def _async_remove_from_file_cache(self, cache_key: str) -> None:
+        """Remove a file that no longer exists from the file cache."""
+        self.file_cache.pop(cache_key, None)
+        self._async_schedule_save_index()
 
     async def async_clear_cache(self) -> None:
         """Read file cache and delete files."""
-        self.mem_cache = {}
+        self._async_clear_mem_cache()
 
-        def remove_files() -> None:
-            """Remove files from filesystem."""
+        def remove_files() -> int | None:
+            """Remove files from filesystem and return the folder mtime."""
             for filename in self.file_cache.values():
                 try:
                     os.remove(os.path.join(self.cache_dir, filename))
                 except OSError as err:
                     _LOGGER.warning("Can't remove cache file '%s': %s", filename, err)
+            return _get_cache_dir_mtime(self.cache_dir)
 
-        await self.hass.async_add_executor_job(remove_files)
+        self._cache_dir_mtime = await self.hass.async_add_executor_job(remove_files)
         self.file_cache = {}
+        self._async_schedule_save_index()
 
     @callback
     def async_register_legacy_engine(
@@ -654,7 +734,6 @@ class SpeechManager:
         # Is file store in file cache
         elif use_cache and cache_key in self.file_cache:
             filename = self.file_cache[cache_key]
-            self.hass.async_create_task(self._async_file_to_mem(cache_key))
         # Load speech from engine into memory
         else:
             filename = await self._async_get_tts_audio(
@@ -690,20 +769,17 @@ class SpeechManager:
         use_cache = cache if cache is not None else self.use_cache
 
         # If we have the file, load it into memory if necessary
-        if cache_key not in self.mem_cache:
-            if use_cache and cache_key in self.file_cache:
-                await self._async_file_to_mem(cache_key)
-            else:
-                await self._async_get_tts_audio(
-                    engine_instance, cache_key, message, use_cache, language, options
-                )
+        if cache_key in self.mem_cache:
+            filename, voice = await self._async_read_memcache(cache_key)
+        elif use_cache and cache_key in self.file_cache:
+            filename, voice = await self._async_file_to_mem(cache_key)
+        else:
+            await self._async_get_tts_audio(
+                engine_instance, cache_key, message, use_cache, language, options
+            )
+            filename, voice = await self._async_read_memcache(cache_key)
 
-        extension = os.path.splitext(self.mem_cache[cache_key]["filename"])[1][1:]
-        cached = self.mem_cache[cache_key]
-        if pending := cached.get("pending"):
-            await pending
-            cached = self.mem_cache[cache_key]
-        return extension, cached["voice"]
+        return os.path.splitext(filename)[1][1:], voice
 
     @callback
     def _generate_cache_key(
@@ -773,7 +849,7 @@ class SpeechManager:
         if sample_bytes is not None:
             sample_bytes = int(sample_bytes)
 
-        async def get_tts_data() -> str:
+        async def get_tts_data() -> bytes:
             """Handle data available."""
             if engine_instance.name is None or engine_instance.name is UNDEFINED:
                 raise HomeAssistantError("TTS engine name is not set.")
@@ -837,14 +913,14 @@ class SpeechManager:
                     self._async_save_tts_audio(cache_key, filename, data)
                 )
 
-            return filename
+            return data
 
         audio_task = self.hass.async_create_task(get_tts_data(), eager_start=False)
 
         def handle_error(_future: asyncio.Future) -> None:
             """Handle error."""
             if audio_task.exception():
-                self.mem_cache.pop(cache_key, None)
+                self._async_remove_from_memcache(cache_key)
 
         audio_task.add_done_callback(handle_error)
 
@@ -865,19 +941,22 @@ class SpeechManager:
         """
         voice_file = os.path.join(self.cache_dir, filename)
 
-        def save_speech() -> None:
-            """Store speech to filesystem."""
+        def save_speech() -> int | None:
+            """Store speech to filesystem and return the folder mtime."""
             with open(voice_file, "wb") as speech:
                 speech.write(data)
+            return _get_cache_dir_mtime(self.cache_dir)
 
         try:
-            await self.hass.async_add_executor_job(save_speech)
+            cache_dir_mtime = await self.hass.async_add_executor_job(save_speech)
             self.file_cache[cache_key] = filename
+            self._cache_dir_mtime = cache_dir_mtime
+            self._async_schedule_save_index()
         except OSError as err:
             _LOGGER.error("Can't write %s: %s", filename, err)
 
-    async def _async_file_to_mem(self, cache_key: str) -> None:
-        """Load voice from file cache into memory.
+    async def _async_file_to_mem(self, cache_key: str) -> tuple[str, bytes]:
+        """Load voice from file cache into memory and return filename and voice.
 
         This method is a coroutine.
         """
@@ -894,28 +973,46 @@ class SpeechManager:
         try:
             data = await self.hass.async_add_executor_job(load_speech)
         except OSError as err:
-            del self.file_cache[cache_key]
+            self._async_remove_from_file_cache(cache_key)
             raise HomeAssistantError(f"Can't read {voice_file}") from err
 
         self._async_store_to_memcache(cache_key, filename, data)
+        return filename, data
+
+    async def _async_read_memcache(self, cache_key: str) -> tuple[str, bytes]:
+        """Return filename and voice of a memcache entry, waiting if it is pending.
+
+        This method is a coroutine.
+        """
+        # Move the entry to the end of the least recently used order
+        cached = self.mem_cache[cache_key] = self.mem_cache.pop(cache_key)
+        if pending := cached["pending"]:
+            return cached["filename"], await pending
+        return cached["filename"], cached["voice"]
 
     @callback
     def _async_store_to_memcache(
         self, cache_key: str, filename: str, data: bytes
     ) -> None:
-        """Store data to memcache and set timer to remove it."""
+        """Store data to memcache and set timer to remove it.
+
+        The least recently used entries are removed when the voice data in
+        the memcache grows over its size limit.
+        """
+        self._async_remove_from_memcache(cache_key)
         self.mem_cache[cache_key] = {
             "filename": filename,
             "voice": data,
             "pending": None,
         }
+        self._mem_cache_bytes += len(data)
 
         @callback
         def async_remove_from_mem(_: datetime) -> None:
             """Cleanup memcache."""
-            self.mem_cache.pop(cache_key, None)
+            self._async_remove_from_memcache(cache_key)
 
-        async_call_later(
+        self._mem_cache_expiry[cache_key] = async_call_later(
             self.hass,
             self.time_memory,
             HassJob(
@@ -925,11 +1022,34 @@ class SpeechManager:
             ),
         )
 
-    async def async_read_tts(self, token: str) -> tuple[str | None, bytes]:
-        """Read a voice file and return binary.
+        if self._mem_cache_bytes <= self.mem_cache_max_bytes:
+            return
+        for lru_key, cached in list(self.mem_cache.items()):
+            if cached["pending"] is None:
+                self._async_remove_from_memcache(lru_key)
+                if self._mem_cache_bytes <= self.mem_cache_max_bytes:
+                    break
 
-        This method is a coroutine.
-        """
+    @callback
+    def _async_remove_from_memcache(self, cache_key: str) -> None:
+        """Remove an entry from the memcache."""
+        if cancel_expiry := self._mem_cache_expiry.pop(cache_key, None):
+            cancel_expiry()
+        if cached := self.mem_cache.pop(cache_key, None):
+            self._mem_cache_bytes -= len(cached["voice"])
+
+    @callback
+    def _async_clear_mem_cache(self) -> None:
+        """Remove all entries from the memcache."""
+        for cancel_expiry in self._mem_cache_expiry.values():
+            cancel_expiry()
+        self._mem_cache_expiry = {}
+        self.mem_cache = {}
+        self._mem_cache_bytes = 0
+
+    @callback
+    def _async_get_token_cache_key(self, token: str) -> tuple[str, str]:
+        """Return filename and cache key of a token."""
         filename = self.token_to_filename.get(token)
         if not filename:
             raise HomeAssistantError(f"{token} was not recognized!")
@@ -939,22 +1059,46 @@ class SpeechManager:
         ):
             raise HomeAssistantError("Wrong tts file format!")
 
-        cache_key = KEY_PATTERN.format(
+        return filename, KEY_PATTERN.format(
             record.group(1), record.group(2), record.group(3), record.group(4)
         )
 
-        if cache_key not in self.mem_cache:
-            if cache_key not in self.file_cache:
-                raise HomeAssistantError(f"{cache_key} not in cache!")
-            await self._async_file_to_mem(cache_key)
+    async def async_read_tts(self, token: str) -> tuple[str | None, bytes]:
+        """Read a voice file and return binary.
 
-        cached = self.mem_cache[cache_key]
-        if pending := cached.get("pending"):
-            await pending
-            cached = self.mem_cache[cache_key]
+        This method is a coroutine.
+        """
+        filename, cache_key = self._async_get_token_cache_key(token)
+
+        if cache_key in self.mem_cache:
+            _, voice = await self._async_read_memcache(cache_key)
+        elif cache_key in self.file_cache:
+            _, voice = await self._async_file_to_mem(cache_key)
+        else:
+            raise HomeAssistantError(f"{cache_key} not in cache!")
+
+        content, _ = mimetypes.guess_type(filename)
+        return content, voice
+
+    async def async_get_tts_source(self, token: str) -> tuple[str | None, bytes | Path]:
+        """Return the content type and the voice or the path of its cache file.
+
+        Voice that is only in the file cache is returned as the path of the
+        file, so it can be streamed from disk instead of read into memory.
+
+        This method is a coroutine.
+        """
+        filename, cache_key = self._async_get_token_cache_key(token)
+        if cache_key in self.mem_cache or cache_key not in self.file_cache:
+            return await self.async_read_tts(token)
+
+        voice_file = Path(self.cache_dir, self.file_cache[cache_key])
+        if not await self.hass.async_add_executor_job(voice_file.is_file):
+            self._async_remove_from_file_cache(cache_key)
+            raise HomeAssistantError(f"Can't read {voice_file}")
 
         content, _ = mimetypes.guess_type(filename)
-        return content, cached["voice"]
+        return content, voice_file
 
     @staticmethod
     def write_tags(
@@ -1019,6 +1163,14 @@ def _init_tts_cache_dir(hass: HomeAssistant, cache_dir: str) -> str:
     return cache_dir
 
 
+def _get_cache_dir_mtime(cache_dir: str) -> int | None:
+    """Return the modification time of the cache folder, None if unknown."""
+    try:
+        return os.stat(cache_dir).st_mtime_ns
+    except OSError:
+        return None
+
+
 def _get_cache_files(cache_dir: str) -> dict[str, str]:
     """Return a dict of given engine files."""
     cache = {}
@@ -1092,16 +1244,22 @@ class TextToSpeechView(HomeAssistantView):
         """Initialize a tts view."""
         self.tts = tts
 
-    async def get(self, request: web.Request, filename: str) -> web.Response:
+    async def get(self, request: web.Request, filename: str) -> web.StreamResponse:
         """Start a get request."""
         try:
             # filename is actually token, but we keep its name for compatibility
-            content, data = await self.tts.async_read_tts(filename)
+            content, source = await self.tts.async_get_tts_source(filename)
         except HomeAssistantError as err:
             _LOGGER.error("Error on load tts: %s", err)
             return web.Response(status=HTTPStatus.NOT_FOUND)
 
-        return web.Response(body=data, content_type=content)
+        if isinstance(source, Path):
+            # Stream the cache file instead of reading it into memory
+            return web.FileResponse(
+                source, headers={hdrs.CONTENT_TYPE: content} if content else None
+            )
+
+        return web.Response(body=source, content_type=content)
 
 
 @websocket_api.websocket_command(
@@ -326,13 +326,62 @@ async def _async_register_hass_zc_service(
     await aio_zc.async_register_service(info, allow_name_change=True)
 
 
-def _match_against_props(matcher: dict[str, str], props: dict[str, str | None]) -> bool:
-    """Check a matcher to ensure all values in props."""
-    for key, value in matcher.items():
-        prop_val = props.get(key)
-        if prop_val is None or not _memorized_fnmatch(prop_val.lower(), value):
-            return False
-    return True
+@dataclass(slots=True, frozen=True)
+class _CompiledZeroconfMatcher:
+    """Zeroconf matcher of an integration with its patterns compiled."""
+
+    domain: str
+    name: re.Pattern | None
+    properties: tuple[tuple[str, re.Pattern], ...]
+
+    def matches_properties(self, props: dict[str, str | None]) -> bool:
+        """Check the properties match all property patterns."""
+        for key, pattern in self.properties:
+            prop_val = props.get(key)
+            if prop_val is None or not pattern.match(prop_val.lower()):
+                return False
+        return True
+
+
+@dataclass(slots=True, frozen=True)
+class _ServiceTypeMatchers:
+    """Compiled zeroconf matchers of a service type."""
+
+    matchers: tuple[_CompiledZeroconfMatcher, ...]
+    # Any of the name patterns of the matchers, to reject a name with a
+    # single match instead of trying the pattern of each matcher
+    any_name: re.Pattern | None
+
+
+def _compile_zeroconf_matchers(
+    zeroconf_types: dict[str, list[ZeroconfMatcher]],
+) -> dict[str, _ServiceTypeMatchers]:
+    """Compile the zeroconf matchers of each service type."""
+    compiled: dict[str, _ServiceTypeMatchers] = {}
+    for service_type, matchers in zeroconf_types.items():
+        name_patterns: list[str] = []
+        compiled_matchers: list[_CompiledZeroconfMatcher] = []
+        for matcher in matchers:
+            name_pattern = matcher.get(ATTR_NAME)
+            if name_pattern is not None:
+                name_patterns.append(name_pattern)
+            compiled_matchers.append(
+                _CompiledZeroconfMatcher(
+                    matcher[ATTR_DOMAIN],
+                    None if name_pattern is None else _compile_fnmatch(name_pattern),
+                    tuple(
+                        (key, _compile_fnmatch(value))
+                        for key, value in matcher.get(ATTR_PROPERTIES, {}).items()
+                    ),
+                )
+            )
+        compiled[service_type] = _ServiceTypeMatchers(
+            tuple(compiled_matchers),
+            re.compile("|".join(translate(pattern) for pattern in name_patterns))
+            if name_patterns
+            else None,
+        )
+    return compiled
 
 
 def is_homekit_paired(props: dict[str, Any]) -> bool:
@@ -361,6 +410,7 @@ class ZeroconfDiscovery:
         self.hass = hass
         self.zeroconf = zeroconf
         self.zeroconf_types = zeroconf_types
+        self._compiled_matchers = _compile_zeroconf_matchers(zeroconf_types)
         self.homekit_model_lookups = homekit_model_lookups
         self.homekit_model_matchers = homekit_model_matchers
         self.async_service_browser: AsyncServiceBrowser | None = None
@@ -523,23 +573,25 @@ class ZeroconfDiscovery:
                 # discover it, we can stop here.
                 return
 
-        if not (matchers := self.zeroconf_types.get(service_type)):
-            return
-
         # Not all homekit types are currently used for discovery
         # so not all service type exist in zeroconf_types
-        for matcher in matchers:
-            if len(matcher) > 1:
-                if ATTR_NAME in matcher and not _memorized_fnmatch(
-                    info.name.lower(), matcher[ATTR_NAME]
-                ):
-                    continue
-                if ATTR_PROPERTIES in matcher and not _match_against_props(
-                    matcher[ATTR_PROPERTIES], props
-                ):
-                    continue
-
-            matcher_domain = matcher[ATTR_DOMAIN]
+        if not (type_matchers := self._compiled_matchers.get(service_type)):
+            return
+
+        lower_name = info.name.lower()
+        name_matches = (
+            type_matchers.any_name is None
+            or type_matchers.any_name.match(lower_name) is not None
+        )
+        for matcher in type_matchers.matchers:
+            if matcher.name is not None and (
+                not name_matches or not matcher.name.match(lower_name)
+            ):
+                continue
+            if matcher.properties and not matcher.matches_properties(props):
+                continue
+
+            matcher_domain = matcher.domain
             # Create a type annotated regular dict since this is a hot path and creating
             # a regular dict is slightly cheaper than calling ConfigFlowContext
             context: config_entries.ConfigFlowContext = {
@@ -659,18 +711,3 @@ def _truncate_location_name_to_valid(location_name: str) -> str:
 def _compile_fnmatch(pattern: str) -> re.Pattern:
     """Compile a fnmatch pattern."""
     return re.compile(translate(pattern))
-
-
-@lru_cache(maxsize=1024, typed=True)
-def _memorized_fnmatch(name: str, pattern: str) -> bool:
-    """Memorized version of fnmatch that has a larger lru_cache.
-
-    The default version of fnmatch only has a lru_cache of 256 entries.
-    With many devices we quickly reach that limit and end up compiling
-    the same pattern over and over again.
-
-    Zeroconf has its own memorized fnmatch with its own lru_cache
-    since the data is going to be relatively the same
-    since the devices will not change frequently
-    """
-    return bool(_compile_fnmatch(pattern).match(name))
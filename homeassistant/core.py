@@ -12,12 +12,14 @@ from collections.abc import (
     Callable,
     Collection,
     Coroutine,
+    Generator,
     Iterable,
     KeysView,
     Mapping,
     ValuesView,
 )
 import concurrent.futures
+from contextlib import contextmanager
 from dataclasses import dataclass
 import datetime
 import enum
@@ -2067,7 +2069,15 @@ class States(UserDict[str, State]):
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_states_data", "_reservations", "_bus", "_loop")
+    __slots__ = (
+        "_states",
+        "_states_data",
+        "_reservations",
+        "_bus",
+        "_loop",
+        "_batch_context",
+        "_batch_events",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2078,6 +2088,66 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        # Set while a batch of state changes is collected, see async_batch
+        self._batch_context: Context | None = None
+        self._batch_events: (
+            list[tuple[EventType[Any], Mapping[str, Any], Context | None, float | None]]
+            | None
+        ) = None
+
+    @contextmanager
+    def async_batch(self, context: Context | None = None) -> Generator[None]:
+        """Collect the state changes made in the block and fire them as one batch.
+
+        States are set immediately, but the state_changed and state_reported
+        events are only fired when the block is exited, in the order the states
+        were set. Listeners therefore see all states of the batch already set.
+        State changes without a context share the context of the batch.
+
+        Batches can be nested, the events are fired when the outermost batch
+        is exited.
+
+        The batch applies to the whole state machine, so the block must not
+        await. Otherwise the state changes of other tasks would be delayed and
+        given the context of the batch.
+
+        This method must be run in the event loop.
+        """
+        if self._batch_events is not None:
+            yield
+            return
+        events: list[
+            tuple[EventType[Any], Mapping[str, Any], Context | None, float | None]
+        ] = []
+        self._batch_context = context or Context()
+        self._batch_events = events
+        try:
+            yield
+        finally:
+            self._batch_context = None
+            self._batch_events = None
+            fire = self._bus.async_fire_internal
+            for event_type, event_data, event_context, time_fired in events:
+                fire(
+                    event_type, event_data, context=event_context, time_fired=time_fired
+                )
+
+    @callback
+    def async_set_many(
+        self,
+        states: Iterable[tuple[str, str, Mapping[str, Any] | None]],
+        force_update: bool = False,
+        context: Context | None = None,
+    ) -> None:
+        """Set the state of multiple entities as one batch.
+
+        States is an iterable of (entity_id, new_state, attributes) tuples.
+
+        This method must be run in the event loop.
+        """
+        with self.async_batch(context):
+            for entity_id, new_state, attributes in states:
+                self.async_set(entity_id, new_state, attributes, force_update, context)
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -2195,6 +2265,11 @@ class StateMachine:
             "old_state": old_state,
             "new_state": None,
         }
+        if (batch_events := self._batch_events) is not None:
+            batch_events.append(
+                (EVENT_STATE_CHANGED, state_changed_data, context, None)
+            )
+            return True
         self._bus.async_fire_internal(
             EVENT_STATE_CHANGED,
             state_changed_data,
@@ -2317,7 +2392,11 @@ class StateMachine:
             last_changed = None
         else:
             same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == attributes
+            # Entities tracking changes of their attributes pass the attributes
+            # of the current state when they have not changed
+            same_attr = (
+                old_state.attributes is attributes or old_state.attributes == attributes
+            )
             last_changed = old_state.last_changed if same_state else None
 
         # It is much faster to convert a timestamp to a utc datetime object
@@ -2333,8 +2412,12 @@ class StateMachine:
         # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
         now = dt_util.utc_from_timestamp(timestamp)
 
+        batch_events = self._batch_events
         if context is None:
-            context = Context(id=ulid_at_time(timestamp))
+            if batch_events is not None:
+                context = self._batch_context
+            else:
+                context = Context(id=ulid_at_time(timestamp))
 
         if same_state and same_attr:
             # mypy does not understand this is only possible if old_state is not None
@@ -2342,13 +2425,19 @@ class StateMachine:
             old_state.last_reported = now  # type: ignore[union-attr]
             old_state._cache["last_reported_timestamp"] = timestamp  # type: ignore[union-attr] # noqa: SLF001
             # Avoid creating an EventStateReportedData
+            state_reported_data = {
+                "entity_id": entity_id,
+                "old_last_reported": old_last_reported,
+                "new_state": old_state,
+            }
+            if batch_events is not None:
+                batch_events.append(
+                    (EVENT_STATE_REPORTED, state_reported_data, context, timestamp)
+                )
+                return
             self._bus.async_fire_internal(  # type: ignore[misc]
                 EVENT_STATE_REPORTED,
-                {
-                    "entity_id": entity_id,
-                    "old_last_reported": old_last_reported,
-                    "new_state": old_state,
-                },
+                state_reported_data,
                 context=context,
                 time_fired=timestamp,
             )
@@ -2381,6 +2470,11 @@ class StateMachine:
             "old_state": old_state,
             "new_state": state,
         }
+        if batch_events is not None:
+            batch_events.append(
+                (EVENT_STATE_CHANGED, state_changed_data, context, timestamp)
+            )
+            return
         self._bus.async_fire_internal(
             EVENT_STATE_CHANGED,
             state_changed_data,
@@ -9,6 +9,7 @@ from contextlib import contextmanager
 from datetime import datetime, time as dt_time, timedelta
 import functools as ft
 import logging
+from operator import attrgetter
 import re
 import sys
 from typing import Any, Protocol, cast
@@ -65,6 +66,7 @@ from .template import Template, render_complex
 from .trace import (
     TraceElement,
     trace_append_element,
+    trace_is_enabled,
     trace_path,
     trace_path_get,
     trace_stack_cv,
@@ -92,6 +94,20 @@ _PLATFORM_ALIASES = {
     "zone": None,
 }
 
+# Estimated relative cost of evaluating a condition. The parts of and, or and not
+# conditions are evaluated cheapest first, which is safe because their result
+# does not depend on the order in which the parts are evaluated.
+_CONDITION_COST = {
+    "state": 1,
+    "trigger": 1,
+    "numeric_state": 2,
+    "time": 2,
+    "zone": 2,
+    "sun": 3,
+    "template": 5,
+}
+_DEFAULT_CONDITION_COST = 4
+
 INPUT_ENTITY_ID = re.compile(
     r"^input_(?:select|text|number|boolean|datetime)\.(?!.+__)(?!_)[\da-z_]+(?<!_)$"
 )
@@ -151,8 +167,11 @@ def condition_trace_update_result(**kwargs: Any) -> None:
 
 
 @contextmanager
-def trace_condition(variables: TemplateVarsType) -> Generator[TraceElement]:
+def trace_condition(variables: TemplateVarsType) -> Generator[TraceElement | None]:
     """Trace condition evaluation."""
+    if not trace_is_enabled():
+        yield None
+        return
     should_pop = True
     trace_element = trace_stack_top(trace_stack_cv)
     if trace_element and trace_element.reuse_by_child:
@@ -177,6 +196,8 @@ def trace_condition_function(condition: ConditionCheckerType) -> ConditionChecke
     @ft.wraps(condition)
     def wrapper(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool | None:
         """Trace condition."""
+        if not trace_is_enabled():
+            return condition(hass, variables)
         with trace_condition(variables):
             result = condition(hass, variables)
             condition_trace_update_result(result=result)
@@ -258,11 +279,44 @@ async def async_from_config(
     return cast(ConditionCheckerType, factory(config))
 
 
+def _condition_cost(config: ConfigType) -> int:
+    """Estimate the relative cost of evaluating a condition."""
+    condition: str | None = config.get(CONF_CONDITION)
+    if condition in ("and", "or", "not"):
+        return sum(_condition_cost(entry) for entry in config["conditions"])
+    cost = (
+        _DEFAULT_CONDITION_COST
+        if condition is None
+        else _CONDITION_COST.get(condition, _DEFAULT_CONDITION_COST)
+    )
+    if CONF_VALUE_TEMPLATE in config and condition != "template":
+        cost += _CONDITION_COST["template"]
+    return cost
+
+
+async def _async_ordered_checks(
+    hass: HomeAssistant, configs: list[ConfigType], path: str
+) -> list[tuple[int, list[str], ConditionCheckerType]]:
+    """Create condition checkers ordered by their estimated cost.
+
+    Each checker is returned with its index in the config and its trace path.
+    Nested and/or conditions are kept as their own checker instead of being
+    merged into this one, as their trace element and error container are part
+    of the trace and the error of the run.
+    """
+    ordered = sorted(enumerate(configs), key=lambda entry: _condition_cost(entry[1]))
+    return [
+        (index, [path, str(index)], await async_from_config(hass, entry))
+        for index, entry in ordered
+    ]
+
+
 async def async_and_from_config(
     hass: HomeAssistant, config: ConfigType
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'AND'."""
-    checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    checks = await _async_ordered_checks(hass, config["conditions"], "conditions")
+    total = len(checks)
 
     @trace_condition_function
     def if_and_condition(
@@ -270,18 +324,19 @@ async def async_and_from_config(
     ) -> bool:
         """Test and condition."""
         errors = []
-        for index, check in enumerate(checks):
+        for index, path, check in checks:
             try:
-                with trace_path(["conditions", str(index)]):
+                with trace_path(path):
                     if check(hass, variables) is False:
                         return False
             except ConditionError as ex:
                 errors.append(
-                    ConditionErrorIndex("and", index=index, total=len(checks), error=ex)
+                    ConditionErrorIndex("and", index=index, total=total, error=ex)
                 )
 
         # Raise the errors if no check was false
         if errors:
+            errors.sort(key=attrgetter("index"))
             raise ConditionErrorContainer("and", errors=errors)
 
         return True
@@ -293,7 +348,8 @@ async def async_or_from_config(
     hass: HomeAssistant, config: ConfigType
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'OR'."""
-    checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    checks = await _async_ordered_checks(hass, config["conditions"], "conditions")
+    total = len(checks)
 
     @trace_condition_function
     def if_or_condition(
@@ -301,18 +357,19 @@ async def async_or_from_config(
     ) -> bool:
         """Test or condition."""
         errors = []
-        for index, check in enumerate(checks):
+        for index, path, check in checks:
             try:
-                with trace_path(["conditions", str(index)]):
+                with trace_path(path):
                     if check(hass, variables) is True:
                         return True
             except ConditionError as ex:
                 errors.append(
-                    ConditionErrorIndex("or", index=index, total=len(checks), error=ex)
+                    ConditionErrorIndex("or", index=index, total=total, error=ex)
                 )
 
         # Raise the errors if no check was true
         if errors:
+            errors.sort(key=attrgetter("index"))
             raise ConditionErrorContainer("or", errors=errors)
 
         return False
@@ -324,7 +381,8 @@ async def async_not_from_config(
     hass: HomeAssistant, config: ConfigType
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'NOT'."""
-    checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    checks = await _async_ordered_checks(hass, config["conditions"], "conditions")
+    total = len(checks)
 
     @trace_condition_function
     def if_not_condition(
@@ -332,18 +390,19 @@ async def async_not_from_config(
     ) -> bool:
         """Test not condition."""
         errors = []
-        for index, check in enumerate(checks):
+        for index, path, check in checks:
             try:
-                with trace_path(["conditions", str(index)]):
+                with trace_path(path):
                     if check(hass, variables):
                         return False
             except ConditionError as ex:
                 errors.append(
-                    ConditionErrorIndex("not", index=index, total=len(checks), error=ex)
+                    ConditionErrorIndex("not", index=index, total=total, error=ex)
                 )
 
         # Raise the errors if no check was true
         if errors:
+            errors.sort(key=attrgetter("index"))
             raise ConditionErrorContainer("not", errors=errors)
 
         return True
@@ -1084,27 +1143,24 @@ async def async_conditions_from_config(
     name: str,
 ) -> Callable[[TemplateVarsType], bool]:
     """AND all conditions."""
-    checks: list[ConditionCheckerType] = [
-        await async_from_config(hass, condition_config)
-        for condition_config in condition_configs
-    ]
+    checks = await _async_ordered_checks(hass, condition_configs, "condition")
+    total = len(checks)
 
     def check_conditions(variables: TemplateVarsType = None) -> bool:
         """AND all conditions."""
         errors: list[ConditionErrorIndex] = []
-        for index, check in enumerate(checks):
+        for index, path, check in checks:
             try:
-                with trace_path(["condition", str(index)]):
+                with trace_path(path):
                     if check(hass, variables) is False:
                         return False
             except ConditionError as ex:
                 errors.append(
-                    ConditionErrorIndex(
-                        "condition", index=index, total=len(checks), error=ex
-                    )
+                    ConditionErrorIndex("condition", index=index, total=total, error=ex)
                 )
 
         if errors:
+            errors.sort(key=attrgetter("index"))
             logger.warning(
                 "Error evaluating condition in '%s':\n%s",
                 name,
@@ -57,6 +57,7 @@ from homeassistant.exceptions import (
 from homeassistant.loader import async_suggest_report_issue, bind_hass
 from homeassistant.util import ensure_unique_string, slugify
 from homeassistant.util.frozen_dataclass_compat import FrozenOrThawed
+from homeassistant.util.read_only_dict import ReadOnlyDict
 
 from . import device_registry as dr, entity_registry as er, singleton
 from .device_registry import DeviceInfo, EventDeviceRegistryUpdatedData
@@ -344,6 +345,10 @@ class CachedProperties(type):
                 setattr(o, private_attr_name, val)
                 # Invalidate the cache of the cached property
                 o.__dict__.pop(name, None)
+                # Mark the state attributes as changed unless the property
+                # only affects the state value
+                if name not in o._state_value_properties:  # noqa: SLF001
+                    o._state_attributes_changed = True  # noqa: SLF001
 
             return _setter
 
@@ -514,6 +519,28 @@ class Entity(
     # Job type cache
     _job_types: dict[str, HassJobType] | None = None
 
+    # If True, the state attributes are only calculated again when they have been
+    # marked as changed, either by setting an _attr_ property which is not in
+    # _state_value_properties or by calling async_mark_state_attributes_changed.
+    # Entities which opt in must not return changing values from overridden
+    # attribute properties without marking the attributes as changed.
+    _track_state_attributes: bool = False
+    # Properties which only affect the state value and not the attributes
+    _state_value_properties: frozenset[str] = frozenset({"state"})
+    # Set when the state attributes may have changed since the last state write
+    _state_attributes_changed: bool = True
+    # The inputs and result of the last calculation of the state attributes
+    __state_attributes_cache: (
+        tuple[
+            bool,
+            er.RegistryEntry | None,
+            dr.DeviceEntry | None,
+            Mapping[str, Any] | None,
+            ReadOnlyDict[str, Any],
+        ]
+        | None
+    ) = None
+
     # StateInfo. Set by EntityPlatform by calling async_internal_added_to_hass
     # While not purely typed, it makes typehinting more useful for us
     # and removes the need for constant None checks or asserts.
@@ -1022,6 +1049,15 @@ class Entity(
             report_non_thread_safe_operation("async_write_ha_state")
         self._async_write_ha_state()
 
+    @callback
+    def async_mark_state_attributes_changed(self) -> None:
+        """Mark the state attributes as changed.
+
+        Only needed for entities with _track_state_attributes set which return
+        changed attributes from overridden properties.
+        """
+        self._state_attributes_changed = True
+
     def _stringify_state(self, available: bool) -> str:
         """Convert state to string."""
         if not available:
@@ -1143,6 +1179,25 @@ class Entity(
                 )
             return
 
+        if (
+            self._track_state_attributes
+            and not self._state_attributes_changed
+            and (cache := self.__state_attributes_cache) is not None
+        ):
+            available = self.available
+            if (
+                cache[0] is available
+                and cache[1] is entry
+                and cache[2] is self.device_entry
+                and cache[3] == self.__async_get_customize(hass, entity_id)
+            ):
+                # Only the state value may have changed, reuse the attributes
+                # of the current state to skip calculating and comparing them
+                self.__async_set_state(
+                    hass, entity_id, self._stringify_state(available), cache[4]
+                )
+                return
+
         state_calculate_start = timer()
         state, attr, capabilities, original_device_class, supported_features = (
             self.__async_calculate_state()
@@ -1203,6 +1258,28 @@ class Entity(
                 report_issue,
             )
 
+        # Overwrite properties that have been set in the config file.
+        if custom := self.__async_get_customize(hass, entity_id):
+            attr.update(custom)
+
+        if not self.__async_set_state(hass, entity_id, state, attr, time_now):
+            return
+
+        if self._track_state_attributes:
+            self._state_attributes_changed = False
+            self.__state_attributes_cache = (
+                self.available,
+                entry,
+                self.device_entry,
+                custom,
+                hass.states._states_data[entity_id].attributes,  # noqa: SLF001
+            )
+
+    @staticmethod
+    def __async_get_customize(
+        hass: HomeAssistant, entity_id: str
+    ) -> Mapping[str, Any] | None:
+        """Return the attributes set for the entity in the config file."""
         try:
             # Most of the time this will already be
             # set and since try is near zero cost
@@ -1210,11 +1287,23 @@ class Entity(
             # set and catch the exception if it is not.
             customize = hass.data[DATA_CUSTOMIZE]
         except KeyError:
-            pass
-        else:
-            # Overwrite properties that have been set in the config file.
-            if custom := customize.get(entity_id):
-                attr.update(custom)
+            return None
+        return customize.get(entity_id)
+
+    def __async_set_state(
+        self,
+        hass: HomeAssistant,
+        entity_id: str,
+        state: str,
+        attr: Mapping[str, Any],
+        time_now: float | None = None,
+    ) -> bool:
+        """Set the state in the state machine.
+
+        Returns False if the state was invalid and unknown was set instead.
+        """
+        if time_now is None:
+            time_now = timer()
 
         if (
             self._context_set is not None
@@ -1240,6 +1329,9 @@ class Entity(
             hass.states.async_set(
                 entity_id, STATE_UNKNOWN, {}, self.force_update, self._context
             )
+            self._state_attributes_changed = True
+            return False
+        return True
 
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable, Coroutine, Iterable
+from collections.abc import Awaitable, Callable, Coroutine, Hashable, Iterable
 from contextvars import ContextVar
 from datetime import timedelta
 from logging import Logger, getLogger
@@ -47,6 +47,8 @@ from . import (
 from .entity_registry import EntityRegistry, RegistryEntryDisabler, RegistryEntryHider
 from .event import async_call_later
 from .issue_registry import IssueSeverity, async_create_issue
+from .polling import PollingRefresh, async_get_polling_scheduler
+from .registry import async_batch_saves
 from .typing import UNDEFINED, ConfigType, DiscoveryInfoType, VolDictType, VolSchemaType
 
 if TYPE_CHECKING:
@@ -151,6 +153,7 @@ class EntityPlatform:
         self._setup_complete = False
         # Method to cancel the state change listener
         self._async_polling_timer: asyncio.TimerHandle | None = None
+        self._polling_refresh: PollingRefresh | None = None
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
         self._process_updates: asyncio.Lock | None = None
@@ -636,11 +639,16 @@ class EntityPlatform:
 
         hass = self.hass
         entity_registry = ent_reg.async_get(hass)
+        # Devices created or updated from equal device info by earlier entities
+        # of this call, entities of the same device often share the device info
+        device_ids: dict[Hashable, str] = {}
         coros: list[Coroutine[Any, Any, None]] = []
         entities: list[Entity] = []
         for entity in new_entities:
             coros.append(
-                self._async_add_entity(entity, update_before_add, entity_registry)
+                self._async_add_entity(
+                    entity, update_before_add, entity_registry, device_ids
+                )
             )
             entities.append(entity)
 
@@ -654,7 +662,9 @@ class EntityPlatform:
         else:
             add_func = self._async_add_entities
 
-        await add_func(coros, entities, timeout)
+        # Schedule saving the registries once after the entities are added
+        with async_batch_saves():
+            await add_func(coros, entities, timeout)
 
         if (
             (self.config_entry and self.config_entry.pref_disable_polling)
@@ -672,31 +682,63 @@ class EntityPlatform:
         ):
             return
 
-        self._async_polling_timer = self.hass.loop.call_later(
-            self.scan_interval_seconds,
-            self._async_handle_interval_callback,
+        scheduler = async_get_polling_scheduler(self.hass)
+        self._async_schedule_polling(
+            self.scan_interval_seconds
+            + scheduler.async_startup_jitter(
+                f"{self.domain}.{self.platform_name}-"
+                f"{self.config_entry.entry_id if self.config_entry else ''}",
+                self.scan_interval_seconds,
+            )
+        )
+
+    @callback
+    def _async_schedule_polling(self, delay: float) -> None:
+        """Schedule the next poll of the entities."""
+        loop = self.hass.loop
+        self._async_polling_timer = loop.call_later(
+            delay, self._async_handle_interval_callback
+        )
+        if self._polling_refresh is None:
+            self._polling_refresh = PollingRefresh(
+                f"{self.domain}.{self.platform_name}",
+                self.platform_name,
+                self.scan_interval_seconds,
+            )
+        async_get_polling_scheduler(self.hass).async_schedule(
+            self._polling_refresh, loop.time() + delay
         )
 
     @callback
     def _async_handle_interval_callback(self) -> None:
         """Update all the entity states in a single platform."""
-        self._async_polling_timer = self.hass.loop.call_later(
-            self.scan_interval_seconds,
-            self._async_handle_interval_callback,
-        )
+        # Start the poll before scheduling the next one, the scheduler reads
+        # the time the poll was due when it starts
         if self.config_entry:
             self.config_entry.async_create_background_task(
                 self.hass,
-                self._async_update_entity_states(),
+                self._async_poll(),
                 name=f"EntityPlatform poll {self.domain}.{self.platform_name}",
                 eager_start=True,
             )
         else:
             self.hass.async_create_background_task(
-                self._async_update_entity_states(),
+                self._async_poll(),
                 name=f"EntityPlatform poll {self.domain}.{self.platform_name}",
                 eager_start=True,
             )
+        # Polling may have been stopped while the poll started
+        if self._async_polling_timer is not None:
+            self._async_schedule_polling(self.scan_interval_seconds)
+
+    async def _async_poll(self) -> None:
+        """Update the entity states within the limits of the polling scheduler."""
+        if TYPE_CHECKING:
+            assert self._polling_refresh is not None
+        async with async_get_polling_scheduler(self.hass).async_run(
+            self._polling_refresh
+        ):
+            await self._async_update_entity_states()
 
     def _entity_id_already_exists(self, entity_id: str) -> tuple[bool, bool]:
         """Check if an entity_id already exists.
@@ -719,6 +761,7 @@ class EntityPlatform:
         entity: Entity,
         update_before_add: bool,
         entity_registry: EntityRegistry,
+        device_ids: dict[Hashable, str] | None = None,
     ) -> None:
         """Add an entity to the platform."""
         if entity is None:
@@ -776,10 +819,7 @@ class EntityPlatform:
 
             if self.config_entry and (device_info := entity.device_info):
                 try:
-                    device = dev_reg.async_get(self.hass).async_get_or_create(
-                        config_entry_id=self.config_entry.entry_id,
-                        **device_info,
-                    )
+                    device = self._async_get_or_create_device(device_info, device_ids)
                 except dev_reg.DeviceInfoError as exc:
                     self.logger.error(
                         "%s: Not adding entity with invalid device info: %s",
@@ -926,6 +966,42 @@ class EntityPlatform:
 
         await entity.add_to_platform_finish()
 
+    @callback
+    def _async_get_or_create_device(
+        self, device_info: dev_reg.DeviceInfo, device_ids: dict[Hashable, str] | None
+    ) -> dev_reg.DeviceEntry:
+        """Get or create the device of an entity.
+
+        Devices already created from equal device info are looked up by id.
+        """
+        if TYPE_CHECKING:
+            assert self.config_entry is not None
+        device_registry = dev_reg.async_get(self.hass)
+        key: Hashable | None = None
+        if device_ids is not None:
+            try:
+                # Device info built by the same code has the same key order
+                key = tuple(
+                    (name, frozenset(value) if type(value) is set else value)
+                    for name, value in device_info.items()
+                )
+                hash(key)
+            except TypeError:
+                key = None
+            else:
+                if (device_id := device_ids.get(key)) is not None and (
+                    device := device_registry.async_get(device_id)
+                ) is not None:
+                    return device
+        device = device_registry.async_get_or_create(
+            config_entry_id=self.config_entry.entry_id, **device_info
+        )
+        if key is not None:
+            if TYPE_CHECKING:
+                assert device_ids is not None
+            device_ids[key] = device.id
+        return device
+
     async def async_reset(self) -> None:
         """Remove all entities and reset data.
 
@@ -957,6 +1033,10 @@ class EntityPlatform:
         if self._async_polling_timer is not None:
             self._async_polling_timer.cancel()
             self._async_polling_timer = None
+            if self._polling_refresh is not None:
+                async_get_polling_scheduler(self.hass).async_unschedule(
+                    self._polling_refresh
+                )
 
     @callback
     def async_prepare(self) -> None:
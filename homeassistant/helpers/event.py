@@ -6,7 +6,7 @@ import asyncio
 from collections import defaultdict
 from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
 import copy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from functools import partial, wraps
 import logging
@@ -75,6 +75,9 @@ _TRACK_ENTITY_REGISTRY_UPDATED_DATA: HassKey[
 _TRACK_DEVICE_REGISTRY_UPDATED_DATA: HassKey[
     _KeyedEventData[EventDeviceRegistryUpdatedData]
 ] = HassKey("track_device_registry_updated_data")
+_TRACK_TIME_PATTERN_DATA: HassKey[dict[_TimePatternKey, _TrackUTCTimeChange]] = HassKey(
+    "track_time_pattern_data"
+)
 
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
@@ -1788,14 +1791,37 @@ time_tracker_utcnow = dt_util.utcnow
 time_tracker_timestamp = time.time
 
 
+type _TimePatternKey = tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...], bool]
+
+
+@dataclass(slots=True, frozen=True)
+class ScheduledTimeChange:
+    """A time pattern scheduled by async_track_utc_time_change."""
+
+    hours: tuple[int, ...]
+    minutes: tuple[int, ...]
+    seconds: tuple[int, ...]
+    local: bool
+    next_fire: datetime
+    listeners: int
+
+
 @dataclass(slots=True)
 class _TrackUTCTimeChange:
+    """Track a time pattern shared by all listeners using the same pattern.
+
+    The next fire time is calculated once per pattern and all listeners are
+    run from a single timer.
+    """
+
     hass: HomeAssistant
-    time_match_expression: tuple[list[int], list[int], list[int]]
+    key: _TimePatternKey
     microsecond: int
-    local: bool
-    job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
     listener_job_name: str
+    jobs: dict[HassJob[[datetime], Coroutine[Any, Any, None] | None], None] = field(
+        default_factory=dict
+    )
+    next_fire: datetime | None = None
     _pattern_time_change_listener_job: HassJob[[datetime], None] | None = None
     _cancel_callback: CALLBACK_TYPE | None = None
 
@@ -1806,17 +1832,23 @@ class _TrackUTCTimeChange:
             self.listener_job_name,
             job_type=HassJobType.Callback,
         )
+        self._async_schedule(dt_util.utcnow())
+
+    def _async_schedule(self, utc_now: datetime) -> None:
+        """Schedule the timer at the next time matching the pattern."""
+        if TYPE_CHECKING:
+            assert self._pattern_time_change_listener_job is not None
+        self.next_fire = self._calculate_next(utc_now)
         self._cancel_callback = async_track_point_in_utc_time(
-            self.hass,
-            self._pattern_time_change_listener_job,
-            self._calculate_next(dt_util.utcnow()),
+            self.hass, self._pattern_time_change_listener_job, self.next_fire
         )
 
     def _calculate_next(self, utc_now: datetime) -> datetime:
         """Calculate and set the next time the trigger should fire."""
-        localized_now = dt_util.as_local(utc_now) if self.local else utc_now
+        seconds, minutes, hours, local = self.key
+        localized_now = dt_util.as_local(utc_now) if local else utc_now
         return dt_util.find_next_time_expression_time(
-            localized_now, *self.time_match_expression
+            localized_now, list(seconds), list(minutes), list(hours)
         ).replace(microsecond=self.microsecond)
 
     @callback
@@ -1826,22 +1858,57 @@ class _TrackUTCTimeChange:
         # Fetch time again because we want the actual time, not the
         # time when the timer was scheduled
         utc_now = time_tracker_utcnow()
-        localized_now = dt_util.as_local(utc_now) if self.local else utc_now
-        if TYPE_CHECKING:
-            assert self._pattern_time_change_listener_job is not None
-        self._cancel_callback = async_track_point_in_utc_time(
-            hass,
-            self._pattern_time_change_listener_job,
-            self._calculate_next(utc_now + timedelta(seconds=1)),
-        )
-        hass.async_run_hass_job(self.job, localized_now, background=True)
+        localized_now = dt_util.as_local(utc_now) if self.key[3] else utc_now
+        self._async_schedule(utc_now + timedelta(seconds=1))
+        jobs = self.jobs
+        # Copy the jobs, a listener may remove other listeners of the pattern
+        for job in list(jobs):
+            if job not in jobs:
+                continue
+            try:
+                hass.async_run_hass_job(job, localized_now, background=True)
+            except Exception:
+                _LOGGER.exception(
+                    "Error while dispatching time pattern change to %s", job
+                )
 
     @callback
-    def async_cancel(self) -> None:
-        """Cancel the call_at."""
+    def async_remove_job(
+        self, job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
+    ) -> None:
+        """Remove a listener and cancel the timer if it was the last one."""
+        if job not in self.jobs:
+            return
+        del self.jobs[job]
+        if self.jobs:
+            return
         if TYPE_CHECKING:
             assert self._cancel_callback is not None
         self._cancel_callback()
+        trackers = self.hass.data[_TRACK_TIME_PATTERN_DATA]
+        if trackers.get(self.key) is self:
+            del trackers[self.key]
+
+
+@callback
+def async_get_scheduled_time_changes(
+    hass: HomeAssistant,
+) -> list[ScheduledTimeChange]:
+    """Return the time patterns being tracked, ordered by their next fire time."""
+    scheduled = [
+        ScheduledTimeChange(
+            hours=track.key[2],
+            minutes=track.key[1],
+            seconds=track.key[0],
+            local=track.key[3],
+            next_fire=track.next_fire,
+            listeners=len(track.jobs),
+        )
+        for track in hass.data.get(_TRACK_TIME_PATTERN_DATA, {}).values()
+        if track.next_fire is not None
+    ]
+    scheduled.sort(key=lambda item: item.next_fire)
+    return scheduled
 
 
 @callback
@@ -1869,24 +1936,27 @@ def async_track_utc_time_change(
         return async_track_time_interval(hass, action, timedelta(seconds=1))
 
     job = HassJob(action, f"track time change {hour}:{minute}:{second} local={local}")
-    matching_seconds = dt_util.parse_time_expression(second, 0, 59)
-    matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
-    matching_hours = dt_util.parse_time_expression(hour, 0, 23)
-    # Avoid aligning all time trackers to the same fraction of a second
-    # since it can create a thundering herd problem
-    # https://github.com/home-assistant/core/issues/82231
-    microsecond = randint(RANDOM_MICROSECOND_MIN, RANDOM_MICROSECOND_MAX)
-    listener_job_name = f"time change listener {hour}:{minute}:{second} {action}"
-    track = _TrackUTCTimeChange(
-        hass,
-        (matching_seconds, matching_minutes, matching_hours),
-        microsecond,
+    key: _TimePatternKey = (
+        tuple(dt_util.parse_time_expression(second, 0, 59)),
+        tuple(dt_util.parse_time_expression(minute, 0, 59)),
+        tuple(dt_util.parse_time_expression(hour, 0, 23)),
         local,
-        job,
-        listener_job_name,
     )
-    track.async_attach()
-    return track.async_cancel
+    trackers = hass.data.setdefault(_TRACK_TIME_PATTERN_DATA, {})
+    # Listeners with the same pattern share one tracker so the next fire
+    # time is only calculated and scheduled once
+    if (track := trackers.get(key)) is None:
+        # Avoid aligning all time trackers to the same fraction of a second
+        # since it can create a thundering herd problem
+        # https://github.com/home-assistant/core/issues/82231
+        microsecond = randint(RANDOM_MICROSECOND_MIN, RANDOM_MICROSECOND_MAX)
+        listener_job_name = f"time change listener {hour}:{minute}:{second}"
+        track = trackers[key] = _TrackUTCTimeChange(
+            hass, key, microsecond, listener_job_name
+        )
+        track.async_attach()
+    track.jobs[job] = None
+    return partial(track.async_remove_job, job)
 
 
 track_utc_time_change = threaded_listener_factory(async_track_utc_time_change)
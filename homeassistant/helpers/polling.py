@@ -0,0 +1,165 @@
+"""Central scheduler for polling refreshes.
+
+Data update coordinators and polling entity platforms run their scheduled
+refreshes through the polling scheduler. The scheduler limits how many
+refreshes run at the same time, in total and per integration, and keeps a live
+view of the scheduled, late and overlapping refreshes.
+
+Refreshes scheduled while Home Assistant is starting are spread over their
+interval with a deterministic jitter, so the many refreshes set up at startup
+with the same interval do not keep firing in lockstep.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+from zlib import crc32
+
+from homeassistant.core import CoreState, HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .singleton import singleton
+
+DATA_POLLING_SCHEDULER: HassKey[PollingScheduler] = HassKey("polling_scheduler")
+
+MAX_CONCURRENT_REFRESHES = 64
+MAX_CONCURRENT_REFRESHES_PER_DOMAIN = 16
+# A refresh starting later than this after it was due is counted as late
+LATE_REFRESH_THRESHOLD = 1.0
+# Upper bound of the jitter added to refreshes scheduled during startup
+MAX_STARTUP_JITTER = 60.0
+
+
+@dataclass(slots=True, eq=False)
+class PollingRefresh:
+    """A refresh registered with the polling scheduler."""
+
+    name: str
+    domain: str
+    interval: float
+    # Loop time the next refresh is scheduled at
+    scheduled_at: float | None = None
+    # Number of runs of the refresh in progress
+    active: int = 0
+    last_started: float | None = None
+    last_duration: float | None = None
+    late_count: int = 0
+    overlap_count: int = 0
+
+
+class PollingScheduler:
+    """Limit and keep track of polling refreshes."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        max_concurrent: int = MAX_CONCURRENT_REFRESHES,
+        max_concurrent_per_domain: int = MAX_CONCURRENT_REFRESHES_PER_DOMAIN,
+    ) -> None:
+        """Initialize the polling scheduler."""
+        self.hass = hass
+        self._loop = hass.loop
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._max_concurrent_per_domain = max_concurrent_per_domain
+        self._domain_semaphores: dict[str, asyncio.Semaphore] = {}
+        self._refreshes: dict[PollingRefresh, None] = {}
+
+    @callback
+    def async_startup_jitter(self, key: str, interval: float) -> float:
+        """Return the delay to add to a refresh scheduled during startup.
+
+        The delay is derived from the key, so a refresh is spread to the same
+        offset in its interval on every start.
+        """
+        if self.hass.state is CoreState.running:
+            return 0.0
+        return crc32(key.encode()) / 0x100000000 * min(interval, MAX_STARTUP_JITTER)
+
+    @callback
+    def async_schedule(self, refresh: PollingRefresh, when: float) -> None:
+        """Record the loop time the next refresh is scheduled at."""
+        refresh.scheduled_at = when
+        self._refreshes[refresh] = None
+
+    @callback
+    def async_unschedule(self, refresh: PollingRefresh) -> None:
+        """Record the refresh is no longer scheduled."""
+        refresh.scheduled_at = None
+        if not refresh.active:
+            self._refreshes.pop(refresh, None)
+
+    @asynccontextmanager
+    async def async_run(self, refresh: PollingRefresh) -> AsyncGenerator[None]:
+        """Run a scheduled refresh within the concurrency limits."""
+        due = refresh.scheduled_at
+        refresh.scheduled_at = None
+        self._refreshes[refresh] = None
+        if refresh.active:
+            refresh.overlap_count += 1
+        refresh.active += 1
+        try:
+            if (
+                domain_semaphore := self._domain_semaphores.get(refresh.domain)
+            ) is None:
+                domain_semaphore = self._domain_semaphores[refresh.domain] = (
+                    asyncio.Semaphore(self._max_concurrent_per_domain)
+                )
+            # Wait for the domain first so a refresh waiting for its domain
+            # does not hold a slot of the total limit
+            async with domain_semaphore, self._semaphore:
+                started = self._loop.time()
+                if due is not None and started - due > LATE_REFRESH_THRESHOLD:
+                    refresh.late_count += 1
+                refresh.last_started = started
+                try:
+                    yield
+                finally:
+                    refresh.last_duration = self._loop.time() - started
+        finally:
+            refresh.active -= 1
+            if refresh.scheduled_at is None and not refresh.active:
+                self._refreshes.pop(refresh, None)
+
+    @callback
+    def async_get_refreshes(self) -> list[dict[str, Any]]:
+        """Return a view of the scheduled and running refreshes.
+
+        Refreshes are ordered by the time they are due.
+        """
+        now = self._loop.time()
+        refreshes = sorted(
+            self._refreshes,
+            key=lambda refresh: (
+                refresh.scheduled_at is None,
+                refresh.scheduled_at or 0.0,
+            ),
+        )
+        return [
+            {
+                "name": refresh.name,
+                "domain": refresh.domain,
+                "interval": refresh.interval,
+                "next_refresh_in": (
+                    None if refresh.scheduled_at is None else refresh.scheduled_at - now
+                ),
+                "running": refresh.active > 0,
+                "late": refresh.scheduled_at is not None
+                and now - refresh.scheduled_at > LATE_REFRESH_THRESHOLD,
+                "overlapping": refresh.active > 1,
+                "late_count": refresh.late_count,
+                "overlap_count": refresh.overlap_count,
+                "last_duration": refresh.last_duration,
+            }
+            for refresh in refreshes
+        ]
+
+
+@callback
+@singleton(DATA_POLLING_SCHEDULER)
+def async_get_polling_scheduler(hass: HomeAssistant) -> PollingScheduler:
+    """Get the polling scheduler."""
+    return PollingScheduler(hass)
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections import UserDict, defaultdict
-from collections.abc import Mapping, Sequence, ValuesView
+from collections.abc import Generator, Mapping, Sequence, ValuesView
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any, Literal
 
 from homeassistant.core import CoreState, HomeAssistant, callback
@@ -18,6 +20,41 @@ SAVE_DELAY_LONG = 180
 type RegistryIndexType = defaultdict[str, dict[str, Literal[True]]]
 
 
+class _SaveBatch:
+    """Registries changed while a batch of saves is open."""
+
+    __slots__ = ("open", "registries")
+
+    def __init__(self) -> None:
+        """Initialize the batch."""
+        self.open = True
+        self.registries: dict[BaseRegistry, None] = {}
+
+
+_save_batch_cv: ContextVar[_SaveBatch | None] = ContextVar(
+    "registry_save_batch", default=None
+)
+
+
+@contextmanager
+def async_batch_saves() -> Generator[None]:
+    """Schedule the saves of registries changed in the block once it exits.
+
+    Only changes made from the current context are batched, changes made by
+    other tasks schedule their save as usual. Tasks started in the block only
+    batch their changes while the block is open.
+    """
+    batch = _SaveBatch()
+    token = _save_batch_cv.set(batch)
+    try:
+        yield
+    finally:
+        _save_batch_cv.reset(token)
+        batch.open = False
+        for registry in batch.registries:
+            registry.async_schedule_save()
+
+
 class BaseRegistryItems[_DataT](UserDict[str, _DataT], ABC):
     """Base class for registry items."""
 
@@ -72,6 +109,9 @@ class BaseRegistry[_StoreDataT: Mapping[str, Any] | Sequence[Any]](ABC):
     @callback
     def async_schedule_save(self) -> None:
         """Schedule saving the registry."""
+        if (batch := _save_batch_cv.get()) is not None and batch.open:
+            batch.registries[self] = None
+            return
         # Schedule the save past startup to avoid writing
         # the file while the system is starting.
         delay = SAVE_DELAY if self.hass.state is CoreState.running else SAVE_DELAY_LONG
@@ -122,6 +122,9 @@ class RestoreStateData:
             hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
         )
         self.last_states: dict[str, StoredState] = {}
+        # Stored states loaded from storage which have not been decoded yet,
+        # they are decoded when an entity asks for its state
+        self._stored_items: dict[str, dict[str, Any]] = {}
         self.entities: dict[str, RestoreEntity] = {}
 
     async def async_setup(self) -> None:
@@ -143,16 +146,27 @@ class RestoreStateData:
             _LOGGER.error("Error loading last states", exc_info=exc)
             stored_states = None
 
+        self.last_states = {}
         if stored_states is None:
             _LOGGER.debug("Not creating cache - no saved states found")
-            self.last_states = {}
+            self._stored_items = {}
         else:
-            self.last_states = {
-                item["state"]["entity_id"]: StoredState.from_dict(item)
+            self._stored_items = {
+                item["state"]["entity_id"]: item
                 for item in stored_states
                 if valid_entity_id(item["state"]["entity_id"])
             }
-            _LOGGER.debug("Created cache with %s", list(self.last_states))
+            _LOGGER.debug("Created cache with %s", list(self._stored_items))
+
+    @callback
+    def async_get_stored_state(self, entity_id: str) -> StoredState | None:
+        """Get the stored state of an entity, decoding it if needed."""
+        if (stored_state := self.last_states.get(entity_id)) is not None:
+            return stored_state
+        if (item := self._stored_items.pop(entity_id, None)) is None:
+            return None
+        stored_state = self.last_states[entity_id] = StoredState.from_dict(item)
+        return stored_state
 
     @callback
     def async_get_stored_states(self) -> list[StoredState]:
@@ -160,7 +174,8 @@ class RestoreStateData:
 
         This includes the states of all registered entities, as well as the
         stored states from the previous run, which have not been created as
-        entities on this run, and have not expired.
+        entities on this run, and have not expired. Stored states which were
+        never decoded are not included, they are saved as they were loaded.
         """
         now = dt_util.utcnow()
         all_states = self.hass.states.async_all()
@@ -198,6 +213,34 @@ class RestoreStateData:
 
         return stored_states
 
+    @callback
+    def _async_get_stored_items(self) -> list[dict[str, Any]]:
+        """Get the stored states from the previous run which were never decoded.
+
+        They are saved as they were loaded, without decoding them.
+        """
+        if not self._stored_items:
+            return []
+        expiration_time = dt_util.utcnow() - STATE_EXPIRATION
+        states = self.hass.states
+        stored_items: list[dict[str, Any]] = []
+        for entity_id, item in self._stored_items.items():
+            # Skip the states which have been decoded or have an entity
+            # in the current run, like async_get_stored_states does
+            if entity_id in self.last_states:
+                continue
+            if (state := states.get(entity_id)) is not None and not (
+                state.attributes.get(ATTR_RESTORED)
+            ):
+                continue
+            last_seen = item["last_seen"]
+            if isinstance(last_seen, str):
+                last_seen = dt_util.parse_datetime(last_seen)
+            if last_seen is None or last_seen < expiration_time:
+                continue
+            stored_items.append(item)
+        return stored_items
+
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
@@ -207,6 +250,7 @@ class RestoreStateData:
                     stored_state.as_dict()
                     for stored_state in self.async_get_stored_states()
                 ]
+                + self._async_get_stored_items()
             )
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
@@ -292,7 +336,7 @@ class RestoreEntity(Entity):
                 "Cannot get last state. Entity not added to hass"
             )
             return None
-        return async_get(self.hass).last_states.get(self.entity_id)
+        return async_get(self.hass).async_get_stored_state(self.entity_id)
 
     async def async_get_last_state(self) -> State | None:
         """Get the entity state from the previous run."""
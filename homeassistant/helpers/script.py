@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import AsyncGenerator, Callable, Mapping, Sequence
+from collections.abc import AsyncGenerator, Callable, Coroutine, Mapping, Sequence
 from contextlib import asynccontextmanager
 from contextvars import ContextVar
 from copy import copy
@@ -79,6 +79,7 @@ from homeassistant.core import (
     State,
     SupportsResponse,
     callback,
+    valid_entity_id,
 )
 from homeassistant.util import slugify
 from homeassistant.util.async_ import create_eager_task
@@ -98,6 +99,7 @@ from .trace import (
     script_execution_set,
     trace_append_element,
     trace_id_get,
+    trace_is_enabled,
     trace_path,
     trace_path_get,
     trace_path_stack_cv,
@@ -457,11 +459,14 @@ class _ScriptRun:
 
         try:
             self._log("Running %s", self._script.running_description)
+            step_plans = self._script._get_step_plans()  # noqa: SLF001
             for self._step, self._action in enumerate(self._script.sequence):
                 if self._stop.done():
                     script_execution_set("cancelled")
                     break
-                await self._async_step(log_exceptions=False)
+                await self._async_step(
+                    log_exceptions=False, plan=step_plans[self._step]
+                )
             else:
                 script_execution_set("finished")
         except _AbortScript:
@@ -490,8 +495,11 @@ class _ScriptRun:
 
         return ScriptRunResult(self._conversation_response, response, self._variables)
 
-    async def _async_step(self, log_exceptions: bool) -> None:
-        continue_on_error = self._action.get(CONF_CONTINUE_ON_ERROR, False)
+    async def _async_step(self, log_exceptions: bool, plan: _StepPlan) -> None:
+        if not trace_is_enabled() and not self._breakpoints_set():
+            if not self._stop.done():
+                await self._async_run_step(log_exceptions, plan)
+            return
 
         with trace_path(str(self._step)):
             async with trace_action(
@@ -500,36 +508,44 @@ class _ScriptRun:
                 if self._stop.done():
                     return
 
-                action = cv.determine_script_action(self._action)
-
-                if CONF_ENABLED in self._action:
-                    enabled = self._action[CONF_ENABLED]
-                    if isinstance(enabled, Template):
-                        try:
-                            enabled = enabled.async_render(limited=True)
-                        except exceptions.TemplateError as ex:
-                            self._handle_exception(
-                                ex,
-                                continue_on_error,
-                                self._log_exceptions or log_exceptions,
-                            )
-                    if not enabled:
-                        self._log(
-                            "Skipped disabled step %s",
-                            self._action.get(CONF_ALIAS, action),
-                        )
-                        trace_set_result(enabled=False)
-                        return
+                try:
+                    await self._async_run_step(log_exceptions, plan)
+                finally:
+                    trace_element.update_variables(self._variables)
+
+    def _breakpoints_set(self) -> bool:
+        """Return if breakpoints are set for the traced script or automation."""
+        if (trace_id := trace_id_get()) is None:
+            return False
+        return trace_id[0] in self._hass.data[DATA_SCRIPT_BREAKPOINTS]
 
-                handler = f"_async_{action}_step"
+    async def _async_run_step(self, log_exceptions: bool, plan: _StepPlan) -> None:
+        continue_on_error = plan.continue_on_error
+
+        if (enabled := plan.enabled) is not True:
+            if isinstance(enabled, Template):
                 try:
-                    await getattr(self, handler)()
-                except Exception as ex:  # noqa: BLE001
+                    enabled = enabled.async_render(limited=True)
+                except exceptions.TemplateError as ex:
                     self._handle_exception(
-                        ex, continue_on_error, self._log_exceptions or log_exceptions
+                        ex,
+                        continue_on_error,
+                        self._log_exceptions or log_exceptions,
                     )
-                finally:
-                    trace_element.update_variables(self._variables)
+            if not enabled:
+                self._log(
+                    "Skipped disabled step %s",
+                    self._action.get(CONF_ALIAS, plan.action),
+                )
+                trace_set_result(enabled=False)
+                return
+
+        try:
+            await plan.handler(self)
+        except Exception as ex:  # noqa: BLE001
+            self._handle_exception(
+                ex, continue_on_error, self._log_exceptions or log_exceptions
+            )
 
     def _finish(self) -> None:
         self._script._runs.remove(self)  # noqa: SLF001
@@ -732,8 +748,8 @@ class _ScriptRun:
         """Call the service specified in the action."""
         self._step_log("call service")
 
-        params = service.async_prepare_call_from_config(
-            self._hass, self._action, self._variables
+        params = self._script._async_get_service_params(  # noqa: SLF001
+            self._step, self._action, self._variables
         )
 
         # Validate response data parameters. This check ignores services that do
@@ -1376,6 +1392,74 @@ def _referenced_extract_ids(data: Any, key: str, found: set[str]) -> None:
             found.add(item_id)
 
 
+def _is_static_config(value: Any) -> bool:
+    """Test if a config structure renders the same regardless of variables."""
+    if isinstance(value, Template):
+        return value.is_static
+    if isinstance(value, list):
+        return all(_is_static_config(item) for item in value)
+    if isinstance(value, Mapping):
+        return all(
+            _is_static_config(key) and _is_static_config(item)
+            for key, item in value.items()
+        )
+    return True
+
+
+def _has_static_target(config: ConfigType) -> bool:
+    """Test if a service call config has a static target without entity UUIDs.
+
+    Entity registry UUIDs are resolved to entity IDs when the service is called
+    and may resolve differently when the entity is renamed.
+    """
+    if not _is_static_config(config):
+        return False
+    if not isinstance(target := config.get(CONF_TARGET, {}), Mapping):
+        return False
+    if ATTR_ENTITY_ID not in target:
+        return True
+    entity_ids = cv.comp_entity_ids_or_uuids(
+        template.render_complex(target[ATTR_ENTITY_ID])
+    )
+    return isinstance(entity_ids, str) or all(
+        valid_entity_id(entity_id) for entity_id in entity_ids
+    )
+
+
+def _copy_service_params(params: service.ServiceParams) -> service.ServiceParams:
+    """Copy service call parameters, the service call mutates the dicts."""
+    return {
+        "domain": params["domain"],
+        "service": params["service"],
+        "service_data": params["service_data"].copy(),
+        "target": None if (target := params["target"]) is None else target.copy(),
+    }
+
+
+@dataclass(slots=True)
+class _StepPlan:
+    """Precompiled plan for a single step of a script sequence."""
+
+    action: str
+    handler: Callable[[_ScriptRun], Coroutine[Any, Any, None]]
+    continue_on_error: bool
+    enabled: bool | Template
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> _StepPlan:
+        """Compile a step plan from an action config."""
+        action = cv.determine_script_action(config)
+        enabled = config.get(CONF_ENABLED, True)
+        if isinstance(enabled, Template) and enabled.is_static:
+            enabled = enabled.async_render(limited=True)
+        return cls(
+            action=action,
+            handler=getattr(_ScriptRun, f"_async_{action}_step"),
+            continue_on_error=config.get(CONF_CONTINUE_ON_ERROR, False),
+            enabled=enabled,
+        )
+
+
 class _ChooseData(TypedDict):
     choices: list[tuple[list[ConditionCheckerType], Script]]
     default: Script | None
@@ -1455,6 +1539,8 @@ class Script:
         self._max_exceeded = max_exceeded
         if script_mode == SCRIPT_MODE_QUEUED:
             self._queue_lck = asyncio.Lock()
+        self._step_plans: list[_StepPlan] | None = None
+        self._service_params: dict[int, service.ServiceParams | None] = {}
         self._config_cache: dict[frozenset[tuple[str, str]], ConditionCheckerType] = {}
         self._repeat_script: dict[int, Script] = {}
         self._choose_data: dict[int, _ChooseData] = {}
@@ -1825,6 +1911,31 @@ class Script:
             return
         await asyncio.shield(create_eager_task(self._async_stop(aws, update_state)))
 
+    def _get_step_plans(self) -> list[_StepPlan]:
+        """Get the (cached) step plans for the sequence."""
+        if (step_plans := self._step_plans) is None:
+            step_plans = self._step_plans = [
+                _StepPlan.from_config(action) for action in self.sequence
+            ]
+        return step_plans
+
+    def _async_get_service_params(
+        self, step: int, config: ConfigType, variables: TemplateVarsType
+    ) -> service.ServiceParams:
+        """Get the service call parameters for a step.
+
+        Parameters of a service call without templates are prepared once and
+        copied on subsequent runs.
+        """
+        if (params := self._service_params.get(step)) is not None:
+            return _copy_service_params(params)
+        params = service.async_prepare_call_from_config(self._hass, config, variables)
+        if step not in self._service_params:
+            self._service_params[step] = (
+                _copy_service_params(params) if _has_static_target(config) else None
+            )
+        return params
+
     async def _async_get_condition(self, config: ConfigType) -> ConditionCheckerType:
         config_cache_key = frozenset((k, str(v)) for k, v in config.items())
         if not (cond := self._config_cache.get(config_cache_key)):
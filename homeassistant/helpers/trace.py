@@ -120,6 +120,8 @@ trace_id_cv: ContextVar[tuple[str, str] | None] = ContextVar(
 script_execution_cv: ContextVar[StopReason | None] = ContextVar(
     "script_execution_cv", default=None
 )
+# Whether actions and conditions of the current run are traced
+trace_enabled_cv: ContextVar[bool] = ContextVar("trace_enabled_cv", default=True)
 
 
 def trace_id_set(trace_id: tuple[str, str]) -> None:
@@ -132,6 +134,27 @@ def trace_id_get() -> tuple[str, str] | None:
     return trace_id_cv.get()
 
 
+def trace_is_enabled() -> bool:
+    """Return if actions and conditions of the current run are traced."""
+    return trace_enabled_cv.get()
+
+
+@contextmanager
+def trace_enabled(enabled: bool) -> Generator[None]:
+    """Enable or disable tracing of actions and conditions.
+
+    When disabled, no trace elements are created, no variables are copied and
+    no results are set. The trace path is still kept, as breakpoints are
+    matched against it, and steps are still traced while a breakpoint is set
+    for the script or automation.
+    """
+    token = trace_enabled_cv.set(enabled)
+    try:
+        yield
+    finally:
+        trace_enabled_cv.reset(token)
+
+
 def trace_stack_push[_T](
     trace_stack_var: ContextVar[list[_T] | None], node: _T
 ) -> None:
@@ -215,13 +238,13 @@ def trace_set_child_id(child_key: str, child_run_id: str) -> None:
 
 def trace_set_result(**kwargs: Any) -> None:
     """Set the result of TraceElement at the top of the stack."""
-    if node := trace_stack_top(trace_stack_cv):
+    if trace_enabled_cv.get() and (node := trace_stack_top(trace_stack_cv)):
         node.set_result(**kwargs)
 
 
 def trace_update_result(**kwargs: Any) -> None:
     """Update the result of TraceElement at the top of the stack."""
-    if node := trace_stack_top(trace_stack_cv):
+    if trace_enabled_cv.get() and (node := trace_stack_top(trace_stack_cv)):
         node.update_result(**kwargs)
 
 
@@ -28,9 +28,10 @@ from homeassistant.exceptions import (
 )
 from homeassistant.util.dt import utcnow
 
-from . import entity, event
+from . import entity, entity_platform, event
 from .debounce import Debouncer
 from .frame import report_usage
+from .polling import PollingRefresh, async_get_polling_scheduler
 from .typing import UNDEFINED, UndefinedType
 
 REQUEST_REFRESH_DEFAULT_COOLDOWN = 10
@@ -78,6 +79,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         setup_method: Callable[[], Awaitable[None]] | None = None,
         request_refresh_debouncer: Debouncer[Coroutine[Any, Any, None]] | None = None,
         always_update: bool = True,
+        batch_updates: bool = False,
     ) -> None:
         """Initialize global data updater."""
         self.hass = hass
@@ -95,6 +97,8 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         else:
             self.config_entry = config_entry
         self.always_update = always_update
+        # Write the states of all listening entities as one batch of state changes
+        self.batch_updates = batch_updates
 
         # It's None before the first successful update.
         # Components should call async_config_entry_first_refresh
@@ -109,6 +113,18 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
             randint(event.RANDOM_MICROSECOND_MIN, event.RANDOM_MICROSECOND_MAX) / 10**6
         )
 
+        # Use the integration domain, like polling entity platforms do, so
+        # both share the per integration limit of the polling scheduler
+        if self.config_entry:
+            polling_domain = self.config_entry.domain
+        elif platform := entity_platform.current_platform.get():
+            polling_domain = platform.platform_name
+        else:
+            polling_domain = logger.name
+        self._polling_refresh = PollingRefresh(
+            name, polling_domain, self._update_interval_seconds or 0.0
+        )
+
         self._listeners: dict[CALLBACK_TYPE, tuple[CALLBACK_TYPE, object | None]] = {}
         self._unsub_refresh: CALLBACK_TYPE | None = None
         self._unsub_shutdown: CALLBACK_TYPE | None = None
@@ -173,8 +189,13 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     @callback
     def async_update_listeners(self) -> None:
         """Update all registered listeners."""
-        for update_callback, _ in list(self._listeners.values()):
-            update_callback()
+        if not self.batch_updates:
+            for update_callback, _ in list(self._listeners.values()):
+                update_callback()
+            return
+        with self.hass.states.async_batch():
+            for update_callback, _ in list(self._listeners.values()):
+                update_callback()
 
     async def async_shutdown(self) -> None:
         """Cancel any scheduled call, and ignore new runs."""
@@ -200,6 +221,9 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         if self._unsub_refresh:
             self._unsub_refresh()
             self._unsub_refresh = None
+            async_get_polling_scheduler(self.hass).async_unschedule(
+                self._polling_refresh
+            )
 
     def _async_unsub_shutdown(self) -> None:
         """Cancel any scheduled call."""
@@ -237,12 +261,21 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         hass = self.hass
         loop = hass.loop
 
+        scheduler = async_get_polling_scheduler(hass)
         next_refresh = (
-            int(loop.time()) + self._microsecond + self._update_interval_seconds
+            int(loop.time())
+            + self._microsecond
+            + self._update_interval_seconds
+            + scheduler.async_startup_jitter(
+                f"{self.name}-{self.config_entry.entry_id if self.config_entry else ''}",
+                self._update_interval_seconds,
+            )
         )
         self._unsub_refresh = loop.call_at(
             next_refresh, self.__wrap_handle_refresh_interval
         ).cancel
+        self._polling_refresh.interval = self._update_interval_seconds
+        scheduler.async_schedule(self._polling_refresh, next_refresh)
 
     @callback
     def __wrap_handle_refresh_interval(self) -> None:
@@ -264,7 +297,10 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     async def _handle_refresh_interval(self, _now: datetime | None = None) -> None:
         """Handle a refresh interval occurrence."""
         self._unsub_refresh = None
-        await self._async_refresh(log_failures=True, scheduled=True)
+        async with async_get_polling_scheduler(self.hass).async_run(
+            self._polling_refresh
+        ):
+            await self._async_refresh(log_failures=True, scheduled=True)
 
     async def async_request_refresh(self) -> None:
         """Request a refresh.
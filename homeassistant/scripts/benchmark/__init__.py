@@ -6,17 +6,37 @@ import argparse
 import asyncio
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
 import logging
+import shutil
+import tempfile
 from timeit import default_timer as timer
+import tracemalloc
+from types import MappingProxyType
 
 from homeassistant import core
-from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntries, ConfigEntry
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, EVENT_STATE_CHANGED
+from homeassistant.helpers import (
+    config_validation as cv,
+    device_registry as dr,
+    entity_registry as er,
+)
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import EntityPlatform
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.helpers.script import Script
+from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -308,3 +328,261 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def script_steps(hass):
+    """Run 100k script steps and report the time per step."""
+    runs = 10**4
+    count = 0
+
+    @core.callback
+    def service_handler(call):
+        """Handle service call."""
+        nonlocal count
+        count += 1
+
+    hass.services.async_register("benchmark", "action", service_handler)
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {"action": "benchmark.action", "data": {"brightness": 255}},
+            {"action": "benchmark.action", "data": {"brightness": "{{ level }}"}},
+            {"condition": "template", "value_template": "{{ level > 0 }}"},
+            {"variables": {"level": "{{ level + 1 }}"}},
+            {"event": "benchmark_event", "event_data": {"level": "{{ level }}"}},
+        ]
+        * 2
+    )
+    script = Script(hass, sequence, "benchmark", "benchmark", script_mode="parallel")
+    steps = runs * len(sequence)
+
+    start = timer()
+
+    for _ in range(runs):
+        await script.async_run({"level": 1}, core.Context())
+
+    elapsed = timer() - start
+    assert count == runs * 4
+    print(f"{steps / elapsed:.0f} steps/s")
+    return elapsed
+
+
+@benchmark
+async def entity_write_state(hass):
+    """Write 100k states of entities with and without tracked attributes."""
+    writes = 10**5
+    elapsed = 0.0
+
+    class BenchmarkEntity(Entity):
+        """Entity with a few attributes."""
+
+        _attr_extra_state_attributes = {"level": 1, "mode": "auto"}
+        _attr_icon = "mdi:gauge"
+        _attr_name = "Benchmark"
+
+    class BenchmarkSensor(SensorEntity):
+        """Sensor with a few attributes."""
+
+        _attr_device_class = SensorDeviceClass.TEMPERATURE
+        _attr_native_unit_of_measurement = "°C"
+        _attr_state_class = SensorStateClass.MEASUREMENT
+        _attr_name = "Benchmark"
+
+    for entity_class, value_attr in (
+        (BenchmarkEntity, "_attr_state"),
+        (BenchmarkSensor, "_attr_native_value"),
+    ):
+        for track in (False, True):
+            entity = entity_class()
+            entity.hass = hass
+            entity.entity_id = f"{entity_class.__name__.lower()}.benchmark_{track:d}"
+            entity._state_info = {"unrecorded_attributes": frozenset()}  # noqa: SLF001
+            entity._track_state_attributes = track  # noqa: SLF001
+            entity._no_platform_reported = True  # noqa: SLF001
+
+            start = timer()
+            for idx in range(writes):
+                setattr(entity, value_attr, idx)
+                entity.async_write_ha_state()
+            runtime = timer() - start
+            elapsed += runtime
+            print(
+                f"{entity_class.__name__} track_state_attributes={track}:"
+                f" {writes / runtime:.0f} writes/s"
+            )
+            await hass.async_block_till_done()
+
+    return elapsed
+
+
+@benchmark
+async def add_entities_2k(hass):
+    """Add 2000 entities of 100 devices to an entity platform."""
+    config_dir = tempfile.mkdtemp()
+    hass.config.config_dir = config_dir
+    hass.bus.async_listen_once(
+        EVENT_HOMEASSISTANT_CLOSE, lambda _: shutil.rmtree(config_dir)
+    )
+    await dr.async_load(hass)
+    await er.async_load(hass)
+
+    config_entry = ConfigEntry(
+        data={},
+        discovery_keys=MappingProxyType({}),
+        domain="benchmark",
+        minor_version=1,
+        options={},
+        source="user",
+        subentries_data=None,
+        title="Benchmark",
+        unique_id=None,
+        version=1,
+    )
+    hass.config_entries = ConfigEntries(hass, {})
+    hass.config_entries._entries[config_entry.entry_id] = config_entry  # noqa: SLF001
+    platform = EntityPlatform(
+        hass=hass,
+        logger=logging.getLogger(__name__),
+        domain="sensor",
+        platform_name="benchmark",
+        platform=None,
+        scan_interval=timedelta(seconds=30),
+        entity_namespace=None,
+    )
+    platform.config_entry = config_entry
+
+    def create_entities():
+        entities = []
+        for idx in range(2000):
+            entity = SensorEntity()
+            entity._attr_unique_id = f"benchmark_{idx}"  # noqa: SLF001
+            entity._attr_has_entity_name = True  # noqa: SLF001
+            entity._attr_name = f"Sensor {idx % 20}"  # noqa: SLF001
+            entity._attr_should_poll = False  # noqa: SLF001
+            entity._attr_device_info = {  # noqa: SLF001
+                "identifiers": {("benchmark", str(idx // 20))},
+                "name": f"Device {idx // 20}",
+                "manufacturer": "Benchmark",
+                "model": "Sensor",
+            }
+            entities.append(entity)
+        return entities
+
+    start = timer()
+    await platform.async_add_entities(create_entities())
+    elapsed = timer() - start
+    print(f"Added new entities in {elapsed}s")
+    assert len(hass.states.async_entity_ids()) == 2000
+
+    # Add them again with their registry entries existing, like after a restart
+    await platform.async_reset()
+    start = timer()
+    await platform.async_add_entities(create_entities())
+    readd_elapsed = timer() - start
+    print(f"Added registered entities in {readd_elapsed}s")
+
+    return elapsed + readd_elapsed
+
+
+@benchmark
+async def assist_audio_chunks(hass):
+    """Split, amplify and enhance 10s of audio for 1, 4 and 8 satellites."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.assist_pipeline.pipeline import (
+        BYTES_PER_CHUNK,
+        AudioBuffer,
+        MicroVadSpeexEnhancer,
+        _multiply_volume,
+        chunk_samples,
+    )
+
+    # Satellites usually send 1024 bytes of 16-bit mono audio at 16 kHz (32ms)
+    satellite_chunk = bytes(range(256)) * 4
+    chunks_per_satellite = 10 * 16000 * 2 // len(satellite_chunk)
+    # Build the volume table before timing, like the pipeline does
+    _multiply_volume(satellite_chunk, 2.0)
+    elapsed = 0.0
+
+    def process(satellites: int) -> int:
+        buffers = [AudioBuffer(BYTES_PER_CHUNK) for _ in range(satellites)]
+        enhancers = [MicroVadSpeexEnhancer(2, 2, True) for _ in range(satellites)]
+        enhanced = 0
+        for _ in range(chunks_per_satellite):
+            for buffer, enhancer in zip(buffers, enhancers, strict=True):
+                samples = _multiply_volume(satellite_chunk, 2.0)
+                for chunk in chunk_samples(samples, BYTES_PER_CHUNK, buffer):
+                    enhancer.enhance_chunk(chunk, 0)
+                    enhanced += 1
+        return enhanced
+
+    for satellites in (1, 4, 8):
+        start = timer()
+        enhanced = process(satellites)
+        runtime = timer() - start
+        elapsed += runtime
+
+        tracemalloc.start()
+        process(satellites)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{satellites} satellites: {runtime / enhanced * 1e6:.1f}us per 10ms chunk,"
+            f" {peak / satellites / 1024:.1f}KiB peak allocations per satellite"
+        )
+
+    return elapsed
+
+
+@benchmark
+async def stream_segments(hass):
+    """Serve the segments of 12 cameras with 8 parts to 20 viewers each."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.stream.core import Part, Segment
+
+    cameras = 12
+    viewers = 20
+    # Segments kept by the HLS output of a camera
+    segments_per_camera = 4
+    # About 1 MiB per 6 second segment
+    part_data = bytearray(range(256)) * 512
+
+    def serve() -> tuple[list[Segment], int]:
+        segments: list[Segment] = []
+        served = 0
+        for sequence in range(cameras * segments_per_camera):
+            segment = Segment(
+                sequence=sequence,
+                init=b"",
+                stream_id=0,
+                start_time=dt_util.utcnow(),
+                _stream_outputs=[],
+            )
+            segments.append(segment)
+            for part_num in range(8):
+                segment.async_add_part(
+                    Part(
+                        duration=0.75,
+                        has_keyframe=not part_num,
+                        data=bytes(part_data),
+                    ),
+                    6.0 if part_num == 7 else 0,
+                )
+            for _ in range(viewers):
+                served += len(segment.get_data())
+                served += sum(len(part.data) for part in segment.parts)
+        return segments, served
+
+    start = timer()
+    _, served = serve()
+    elapsed = timer() - start
+
+    tracemalloc.start()
+    segments, _ = serve()
+    kept, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"Served {served / 1024 / 1024:.0f}MiB in {elapsed * 1000:.1f}ms,"
+        f" {len(segments)} segments kept in {kept / 1024 / 1024:.1f}MiB,"
+        f" {peak / 1024 / 1024:.1f}MiB peak allocations"
+    )
+    return elapsed
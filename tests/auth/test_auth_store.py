@@ -379,3 +379,44 @@ async def test_set_expiry_date(
 
     store.async_set_expiry(token, enable_expiry=True)
     assert token.expire_at is not None
+
+
+async def test_token_usage_saved_in_batches(
+    hass: HomeAssistant, hass_storage: dict[str, Any], freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the usage of refresh tokens is saved with a delay."""
+    store = auth_store.AuthStore(hass)
+    await store.async_load()
+    user = await store.async_create_user("Test User")
+    refresh_token = await store.async_create_refresh_token(user, "client_id")
+    freezer.tick(auth_store.INITIAL_LOAD_SAVE_DELAY)
+    await hass.async_block_till_done()
+    await hass.async_block_till_done()
+
+    # Wipe storage so we can verify if it was written
+    hass_storage[auth_store.STORAGE_KEY] = {}
+
+    store.async_log_refresh_token_usage(refresh_token, "192.168.0.1")
+    store.async_log_refresh_token_usage(refresh_token, "192.168.0.2")
+    freezer.tick(auth_store.DEFAULT_SAVE_DELAY * 2)
+    await hass.async_block_till_done()
+    assert hass_storage[auth_store.STORAGE_KEY] == {}
+
+    freezer.tick(auth_store.TOKEN_USAGE_SAVE_DELAY)
+    # Once for scheduling the task
+    await hass.async_block_till_done()
+    # Once for the task
+    await hass.async_block_till_done()
+    (saved_token,) = hass_storage[auth_store.STORAGE_KEY]["data"]["refresh_tokens"]
+    assert saved_token["last_used_ip"] == "192.168.0.2"
+
+    # Logging usage does not postpone the save of a change
+    hass_storage[auth_store.STORAGE_KEY] = {}
+    store.async_set_expiry(refresh_token, enable_expiry=False)
+    store.async_log_refresh_token_usage(refresh_token, "192.168.0.3")
+    freezer.tick(auth_store.DEFAULT_SAVE_DELAY * 2)
+    await hass.async_block_till_done()
+    await hass.async_block_till_done()
+    await hass.async_block_till_done()
+    (saved_token,) = hass_storage[auth_store.STORAGE_KEY]["data"]["refresh_tokens"]
+    assert saved_token["last_used_ip"] == "192.168.0.3"
@@ -26,7 +26,7 @@ from homeassistant.components.assist_pipeline.const import (
 )
 from homeassistant.const import MATCH_ALL
 from homeassistant.core import Context, HomeAssistant
-from homeassistant.helpers import intent
+from homeassistant.helpers import area_registry as ar, device_registry as dr, intent
 from homeassistant.setup import async_setup_component
 
 from .conftest import (
@@ -38,6 +38,7 @@ from .conftest import (
     make_10ms_chunk,
 )
 
+from tests.common import MockConfigEntry
 from tests.typing import ClientSessionGenerator, WebSocketGenerator
 
 
@@ -751,6 +752,48 @@ def test_pipeline_run_equality(hass: HomeAssistant, init_components) -> None:
     assert run_1 != 1234
 
 
+def test_pipeline_run_wake_up_key(
+    hass: HomeAssistant,
+    init_components,
+    device_registry: dr.DeviceRegistry,
+    area_registry: ar.AreaRegistry,
+) -> None:
+    """Test that the wake up cooldown is shared by satellites in an area."""
+    config_entry = MockConfigEntry()
+    config_entry.add_to_hass(hass)
+    kitchen = area_registry.async_create("Kitchen")
+    device_ids = [
+        device_registry.async_get_or_create(
+            config_entry_id=config_entry.entry_id,
+            identifiers={("test", satellite)},
+        ).id
+        for satellite in ("satellite_1", "satellite_2", "satellite_3")
+    ]
+    for device_id in device_ids[:2]:
+        device_registry.async_update_device(device_id, area_id=kitchen.id)
+
+    pipeline = assist_pipeline.pipeline.async_get_pipeline(hass)
+    wake_up_keys = []
+    for device_id in (*device_ids, None):
+        run = assist_pipeline.pipeline.PipelineRun(
+            hass,
+            context=Context(),
+            pipeline=pipeline,
+            start_stage=assist_pipeline.PipelineStage.WAKE_WORD,
+            end_stage=assist_pipeline.PipelineStage.TTS,
+            event_callback=lambda event: None,
+        )
+        run.start(device_id)
+        wake_up_keys.append(run.async_get_wake_up_key("okay nabu"))
+
+    assert wake_up_keys == [
+        (kitchen.id, "okay nabu"),
+        (kitchen.id, "okay nabu"),
+        (None, "okay nabu"),
+        (None, "okay nabu"),
+    ]
+
+
 async def test_tts_audio_output(
     hass: HomeAssistant,
     hass_client: ClientSessionGenerator,
@@ -1,5 +1,6 @@
 """Websocket tests for Voice Assistant integration."""
 
+import array
 from collections.abc import AsyncGenerator
 from typing import Any
 from unittest.mock import ANY, patch
@@ -16,6 +17,7 @@ from homeassistant.components.assist_pipeline.pipeline import (
     PipelineData,
     PipelineStorageCollection,
     PipelineStore,
+    _multiply_volume,
     async_create_default_pipeline,
     async_get_pipeline,
     async_get_pipelines,
@@ -657,3 +659,14 @@ async def test_migrate_after_load(hass: HomeAssistant) -> None:
 
     assert pipeline_updated.stt_engine == "stt.test"
     assert pipeline_updated.tts_engine == "tts.test"
+
+
+@pytest.mark.parametrize("volume_multiplier", [0.5, 2.0, 3.7])
+def test_multiply_volume(volume_multiplier: float) -> None:
+    """Test multiplying the volume of samples clamps them to 16 bits."""
+    samples = [-32768, -20000, -1001, -1, 0, 1, 999, 20000, 32767]
+    chunk = array.array("h", samples).tobytes()
+
+    assert array.array("h", _multiply_volume(chunk, volume_multiplier)).tolist() == [
+        max(-32768, min(32767, int(sample * volume_multiplier))) for sample in samples
+    ]
@@ -133,6 +133,12 @@ async def test_diagnostics(
                 }
             },
             "manager": {
+                "advertisement_counters": {
+                    "deduped": 0,
+                    "dispatched": 0,
+                    "rate_limited": 0,
+                    "received": 0,
+                },
                 "adapters": {
                     "hci0": {
                         "address": "00:00:00:00:00:01",
@@ -291,6 +297,12 @@ async def test_diagnostics_macos(
                 }
             },
             "manager": {
+                "advertisement_counters": {
+                    "deduped": 0,
+                    "dispatched": 0,
+                    "rate_limited": 0,
+                    "received": 1,
+                },
                 "adapters": {
                     "Core Bluetooth": {
                         "address": "00:00:00:00:00:00",
@@ -484,6 +496,12 @@ async def test_diagnostics_remote_adapter(
             },
             "dbus": {},
             "manager": {
+                "advertisement_counters": {
+                    "deduped": 0,
+                    "dispatched": 0,
+                    "rate_limited": 0,
+                    "received": 1,
+                },
                 "adapters": {
                     "hci0": {
                         "address": "00:00:00:00:00:01",
@@ -1660,3 +1660,72 @@ async def test_bluetooth_rediscover_no_match(
     cancel()
     unsetup_connectable_scanner()
     cancel_connectable_scanner()
+
+
+@pytest.mark.usefixtures("enable_bluetooth", "register_hci0_scanner")
+async def test_callback_dedup_and_rate_limit(hass: HomeAssistant) -> None:
+    """Test callbacks can drop repeated payloads and limit their delivery rate."""
+    address = "44:44:33:11:23:12"
+    device = generate_ble_device(address, "wohand")
+    adv_a = generate_advertisement_data(
+        local_name="wohand", manufacturer_data={1: b"a"}
+    )
+    adv_b = generate_advertisement_data(
+        local_name="wohand", manufacturer_data={1: b"b"}
+    )
+
+    all_payloads: list[bytes] = []
+    deduped_payloads: list[bytes] = []
+    rate_limited_payloads: list[bytes] = []
+
+    def _make_callback(payloads: list[bytes]) -> bluetooth.BluetoothCallback:
+        @callback
+        def _callback(
+            service_info: BluetoothServiceInfoBleak, change: BluetoothChange
+        ) -> None:
+            payloads.append(service_info.manufacturer_data[1])
+
+        return _callback
+
+    matcher = bluetooth.BluetoothCallbackMatcher(address=address)
+    cancels = [
+        bluetooth.async_register_callback(
+            hass,
+            _make_callback(all_payloads),
+            matcher,
+            BluetoothScanningMode.ACTIVE,
+        ),
+        bluetooth.async_register_callback(
+            hass,
+            _make_callback(deduped_payloads),
+            matcher,
+            BluetoothScanningMode.ACTIVE,
+            dedup_window=10,
+        ),
+        bluetooth.async_register_callback(
+            hass,
+            _make_callback(rate_limited_payloads),
+            matcher,
+            BluetoothScanningMode.ACTIVE,
+            min_interval=5,
+        ),
+    ]
+
+    start_time = MONOTONIC_TIME()
+    for offset, adv in ((0, adv_a), (1, adv_b), (2, adv_a), (3, adv_b), (11, adv_a)):
+        inject_advertisement_with_time_and_source(
+            hass, device, adv, start_time + offset, "hci0"
+        )
+
+    assert all_payloads == [b"a", b"b", b"a", b"b", b"a"]
+    assert deduped_payloads == [b"a", b"b", b"a"]
+    assert rate_limited_payloads == [b"a", b"a"]
+    assert _get_manager().advertisement_counters.as_dict() == {
+        "received": 5,
+        "dispatched": 15,
+        "deduped": 2,
+        "rate_limited": 3,
+    }
+
+    for cancel in cancels:
+        cancel()
@@ -1,5 +1,6 @@
 """The tests for the camera component."""
 
+import asyncio
 from http import HTTPStatus
 import io
 from types import ModuleType
@@ -24,6 +25,7 @@ from homeassistant.components.camera.const import (
     StreamType,
 )
 from homeassistant.components.camera.helper import get_camera_from_entity_id
+from homeassistant.components.camera.snapshot import SnapshotCache
 from homeassistant.components.websocket_api import TYPE_RESULT
 from homeassistant.const import (
     ATTR_ENTITY_ID,
@@ -127,6 +129,135 @@ async def test_get_image_from_camera_with_width_height_scaled(
     assert image.content == EMPTY_8_6_JPEG
 
 
+@pytest.mark.usefixtures("image_mock_url")
+async def test_get_image_scaled_once(hass: HomeAssistant) -> None:
+    """Test the same image is not scaled again for each request."""
+
+    turbo_jpeg = mock_turbo_jpeg(
+        first_width=16, first_height=12, second_width=300, second_height=200
+    )
+    with (
+        patch(
+            "homeassistant.components.camera.img_util.TurboJPEGSingleton.instance",
+            return_value=turbo_jpeg,
+        ),
+        patch(
+            "homeassistant.components.demo.camera.Path.read_bytes",
+            autospec=True,
+            return_value=b"Valid jpeg",
+        ) as mock_camera,
+    ):
+        for _ in range(2):
+            image = await camera.async_get_image(
+                hass, "camera.demo_camera", width=4, height=3
+            )
+            assert image.content == EMPTY_8_6_JPEG
+
+    assert mock_camera.call_count == 2
+    assert turbo_jpeg.scale_with_quality.call_count == 1
+    demo_camera = get_camera_from_entity_id(hass, "camera.demo_camera")
+    assert demo_camera.snapshot_cache.stats.as_dict() == {
+        "hits": 0,
+        "coalesced": 0,
+        "misses": 2,
+        "scaled_hits": 1,
+        "hit_rate": 0.0,
+    }
+
+
+@pytest.mark.usefixtures("image_mock_url")
+async def test_get_image_coalesced(hass: HomeAssistant) -> None:
+    """Test concurrent requests share the image fetched from the camera."""
+    fetched = asyncio.Event()
+
+    async def async_camera_image(
+        width: int | None = None, height: int | None = None
+    ) -> bytes:
+        await fetched.wait()
+        return b"Test"
+
+    demo_camera = get_camera_from_entity_id(hass, "camera.demo_camera")
+    with patch.object(
+        demo_camera, "async_camera_image", side_effect=async_camera_image
+    ) as mock_camera_image:
+        tasks = [
+            hass.async_create_task(camera.async_get_image(hass, "camera.demo_camera"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        fetched.set()
+        images = await asyncio.gather(*tasks)
+
+        # Images are not shared after the fetch
+        await camera.async_get_image(hass, "camera.demo_camera")
+
+    assert [image.content for image in images] == [b"Test"] * 3
+    assert mock_camera_image.call_count == 2
+    assert demo_camera.snapshot_cache.stats.coalesced == 2
+
+
+async def test_snapshot_cache_request_cancelled() -> None:
+    """Test a fetch continues for other requests when its request is cancelled."""
+    cache = SnapshotCache()
+    fetched = asyncio.Event()
+    fetch_cancelled = False
+
+    async def fetch() -> camera.Image:
+        nonlocal fetch_cancelled
+        try:
+            await fetched.wait()
+        except asyncio.CancelledError:
+            fetch_cancelled = True
+            raise
+        return camera.Image("image/jpeg", b"Test")
+
+    first = asyncio.create_task(cache.async_get((None, None), fetch))
+    second = asyncio.create_task(cache.async_get((None, None), fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    fetched.set()
+    image = await second
+    assert image.content == b"Test"
+    assert cache.stats.misses == 1
+    assert cache.stats.coalesced == 1
+
+    # The fetch is cancelled when no request waits for it anymore
+    fetched.clear()
+    third = asyncio.create_task(cache.async_get((None, None), fetch))
+    await asyncio.sleep(0)
+    third.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await third
+    await asyncio.sleep(0)
+    assert fetch_cancelled
+    assert not cache._pending
+
+
+@pytest.mark.usefixtures("image_mock_url")
+async def test_get_image_from_stream_cached(hass: HomeAssistant) -> None:
+    """Test images of a stream are shared with later requests."""
+    with (
+        patch(
+            "homeassistant.components.camera.Camera.use_stream_for_stills",
+            new_callable=PropertyMock(return_value=True),
+        ),
+        patch(
+            "homeassistant.components.camera._async_get_stream_image",
+            return_value=b"Test",
+        ) as mock_stream_image,
+    ):
+        for _ in range(2):
+            image = await camera.async_get_image(hass, "camera.demo_camera")
+            assert image.content == b"Test"
+
+    assert mock_stream_image.call_count == 1
+    demo_camera = get_camera_from_entity_id(hass, "camera.demo_camera")
+    assert demo_camera.snapshot_cache.stats.hits == 1
+
+
 @pytest.mark.usefixtures("image_mock_url")
 async def test_get_image_from_camera_not_jpeg(hass: HomeAssistant) -> None:
     """Grab an image from camera entity that we cannot scale."""
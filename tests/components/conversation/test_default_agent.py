@@ -3016,6 +3016,130 @@ async def test_entities_filtered_by_input(hass: HomeAssistant) -> None:
         assert name_list.values[1].text_in.text == "test light"
 
 
+@pytest.mark.usefixtures("init_components")
+async def test_entity_names_updated_incrementally(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test the name indexes are updated per entity instead of being rebuilt."""
+    agent = hass.data[DATA_DEFAULT_ENTITY]
+    assert isinstance(agent, default_agent.DefaultAgent)
+
+    entity_registry.async_get_or_create(
+        "switch", "test", "1234", suggested_object_id="test_switch"
+    )
+    hass.states.async_set("light.test_light", "off")
+    hass.states.async_set("switch.test_switch", "off")
+    expose_entity(hass, "light.test_light", True)
+    expose_entity(hass, "switch.test_switch", False)
+    await hass.async_block_till_done()
+
+    async def recognize_names(text: str) -> tuple[list[str], list[str]]:
+        """Return the exposed and unexposed names considered for the text."""
+        user_input = ConversationInput(
+            text=text,
+            context=Context(),
+            conversation_id=None,
+            device_id=None,
+            language=hass.config.language,
+            agent_id=None,
+        )
+        with patch(
+            "homeassistant.components.conversation.default_agent.recognize_best",
+            return_value=None,
+        ) as recognize_best:
+            await agent.async_recognize_intent(user_input)
+        return tuple(
+            [value.value_out for value in call.kwargs["slot_lists"]["name"].values]
+            for call in recognize_best.call_args_list
+        )
+
+    assert await recognize_names("turn on test light and test switch") == (
+        ["test light"],
+        ["test switch"],
+    )
+    exposed_names = agent._exposed_names
+    unexposed_names = agent._unexposed_names
+
+    # Add, rename and remove entities
+    hass.states.async_set(
+        "light.new_light", "off", attributes={ATTR_FRIENDLY_NAME: "new light"}
+    )
+    entity_registry.async_update_entity("switch.test_switch", aliases={"my switch"})
+    hass.states.async_remove("light.test_light")
+    await hass.async_block_till_done()
+
+    assert await recognize_names("turn on test light, new light and my switch") == (
+        ["new light"],
+        ["my switch"],
+    )
+    assert agent._exposed_names is exposed_names
+    assert agent._unexposed_names is unexposed_names
+
+
+@pytest.mark.usefixtures("init_components")
+async def test_unexposed_names_indexed_when_needed(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test unexposed names are indexed on the event loop when first needed."""
+    agent = hass.data[DATA_DEFAULT_ENTITY]
+    assert isinstance(agent, default_agent.DefaultAgent)
+
+    entity_registry.async_get_or_create(
+        "switch", "test", "1234", suggested_object_id="test_switch"
+    )
+    hass.states.async_set("switch.test_switch", "off")
+    expose_entity(hass, "switch.test_switch", False)
+    await hass.async_block_till_done()
+
+    def user_input(text: str) -> ConversationInput:
+        return ConversationInput(
+            text=text,
+            context=Context(),
+            conversation_id=None,
+            device_id=None,
+            language=hass.config.language,
+            agent_id=None,
+        )
+
+    with patch(
+        "homeassistant.components.conversation.default_agent.recognize_best",
+        return_value=None,
+    ) as recognize_best:
+        await agent.async_recognize_intent(
+            user_input("turn on test switch"), strict_intents_only=True
+        )
+        assert agent._unexposed_names is None
+
+        # Rename the entity before the unexposed names are indexed
+        entity_registry.async_update_entity("switch.test_switch", aliases={"my switch"})
+        await hass.async_block_till_done()
+        await agent.async_recognize_intent(
+            user_input("turn on my switch"), strict_intents_only=True
+        )
+        assert agent._unexposed_names is None
+
+        recognize_best.reset_mock()
+        indexed_before_recognize = []
+        recognize = agent._recognize
+
+        def check_index(*args: Any) -> RecognizeResult | None:
+            indexed_before_recognize.append(agent._unexposed_names is not None)
+            return recognize(*args)
+
+        with patch.object(agent, "_recognize", side_effect=check_index):
+            await agent.async_recognize_intent(user_input("turn on the my switch"))
+        assert recognize_best.call_count == 2
+
+    # The index is built on the event loop, not in the executor job
+    assert indexed_before_recognize == [True]
+    assert [
+        value.value_out
+        for value in recognize_best.call_args_list[-1]
+        .kwargs["slot_lists"]["name"]
+        .values
+    ] == ["my switch"]
+
+
 @pytest.mark.usefixtures("init_components")
 async def test_entities_names_are_not_templates(hass: HomeAssistant) -> None:
     """Test that entities names are not treated as hassil templates."""
@@ -0,0 +1,70 @@
+"""Test the entity name index of the default agent."""
+
+from homeassistant.components.conversation.name_index import (
+    EntityNameIndex,
+    NameTrie,
+    normalize_name,
+)
+
+
+def test_normalize_name() -> None:
+    """Test names are case folded and whitespace is collapsed."""
+    assert normalize_name("  Living   Room\tLamp ") == "living room lamp"
+    assert normalize_name("Straße") == "strasse"
+
+
+def test_trie_find_and_remove() -> None:
+    """Test finding names in a text and removing them again."""
+    trie = NameTrie()
+    lamp_1 = object()
+    lamp_2 = object()
+    trie.insert("lamp", lamp_1)
+    trie.insert("lamp", lamp_2)
+    trie.insert("lamp 2", "lamp 2")
+    trie.insert("kitchen", "kitchen")
+
+    assert list(trie.find("turn on lamp lamp 2")) == [
+        (12, "lamp", lamp_1),
+        (12, "lamp", lamp_2),
+        (19, "lamp 2", "lamp 2"),
+    ]
+    # Names without spaces between words are found as well
+    assert [result[2] for result in trie.find("打开kitchen")] == ["kitchen"]
+
+    trie.remove("lamp", lamp_1)
+    assert [result[2] for result in trie.find("lamp 2")] == [lamp_2, "lamp 2"]
+
+    trie.remove("lamp", lamp_2)
+    trie.remove("lamp", lamp_2)
+    trie.remove("unknown", lamp_2)
+    assert [result[2] for result in trie.find("lamp 2")] == ["lamp 2"]
+
+    trie.remove("lamp 2", "lamp 2")
+    assert list(trie.find("lamp 2")) == []
+    # Nodes of removed names are pruned
+    assert list(trie._root.children) == ["k"]
+
+
+def test_entity_name_index() -> None:
+    """Test the names of an entity are replaced when it changes."""
+    index = EntityNameIndex()
+    context = {"domain": "light"}
+    index.async_set(
+        "light.kitchen",
+        [("Ceiling", "Ceiling", context), ("Kitchen Light", "Kitchen Light", context)],
+    )
+    index.async_set("light.hall", [("Hall Light", "Hall Light", context)])
+    assert len(index) == 2
+
+    name_list = index.find("Turn on the  KITCHEN light")
+    assert [value.value_out for value in name_list.values] == ["Kitchen Light"]
+    assert name_list.values[0].context == context
+
+    index.async_set("light.kitchen", [("Pantry", "Pantry", context)])
+    assert index.find("turn on kitchen light").values == []
+    assert [value.value_out for value in index.find("pantry").values] == ["Pantry"]
+
+    index.async_remove("light.kitchen")
+    index.async_remove("light.kitchen")
+    assert len(index) == 1
+    assert index.find("pantry").values == []
@@ -1,6 +1,7 @@
 """The test for the data filter sensor platform."""
 
-from datetime import timedelta
+from datetime import datetime, timedelta
+import statistics
 from unittest.mock import patch
 
 import pytest
@@ -220,6 +221,89 @@ async def test_source_state_none(recorder_mock: Recorder, hass: HomeAssistant) -
     assert state.state == STATE_UNKNOWN
 
 
+async def test_history_batched(recorder_mock: Recorder, hass: HomeAssistant) -> None:
+    """Test the history of the same source is loaded once for all filters."""
+    config = {
+        "sensor": [
+            {
+                "platform": "filter",
+                "name": "outlier",
+                "entity_id": "sensor.test_monitored",
+                "filters": [{"filter": "outlier", "window_size": 2, "radius": 4.0}],
+            },
+            {
+                "platform": "filter",
+                "name": "throttle",
+                "entity_id": "sensor.test_monitored",
+                "filters": [
+                    {"filter": "throttle", "window_size": 3},
+                    {"filter": "time_throttle", "window_size": "00:01"},
+                ],
+            },
+        ]
+    }
+
+    t_0 = dt_util.utcnow() - timedelta(minutes=1)
+    t_1 = dt_util.utcnow() - timedelta(minutes=2)
+    t_2 = dt_util.utcnow() - timedelta(minutes=3)
+    fake_states = {
+        "sensor.test_monitored": [
+            State("sensor.test_monitored", "18.2", last_updated=t_2),
+            State("sensor.test_monitored", "19.0", last_updated=t_1),
+            State("sensor.test_monitored", "18.0", last_updated=t_0),
+        ]
+    }
+    with (
+        patch(
+            "homeassistant.components.recorder.history.state_changes_during_period",
+            return_value=fake_states,
+        ) as mock_state_changes,
+        patch(
+            "homeassistant.components.recorder.history.get_last_state_changes",
+            return_value=fake_states,
+        ) as mock_last_changes,
+        assert_setup_component(2, "sensor"),
+    ):
+        assert await async_setup_component(hass, "sensor", config)
+        await hass.async_block_till_done()
+
+    assert mock_state_changes.call_count == 1
+    assert mock_last_changes.call_count == 1
+    assert mock_last_changes.call_args[0][1] == 3
+    assert hass.states.get("sensor.outlier").state == "18.0"
+    # The throttle lets the first of the three replayed states through
+    assert hass.states.get("sensor.throttle").state == "18.2"
+
+
+async def test_history_load_failed(
+    recorder_mock: Recorder, hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the source is tracked when its history cannot be loaded."""
+    config = {
+        "sensor": {
+            "platform": "filter",
+            "name": "test",
+            "entity_id": "sensor.test_monitored",
+            "filters": [{"filter": "outlier", "window_size": 2, "radius": 4.0}],
+        }
+    }
+
+    with (
+        patch(
+            "homeassistant.components.recorder.history.get_last_state_changes",
+            side_effect=RuntimeError("Database error"),
+        ),
+        assert_setup_component(1, "sensor"),
+    ):
+        assert await async_setup_component(hass, "sensor", config)
+        await hass.async_block_till_done()
+
+    assert "Error loading the history of sensor.test_monitored" in caplog.text
+    hass.states.async_set("sensor.test_monitored", "18.0")
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.test").state == "18.0"
+
+
 async def test_history_time(recorder_mock: Recorder, hass: HomeAssistant) -> None:
     """Test loading from history based on a time window."""
     config = {
@@ -377,6 +461,36 @@ async def test_outlier(values: list[State]) -> None:
     assert filtered.state == 21
 
 
+def test_outlier_sliding_median() -> None:
+    """Test the outlier filter compares with the median of the sliding window."""
+    filt = OutlierFilter(window_size=4, precision=2, entity=None, radius=10.0)
+    timestamp = dt_util.utcnow()
+    raw_values = [5, 1, 9, 3, 7, 40, 2, 8, 2, -30, 6, 4]
+    window: list[float] = []
+    for value in raw_values:
+        filtered = filt.filter_state(
+            State("sensor.test_monitored", str(value), last_updated=timestamp)
+        )
+        if len(window) == 4 and abs(value - statistics.median(window)) > 10.0:
+            assert filtered.state == statistics.median(window)
+        else:
+            assert filtered.state == value
+        window = [*window, value][-4:]
+        timestamp += timedelta(seconds=1)
+
+
+def test_outlier_not_finite() -> None:
+    """Test the outlier filter leaves values which are not finite out of the median."""
+    filt = OutlierFilter(window_size=3, precision=2, entity=None, radius=4.0)
+    timestamp = dt_util.utcnow()
+    for value in ("20", "nan", "21", "inf", "22", "nan", "23", "24", "100"):
+        filtered = filt.filter_state(
+            State("sensor.test_monitored", value, last_updated=timestamp)
+        )
+        timestamp += timedelta(seconds=1)
+    assert filtered.state == 23.5
+
+
 def test_outlier_step(values: list[State]) -> None:
     """Test step-change handling in outlier.
 
@@ -488,6 +602,37 @@ def test_time_throttle(values: list[State]) -> None:
     assert [f.state for f in filtered] == [20, 18, 22]
 
 
+def test_time_sma_sliding_window() -> None:
+    """Test the time_sma filter over a window that moves over many states."""
+    window = timedelta(seconds=10)
+    filt = TimeSMAFilter(window_size=window, precision=4, entity=None, type="last")
+    start = dt_util.utcnow()
+    samples = [(start + timedelta(seconds=3 * idx), idx % 7) for idx in range(40)]
+    previous: list[tuple[datetime, float]] = []
+    for timestamp, value in samples:
+        filtered = filt.filter_state(
+            State("sensor.test_monitored", str(value), last_updated=timestamp)
+        )
+        if previous:
+            # The value of a state holds until the next state
+            window_start = timestamp - window
+            moving_sum = 0.0
+            for (current_ts, current_value), (next_ts, _) in zip(
+                previous, [*previous[1:], (timestamp, value)], strict=True
+            ):
+                segment_start = max(current_ts, window_start)
+                if next_ts > segment_start:
+                    moving_sum += (
+                        next_ts - segment_start
+                    ).total_seconds() * current_value
+            if previous[0][0] > window_start:
+                moving_sum += (
+                    previous[0][0] - window_start
+                ).total_seconds() * previous[0][1]
+            assert filtered.state == round(moving_sum / 10, 4)
+        previous.append((timestamp, value))
+
+
 def test_time_sma(values: list[State]) -> None:
     """Test if time_sma filter works."""
     filt = TimeSMAFilter(
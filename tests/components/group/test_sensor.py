@@ -1007,3 +1007,104 @@ async def test_sensor_different_attributes_ignore_non_numeric(
             state.attributes.get("unit_of_measurement")
             == test_case["expected_unit_of_measurement"]
         )
+
+
+@pytest.mark.parametrize(
+    ("sensor_type", "calculate", "attribute"),
+    [
+        ("min", min, ATTR_MIN_ENTITY_ID),
+        ("max", max, ATTR_MAX_ENTITY_ID),
+        ("range", lambda values: max(values) - min(values), None),
+        ("mean", statistics.mean, None),
+        ("sum", sum, None),
+        ("median", statistics.median, None),
+    ],
+)
+async def test_sensor_incremental_updates(
+    hass: HomeAssistant,
+    sensor_type: str,
+    calculate: Any,
+    attribute: str | None,
+) -> None:
+    """Test the group value follows changes of single members."""
+    entity_ids = [f"sensor.test_{idx}" for idx in range(5)]
+    config = {
+        SENSOR_DOMAIN: {
+            "platform": GROUP_DOMAIN,
+            "name": "test_incremental",
+            "type": sensor_type,
+            "ignore_non_numeric": True,
+            "entities": entity_ids,
+        }
+    }
+    values: dict[str, float] = {}
+    for idx, entity_id in enumerate(entity_ids):
+        values[entity_id] = float(idx)
+        hass.states.async_set(entity_id, idx)
+    assert await async_setup_component(hass, "sensor", config)
+    await hass.async_block_till_done()
+
+    changes: list[tuple[str, float | str | None]] = [
+        ("sensor.test_4", 1.5),
+        ("sensor.test_0", 7),
+        ("sensor.test_0", 2),
+        ("sensor.test_2", "string"),
+        ("sensor.test_1", None),
+        ("sensor.test_3", 2),
+        ("sensor.test_1", -3.25),
+        ("sensor.test_2", 0.1),
+    ]
+    for entity_id, value in changes:
+        if value is None:
+            hass.states.async_remove(entity_id)
+        else:
+            hass.states.async_set(entity_id, value)
+        await hass.async_block_till_done()
+        values.pop(entity_id, None)
+        if isinstance(value, (int, float)):
+            values[entity_id] = float(value)
+
+        state = hass.states.get("sensor.test_incremental")
+        assert float(state.state) == pytest.approx(calculate(values.values()))
+        if attribute:
+            # Ties are won by the member listed first
+            expected_id = next(
+                entity_id
+                for entity_id in entity_ids
+                if values.get(entity_id) == calculate(values.values())
+            )
+            assert state.attributes[attribute] == expected_id
+
+
+@pytest.mark.parametrize(
+    ("sensor_type", "expected"),
+    [
+        ("sum", ["1.0", "0.0", "0.0", "1.0"]),
+        ("mean", ["0.333333333333333", "0.0", "0.0", "0.333333333333333"]),
+    ],
+)
+async def test_sensor_exact_running_sum(
+    hass: HomeAssistant, sensor_type: str, expected: list[str]
+) -> None:
+    """Test the running sum is exact and ignores values which are not finite."""
+    entity_ids = ["sensor.test_1", "sensor.test_2", "sensor.test_3"]
+    config = {
+        SENSOR_DOMAIN: {
+            "platform": GROUP_DOMAIN,
+            "name": "test_exact",
+            "type": sensor_type,
+            "ignore_non_numeric": True,
+            "entities": entity_ids,
+        }
+    }
+    # Summed as floats in this order, the 1 would be lost
+    for entity_id, value in zip(entity_ids, ("1e16", "1", "-1e16"), strict=True):
+        hass.states.async_set(entity_id, value)
+    assert await async_setup_component(hass, "sensor", config)
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.test_exact").state == expected[0]
+
+    for value, expected_state in zip(("inf", "nan", "1"), expected[1:], strict=True):
+        hass.states.async_set("sensor.test_2", value)
+        await hass.async_block_till_done()
+        assert hass.states.get("sensor.test_exact").state == expected_state
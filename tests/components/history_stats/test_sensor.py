@@ -14,6 +14,7 @@ from homeassistant.components.history_stats.const import (
     DEFAULT_NAME,
     DOMAIN,
 )
+from homeassistant.components.history_stats.data import DATA_SOURCE_HISTORY
 from homeassistant.components.history_stats.sensor import (
     PLATFORM_SCHEMA as SENSOR_SCHEMA,
 )
@@ -1729,7 +1730,94 @@ async def test_history_stats_handles_floored_timestamps(
         await async_update_entity(hass, "sensor.sensor1")
         await hass.async_block_till_done()
 
-    assert last_times == (start_time, start_time + timedelta(hours=2))
+    # The history of the source entity is loaded up to now
+    assert last_times == (start_time, None)
+
+
+async def test_shared_source_history(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test sensors of the same entity share its history and keep it up to date."""
+    start_time = dt_util.utcnow().replace(microsecond=0)
+    t0 = start_time - timedelta(minutes=30)
+    query_count = 0
+
+    def _fake_states(*args, **kwargs):
+        nonlocal query_count
+        query_count += 1
+        return {
+            "binary_sensor.test_id": [
+                ha.State("binary_sensor.test_id", "on", last_changed=t0),
+            ]
+        }
+
+    with (
+        patch(
+            "homeassistant.components.recorder.history.state_changes_during_period",
+            _fake_states,
+        ),
+        freeze_time(start_time) as freezer,
+    ):
+        await async_setup_component(
+            hass,
+            "sensor",
+            {
+                "sensor": [
+                    {
+                        "platform": "history_stats",
+                        "entity_id": "binary_sensor.test_id",
+                        "name": f"sensor_{sensor_type}",
+                        "state": "on",
+                        "start": "{{ as_timestamp(utcnow()) - 3600 }}",
+                        "end": "{{ utcnow() }}",
+                        "type": sensor_type,
+                    }
+                    for sensor_type in ("time", "count")
+                ]
+                + [
+                    {
+                        "platform": "history_stats",
+                        "entity_id": "binary_sensor.test_id",
+                        "name": "sensor_future",
+                        "state": "on",
+                        "start": "{{ as_timestamp(utcnow()) + 3600 }}",
+                        "duration": {"hours": 1},
+                        "type": "time",
+                    }
+                ]
+            },
+        )
+        await hass.async_block_till_done()
+        query_count = 0
+
+        for sensor_type in ("time", "count"):
+            await async_update_entity(hass, f"sensor.sensor_{sensor_type}")
+        await hass.async_block_till_done()
+        # The history is loaded once for both sensors
+        assert query_count == 1
+        assert hass.states.get("sensor.sensor_time").state == "0.5"
+        assert hass.states.get("sensor.sensor_count").state == "1"
+
+        hass.states.async_set("binary_sensor.test_id", "off")
+        await hass.async_block_till_done()
+        freezer.tick(timedelta(minutes=10))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        assert hass.states.get("sensor.sensor_time").state == "0.5"
+
+        hass.states.async_set("binary_sensor.test_id", "on")
+        await hass.async_block_till_done()
+        freezer.tick(timedelta(minutes=65))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        assert hass.states.get("sensor.sensor_time").state == "1.0"
+        assert hass.states.get("sensor.sensor_count").state == "1"
+
+        # The state changes before the window are trimmed without a new query,
+        # the sensor without a window does not keep them
+        source = hass.data[DATA_SOURCE_HISTORY]["binary_sensor.test_id"]
+        assert source.states == ["on"]
+        assert query_count == 1
 
 
 async def test_unique_id(
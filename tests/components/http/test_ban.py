@@ -16,6 +16,9 @@ from homeassistant.components.http.ban import (
     IP_BANS_FILE,
     KEY_BAN_MANAGER,
     KEY_FAILED_LOGIN_ATTEMPTS,
+    LOGIN_ATTEMPTS_WINDOW,
+    MAX_LOGIN_ATTEMPTS_ADDRESSES,
+    FailedLoginAttempts,
     process_success_login,
     setup_bans,
 )
@@ -410,3 +413,68 @@ async def test_single_ban_file_entry(
         await manager.async_add_ban(remote_ip)
 
     assert m_open.call_count == 1
+
+
+async def test_access_from_banned_network(
+    hass: HomeAssistant, aiohttp_client: ClientSessionGenerator
+) -> None:
+    """Test accessing to server from an address of a banned network."""
+    app = web.Application()
+    app[KEY_HASS] = hass
+    setup_bans(hass, app, 5)
+    set_real_ip = mock_real_ip(app)
+
+    with patch(
+        "homeassistant.components.http.ban.load_yaml_config_file",
+        return_value={
+            "200.201.202.0/24": {"banned_at": "2016-11-16T19:20:03"},
+            "2001:db8:1::/48": {"banned_at": "2016-11-16T19:20:03"},
+        },
+    ):
+        client = await aiohttp_client(app)
+
+    for remote_addr in ("200.201.202.1", "200.201.202.255", "2001:db8:1:2::3"):
+        set_real_ip(remote_addr)
+        resp = await client.get("/")
+        assert resp.status == HTTPStatus.FORBIDDEN
+
+    for remote_addr in ("200.201.203.1", "2001:db8:2::1"):
+        set_real_ip(remote_addr)
+        resp = await client.get("/")
+        assert resp.status == HTTPStatus.NOT_FOUND
+
+
+async def test_failed_login_attempts_window() -> None:
+    """Test failed login attempts are counted within a window per client."""
+    attempts = FailedLoginAttempts(3)
+    remote_ip = ip_address("200.201.202.204")
+
+    with patch("homeassistant.components.http.ban.time.monotonic", return_value=0):
+        assert attempts.async_add(remote_ip) == 1
+        assert attempts.async_add(remote_ip) == 2
+        # Other addresses of the same IPv6 prefix are counted together
+        assert attempts.async_add(ip_address("2001:db8::1")) == 1
+        assert attempts.async_add(ip_address("2001:db8::2")) == 2
+        assert attempts[ip_address("2001:db8::3")] == 2
+        assert attempts[ip_address("2001:db8:0:1::1")] == 0
+
+    with patch(
+        "homeassistant.components.http.ban.time.monotonic",
+        return_value=LOGIN_ATTEMPTS_WINDOW + 1,
+    ):
+        assert attempts[remote_ip] == 0
+        assert attempts.async_add(remote_ip) == 1
+        assert attempts.async_reset(remote_ip)
+        assert not attempts.async_reset(remote_ip)
+
+
+async def test_failed_login_attempts_bounded() -> None:
+    """Test failed login attempts are only kept for a number of addresses."""
+    attempts = FailedLoginAttempts(3)
+    first_ip = ip_address("10.0.0.1")
+    attempts.async_add(first_ip)
+
+    for index in range(MAX_LOGIN_ATTEMPTS_ADDRESSES):
+        attempts.async_add(ip_address(f"10.1.{index // 256}.{index % 256}"))
+
+    assert attempts[first_ip] == 0
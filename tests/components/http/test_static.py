@@ -1,5 +1,6 @@
 """The tests for http static files."""
 
+import gzip
 from http import HTTPStatus
 from pathlib import Path
 
@@ -7,7 +8,7 @@ from aiohttp.test_utils import TestClient
 import pytest
 
 from homeassistant.components.http import StaticPathConfig
-from homeassistant.components.http.static import CachingStaticResource
+from homeassistant.components.http.static import CACHE_HEADER, CachingStaticResource
 from homeassistant.const import EVENT_HOMEASSISTANT_START
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.http import KEY_ALLOW_CONFIGURED_CORS
@@ -63,3 +64,89 @@ async def test_async_register_static_paths(
     assert resp.status == HTTPStatus.OK
     resp = await client.get("/something_else/__init__.py")
     assert resp.status == HTTPStatus.OK
+
+
+async def test_static_file_served_from_memory(
+    hass: HomeAssistant, mock_http_client: TestClient, tmp_path: Path
+) -> None:
+    """Test small static files are compressed once and served from memory."""
+    app = hass.http.app
+    resource = CachingStaticResource("/memory", tmp_path, immutable=True)
+    app.router.register_resource(resource)
+    app[KEY_ALLOW_CONFIGURED_CORS](resource)
+    content = "console.log('hello');\n" * 100
+    file = tmp_path / "app.js"
+    file.write_text(content)
+
+    resp = await mock_http_client.get("/memory/app.js")
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert resp.headers["Cache-Control"] == CACHE_HEADER
+    assert resp.content_type == "text/javascript"
+    assert await resp.text() == content
+    etag = resp.headers["ETag"]
+
+    # The file is no longer read from disk
+    file.unlink()
+    resp = await mock_http_client.get("/memory/app.js")
+    assert resp.status == HTTPStatus.OK
+    assert await resp.text() == content
+
+    resp = await mock_http_client.get("/memory/app.js", headers={"If-None-Match": etag})
+    assert resp.status == HTTPStatus.NOT_MODIFIED
+    assert resp.headers["ETag"] == etag
+    assert resp.headers["Last-Modified"]
+
+    # Clients refusing gzip get the file from disk
+    resp = await mock_http_client.get(
+        "/memory/app.js", headers={"Accept-Encoding": "gzip;q=0, deflate"}
+    )
+    assert resp.status == HTTPStatus.NOT_FOUND
+
+
+async def test_static_file_precompressed_variant(
+    hass: HomeAssistant, mock_http_client: TestClient, tmp_path: Path
+) -> None:
+    """Test a compressed variant next to a file is served when accepted."""
+    app = hass.http.app
+    resource = CachingStaticResource("/variant", tmp_path, immutable=True)
+    app.router.register_resource(resource)
+    app[KEY_ALLOW_CONFIGURED_CORS](resource)
+    content = b"body { color: red; }\n" * 100
+    (tmp_path / "style.css").write_bytes(content)
+    (tmp_path / "style.css.gz").write_bytes(gzip.compress(content))
+
+    resp = await mock_http_client.get("/variant/style.css")
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert await resp.read() == content
+
+    # Clients not accepting the variant get the file from disk
+    resp = await mock_http_client.get(
+        "/variant/style.css", headers={"Accept-Encoding": "identity"}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert "Content-Encoding" not in resp.headers
+    assert await resp.read() == content
+
+
+async def test_static_file_not_immutable(
+    hass: HomeAssistant, mock_http_client: TestClient, tmp_path: Path
+) -> None:
+    """Test files of a directory which is not immutable are read from disk."""
+    app = hass.http.app
+    resource = CachingStaticResource("/local", tmp_path)
+    app.router.register_resource(resource)
+    app[KEY_ALLOW_CONFIGURED_CORS](resource)
+    file = tmp_path / "card.js"
+    file.write_text("console.log('old');")
+
+    resp = await mock_http_client.get("/local/card.js")
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["Cache-Control"] == CACHE_HEADER
+    assert await resp.text() == "console.log('old');"
+
+    file.write_text("console.log('new');")
+    resp = await mock_http_client.get("/local/card.js")
+    assert resp.status == HTTPStatus.OK
+    assert await resp.text() == "console.log('new');"
@@ -1013,3 +1013,49 @@ async def test_search(
         ),
         ItemType.SCRIPT: unordered(["script.device", "script.hue"]),
     }
+
+
+async def test_search_index_updates(hass: HomeAssistant) -> None:
+    """Test the items referencing an entity follow reloads and member changes."""
+    assert await async_setup_component(hass, "search", {})
+    assert await async_setup_component(
+        hass,
+        "group",
+        {"group": {"lights": {"entities": ["light.kitchen"]}}},
+    )
+    await hass.async_block_till_done()
+
+    def search(entity_id: str) -> dict[str, set[str]]:
+        """Search."""
+        return Searcher(hass, {}).async_search(ItemType.ENTITY, entity_id)
+
+    assert search("light.kitchen") == {ItemType.GROUP: {"group.lights"}}
+    assert search("light.living_room") == {}
+
+    # Members of a group change
+    await hass.services.async_call(
+        "group",
+        "set",
+        {"object_id": "lights", "entities": ["light.living_room"]},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+    assert search("light.kitchen") == {}
+    assert search("light.living_room") == {ItemType.GROUP: {"group.lights"}}
+
+    # A group is added
+    await hass.services.async_call(
+        "group",
+        "set",
+        {"object_id": "kitchen", "entities": ["light.kitchen"]},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+    assert search("light.kitchen") == {ItemType.GROUP: {"group.kitchen"}}
+
+    # A group is removed
+    await hass.services.async_call(
+        "group", "remove", {"object_id": "lights"}, blocking=True
+    )
+    await hass.async_block_till_done()
+    assert search("light.living_room") == {}
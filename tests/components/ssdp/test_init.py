@@ -1094,3 +1094,38 @@ async def test_ssdp_rediscover_no_match(
     await hass.async_block_till_done()
 
     assert len(mock_flow_init.mock_calls) == 1
+
+
+def test_integration_matchers() -> None:
+    """Test matching domains with matchers with several primary keys."""
+    integration_matchers = ssdp.IntegrationMatchers()
+    integration_matchers.async_setup(
+        {
+            "domain_1": [
+                {"st": "mock-st", "manufacturer": "Paulus", "modelName": "Model 1"}
+            ],
+            "domain_2": [
+                {"st": "mock-st"},
+                {"deviceType": "Paulus Device"},
+            ],
+            "domain_3": [{"modelName": "Model 1"}],
+        }
+    )
+
+    assert integration_matchers.async_matching_domains(
+        CaseInsensitiveDict(
+            st="mock-st",
+            manufacturer="Paulus",
+            modelName="Model 1",
+            deviceType="Paulus Device",
+        )
+    ) == {"domain_1", "domain_2"}
+    assert integration_matchers.async_matching_domains(
+        CaseInsensitiveDict(st="mock-st", manufacturer="Paulus", modelName="Model 2")
+    ) == {"domain_2"}
+    assert (
+        integration_matchers.async_matching_domains(
+            CaseInsensitiveDict(manufacturer="Paulus", modelName="Model 1")
+        )
+        == set()
+    )
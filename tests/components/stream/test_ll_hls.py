@@ -716,3 +716,29 @@ async def test_get_part_segments(
     )
 
     stream_worker_sync.resume()
+
+
+def test_segment_data_joined_once() -> None:
+    """Test the data of a complete segment is joined once and shared by parts."""
+    segment = create_segment(sequence=0)
+    parts = create_parts(SEQUENCE_BYTES)
+    for part in parts[:-1]:
+        segment.async_add_part(part, 0)
+    assert segment.get_data() == SEQUENCE_BYTES[:-BYTERANGE_LENGTH]
+    assert not isinstance(segment.parts[0].data, memoryview)
+
+    segment.async_add_part(parts[-1], SEGMENT_DURATION)
+
+    data = segment.get_data()
+    assert data == SEQUENCE_BYTES
+    assert segment.get_data() is data
+    assert segment.data_size == len(SEQUENCE_BYTES)
+    for part_num, part in enumerate(segment.parts):
+        assert isinstance(part.data, memoryview)
+        assert part.data.obj is data
+        assert (
+            part.data
+            == SEQUENCE_BYTES[
+                part_num * BYTERANGE_LENGTH : (part_num + 1) * BYTERANGE_LENGTH
+            ]
+        )
@@ -2,6 +2,7 @@
 
 import asyncio
 from collections import defaultdict
+import importlib
 import json
 from typing import Any
 from unittest.mock import patch
@@ -788,6 +789,148 @@ async def test_trace_no_traces(
     assert len(_find_traces(response["result"], domain, "sun")) == 0
 
 
+@pytest.mark.parametrize("domain", ["automation", "script"])
+@pytest.mark.parametrize(
+    ("trace_config", "global_config", "num_moon_traces", "num_sun_traces"),
+    [
+        ({}, {}, 4, 2),
+        ({"mode": "always"}, {"mode": "off"}, 4, 2),
+        ({"mode": "off"}, {}, 0, 0),
+        ({}, {"mode": "off"}, 0, 0),
+        ({"mode": "on_error"}, {}, 0, 2),
+        ({"mode": "sampled"}, {}, 1, 1),
+        ({"mode": "sampled", "sample_interval": 2}, {}, 2, 1),
+        ({}, {"mode": "sampled", "sample_interval": 3}, 2, 1),
+    ],
+)
+async def test_trace_mode(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    domain: str,
+    trace_config: dict[str, Any],
+    global_config: dict[str, Any],
+    num_moon_traces: int,
+    num_sun_traces: int,
+) -> None:
+    """Test the trace mode of a script or automation."""
+    msg_id = 1
+
+    def next_id():
+        nonlocal msg_id
+        msg_id += 1
+        return msg_id
+
+    assert await async_setup_component(hass, "trace", {"trace": global_config})
+    sun_config = {
+        "id": "sun",
+        "triggers": {"platform": "event", "event_type": "test_event"},
+        "actions": {"service": "test.automation"},
+        "trace": trace_config,
+    }
+    moon_config = {
+        "id": "moon",
+        "triggers": {"platform": "event", "event_type": "test_event2"},
+        "actions": {"event": "another_event"},
+        "trace": trace_config,
+    }
+    if domain == "script":
+        configs = {
+            config["id"]: {"sequence": config["actions"], "trace": trace_config}
+            for config in (sun_config, moon_config)
+        }
+    else:
+        configs = [sun_config, moon_config]
+    assert await async_setup_component(hass, domain, {domain: configs})
+
+    client = await hass_ws_client()
+
+    for _ in range(4):
+        await _run_automation_or_script(hass, domain, moon_config, "test_event2")
+        await hass.async_block_till_done()
+    for _ in range(2):
+        await _run_automation_or_script(hass, domain, sun_config, "test_event")
+        await hass.async_block_till_done()
+
+    await client.send_json({"id": next_id(), "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    assert len(_find_traces(response["result"], domain, "moon")) == num_moon_traces
+    sun_traces = _find_traces(response["result"], domain, "sun")
+    assert len(sun_traces) == num_sun_traces
+    assert all(trace["error"] for trace in sun_traces)
+
+
+@pytest.mark.parametrize(
+    ("domain", "prefix", "trace_class"),
+    [
+        ("automation", "action", "AutomationTrace"),
+        ("script", "sequence", "ScriptTrace"),
+    ],
+)
+async def test_trace_mode_off(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    domain: str,
+    prefix: str,
+    trace_class: str,
+) -> None:
+    """Test no trace is built when tracing is off, unless breakpoints are set."""
+    assert await async_setup_component(hass, "trace", {"trace": {"mode": "off"}})
+    sun_config = {
+        "id": "sun",
+        "triggers": {"platform": "event", "event_type": "test_event"},
+        "actions": [{"event": "event0"}, {"event": "event1"}],
+    }
+    await _setup_automation_or_script(hass, domain, [sun_config])
+    trace_module = importlib.import_module(f"homeassistant.components.{domain}.trace")
+    real_class = getattr(trace_module, trace_class)
+
+    client = await hass_ws_client()
+
+    with patch.object(trace_module, trace_class, wraps=real_class) as mock_trace:
+        await _run_automation_or_script(hass, domain, sun_config, "test_event")
+        await hass.async_block_till_done()
+        assert mock_trace.call_count == 0
+
+        await client.send_json({"id": 2, "type": "trace/debug/breakpoint/subscribe"})
+        response = await client.receive_json()
+        assert response["success"]
+        await client.send_json(
+            {
+                "id": 3,
+                "type": "trace/debug/breakpoint/set",
+                "domain": domain,
+                "item_id": "sun",
+                "node": f"{prefix}/1",
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+
+        await _run_automation_or_script(hass, domain, sun_config, "test_event")
+        response = await client.receive_json()
+        assert mock_trace.call_count == 1
+        assert response["event"]["node"] == f"{prefix}/1"
+
+        await client.send_json(
+            {
+                "id": 4,
+                "type": "trace/debug/continue",
+                "domain": domain,
+                "item_id": "sun",
+                "run_id": response["event"]["run_id"],
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        await hass.async_block_till_done()
+
+    await client.send_json({"id": 5, "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    assert _find_traces(response["result"], domain, "sun") == []
+
+
 @pytest.mark.parametrize(
     ("domain", "prefix", "trigger", "last_step", "script_execution"),
     [
@@ -1009,6 +1152,47 @@ async def test_nested_traces(
     assert child_id == {"domain": "script", "item_id": "moon", "run_id": moon_run_id}
 
 
+async def test_nested_trace_not_stored(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test a parent trace is not linked to a child trace which is not stored."""
+    sun_config = {
+        "id": "sun",
+        "triggers": {"platform": "event", "event_type": "test_event"},
+        "actions": {"service": "script.moon"},
+    }
+    moon_config = {
+        "moon": {"sequence": {"event": "another_event"}, "trace": {"mode": "off"}}
+    }
+    await _setup_automation_or_script(hass, "automation", [sun_config], moon_config)
+
+    client = await hass_ws_client()
+
+    await _run_automation_or_script(hass, "automation", sun_config, "test_event")
+    await hass.async_block_till_done()
+
+    await client.send_json({"id": 1, "type": "trace/list", "domain": "script"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert len(_find_traces(response["result"], "script", "moon")) == 0
+    await client.send_json({"id": 2, "type": "trace/list", "domain": "automation"})
+    response = await client.receive_json()
+    sun_run_id = _find_run_id(response["result"], "automation", "sun")
+
+    await client.send_json(
+        {
+            "id": 3,
+            "type": "trace/get",
+            "domain": "automation",
+            "item_id": "sun",
+            "run_id": sun_run_id,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert "child_id" not in response["result"]["trace"]["action/0"][0]
+
+
 @pytest.mark.parametrize(
     ("domain", "prefix"), [("automation", "action"), ("script", "sequence")]
 )
@@ -2,6 +2,7 @@
 
 import asyncio
 from http import HTTPStatus
+import os
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -41,6 +42,7 @@ from .common import (
 
 from tests.common import (
     MockModule,
+    async_fire_time_changed,
     async_mock_service,
     mock_integration,
     mock_platform,
@@ -1992,3 +1994,135 @@ async def test_default_engine_prefer_cloud_entity(
 
     # Reset the `cloud` translations cache to avoid flaky translation checks
     reset_translation_cache(hass, ["cloud"])
+
+
+class MockEntityMessageAudio(MockTTSEntity):
+    """Mock entity returning the message as audio."""
+
+    def get_tts_audio(
+        self, message: str, language: str, options: dict[str, Any]
+    ) -> tts.TtsAudioType:
+        """Load TTS dat."""
+        return ("mp3", message.encode() * 50)
+
+
+@pytest.mark.parametrize("mock_tts_entity", [MockEntityMessageAudio(DEFAULT_LANG)])
+async def test_mem_cache_size_limit(
+    hass: HomeAssistant,
+    mock_tts_cache_dir: Path,
+    mock_tts_entity: MockTTSEntity,
+) -> None:
+    """Test the least recently used voice is removed from a full memcache."""
+    await mock_config_entry_setup(hass, mock_tts_entity)
+    tts_manager = hass.data[tts.DATA_TTS_MANAGER]
+    tts_manager.mem_cache_max_bytes = 1000
+
+    for idx in range(5):
+        await tts_manager.async_get_tts_audio("tts.test", f"msg{idx}", cache=False)
+    assert len(tts_manager.mem_cache) == 5
+
+    # Use the oldest voice again, so the next oldest is removed instead
+    _, voice = await tts_manager.async_get_tts_audio("tts.test", "msg0", cache=False)
+    assert voice == b"msg0" * 50
+    await tts_manager.async_get_tts_audio("tts.test", "msg5", cache=False)
+
+    assert [cached["voice"][:4] for cached in tts_manager.mem_cache.values()] == [
+        b"msg2",
+        b"msg3",
+        b"msg4",
+        b"msg0",
+        b"msg5",
+    ]
+
+
+async def test_cache_index(
+    hass: HomeAssistant,
+    hass_client: ClientSessionGenerator,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+    mock_tts_cache_dir: Path,
+    mock_tts_get_cache_files: MagicMock,
+    mock_tts_entity: MockTTSEntity,
+) -> None:
+    """Test the file cache is loaded from the cache index and streamed from disk."""
+    cache_key = "42f18378fd4393d18c8dd11d03fa9563c1e54491_en-us_-_tts.test"
+    await hass.async_add_executor_job(
+        (mock_tts_cache_dir / f"{cache_key}.mp3").write_bytes, b"cached voice"
+    )
+    cache_dir_stat = await hass.async_add_executor_job(os.stat, mock_tts_cache_dir)
+    hass_storage[tts.STORAGE_KEY] = {
+        "version": tts.STORAGE_VERSION,
+        "key": tts.STORAGE_KEY,
+        "data": {
+            "cache_dir": str(mock_tts_cache_dir),
+            "cache_dir_mtime": cache_dir_stat.st_mtime_ns,
+            "files": {cache_key: f"{cache_key}.mp3"},
+        },
+    }
+    await mock_config_entry_setup(hass, mock_tts_entity)
+
+    # The cache folder was not modified since the index was saved
+    tts_manager = hass.data[tts.DATA_TTS_MANAGER]
+    assert tts_manager.file_cache == {cache_key: f"{cache_key}.mp3"}
+    mock_tts_get_cache_files.assert_not_called()
+
+    url = await tts_manager.async_get_url_path(
+        "tts.test", "There is someone at the door."
+    )
+    client = await hass_client()
+    req = await client.get(url)
+    assert req.status == HTTPStatus.OK
+    assert req.content_type == "audio/mpeg"
+    assert await req.read() == b"cached voice"
+    assert not tts_manager.mem_cache
+
+    # A file removed from disk is removed from the index when requested
+    await hass.async_add_executor_job((mock_tts_cache_dir / f"{cache_key}.mp3").unlink)
+    req = await client.get(url)
+    assert req.status == HTTPStatus.NOT_FOUND
+    assert cache_key not in tts_manager.file_cache
+
+    freezer.tick(tts.INDEX_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass_storage[tts.STORAGE_KEY]["data"]["files"] == {}
+
+
+async def test_cache_index_cache_dir_modified(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+    mock_tts_cache_dir: Path,
+    mock_tts_get_cache_files: MagicMock,
+    mock_tts_entity: MockTTSEntity,
+) -> None:
+    """Test the cache folder is scanned when it was modified after the index."""
+    indexed_key = "42f18378fd4393d18c8dd11d03fa9563c1e54491_en-us_-_tts.test"
+    unindexed_key = "0123456789abcdef0123456789abcdef01234567_en-us_-_tts.test"
+    await hass.async_add_executor_job(
+        (mock_tts_cache_dir / f"{unindexed_key}.mp3").write_bytes, b"cached voice"
+    )
+    hass_storage[tts.STORAGE_KEY] = {
+        "version": tts.STORAGE_VERSION,
+        "key": tts.STORAGE_KEY,
+        "data": {
+            "cache_dir": str(mock_tts_cache_dir),
+            "cache_dir_mtime": 0,
+            "files": {indexed_key: f"{indexed_key}.mp3"},
+        },
+    }
+    await mock_config_entry_setup(hass, mock_tts_entity)
+
+    tts_manager = hass.data[tts.DATA_TTS_MANAGER]
+    mock_tts_get_cache_files.assert_called_once()
+    assert tts_manager.file_cache == {unindexed_key: f"{unindexed_key}.mp3"}
+
+    freezer.tick(tts.INDEX_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    cache_dir_stat = await hass.async_add_executor_job(os.stat, mock_tts_cache_dir)
+    assert hass_storage[tts.STORAGE_KEY]["data"] == {
+        "cache_dir": str(mock_tts_cache_dir),
+        "cache_dir_mtime": cache_dir_stat.st_mtime_ns,
+        "files": {unindexed_key: f"{unindexed_key}.mp3"},
+    }
@@ -262,11 +262,19 @@ async def test_and_condition_with_template(hass: HomeAssistant) -> None:
 
     hass.states.async_set("sensor.temperature", 120)
     assert not test(hass)
+    # The numeric_state condition is cheaper and evaluated before the template
     assert_condition_trace(
         {
             "": [{"result": {"result": False}}],
-            "conditions/0": [
-                {"result": {"entities": ["sensor.temperature"], "result": False}}
+            "conditions/1": [{"result": {"result": False}}],
+            "conditions/1/entity_id/0": [
+                {
+                    "result": {
+                        "result": False,
+                        "state": 120.0,
+                        "wanted_state_below": 110.0,
+                    }
+                }
             ],
         }
     )
@@ -304,11 +312,19 @@ async def test_and_condition_shorthand(hass: HomeAssistant) -> None:
 
     hass.states.async_set("sensor.temperature", 120)
     assert not test(hass)
+    # The numeric_state condition is cheaper and evaluated before the template
     assert_condition_trace(
         {
             "": [{"result": {"result": False}}],
-            "conditions/0": [
-                {"result": {"entities": ["sensor.temperature"], "result": False}}
+            "conditions/1": [{"result": {"result": False}}],
+            "conditions/1/entity_id/0": [
+                {
+                    "result": {
+                        "result": False,
+                        "state": 120.0,
+                        "wanted_state_below": 110.0,
+                    }
+                }
             ],
         }
     )
@@ -346,11 +362,19 @@ async def test_and_condition_list_shorthand(hass: HomeAssistant) -> None:
 
     hass.states.async_set("sensor.temperature", 120)
     assert not test(hass)
+    # The numeric_state condition is cheaper and evaluated before the template
     assert_condition_trace(
         {
             "": [{"result": {"result": False}}],
-            "conditions/0": [
-                {"result": {"entities": ["sensor.temperature"], "result": False}}
+            "conditions/1": [{"result": {"result": False}}],
+            "conditions/1/entity_id/0": [
+                {
+                    "result": {
+                        "result": False,
+                        "state": 120.0,
+                        "wanted_state_below": 110.0,
+                    }
+                }
             ],
         }
     )
@@ -362,6 +386,65 @@ async def test_and_condition_list_shorthand(hass: HomeAssistant) -> None:
     assert test(hass)
 
 
+async def test_and_or_condition_cost_order(hass: HomeAssistant) -> None:
+    """Test cheap conditions are evaluated before templates."""
+    template_config = {
+        "condition": "template",
+        "value_template": "{{ is_state('sensor.temperature', '100') }}",
+    }
+    state_config = {
+        "condition": "state",
+        "entity_id": "sensor.temperature",
+        "state": "100",
+    }
+    and_config = cv.CONDITION_SCHEMA(
+        {"condition": "and", "conditions": [template_config, state_config]}
+    )
+    or_config = cv.CONDITION_SCHEMA(
+        {"condition": "or", "conditions": [template_config, state_config]}
+    )
+    and_test = await condition.async_from_config(hass, and_config)
+    or_test = await condition.async_from_config(hass, or_config)
+
+    hass.states.async_set("sensor.temperature", "120")
+    with patch.object(Template, "async_render", autospec=True) as mock_render:
+        assert not and_test(hass)
+        assert mock_render.call_count == 0
+
+    hass.states.async_set("sensor.temperature", "100")
+    with patch.object(Template, "async_render", autospec=True) as mock_render:
+        assert or_test(hass)
+        assert mock_render.call_count == 0
+
+
+async def test_and_condition_cost_order_errors(hass: HomeAssistant) -> None:
+    """Test errors of reordered conditions refer to the configured index."""
+    config = cv.CONDITION_SCHEMA(
+        {
+            "condition": "and",
+            "conditions": [
+                {
+                    "condition": "template",
+                    "value_template": "{{ undefined_function() }}",
+                },
+                {
+                    "condition": "state",
+                    "entity_id": "sensor.missing",
+                    "state": "100",
+                },
+            ],
+        }
+    )
+    test = await condition.async_from_config(hass, config)
+
+    with pytest.raises(ConditionError) as err:
+        test(hass)
+    assert [line for line in str(err.value).splitlines() if line.startswith("In")] == [
+        "In 'and' (item 1 of 2):",
+        "In 'and' (item 2 of 2):",
+    ]
+
+
 async def test_malformed_and_condition_list_shorthand(hass: HomeAssistant) -> None:
     """Test the 'and' condition list shorthand syntax check."""
     config = {
@@ -31,10 +31,12 @@ from homeassistant.core import (
     ReleaseChannel,
     callback,
 )
+from homeassistant.core_config import DATA_CUSTOMIZE
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry as dr, entity, entity_registry as er
 from homeassistant.helpers.entity_component import async_update_entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.entity_values import EntityValues
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 
 from tests.common import (
@@ -2639,3 +2641,78 @@ async def test_async_write_ha_state_thread_safety_always(
     ):
         await hass.async_add_executor_job(ent2.async_write_ha_state)
     assert not hass.states.get(ent2.entity_id)
+
+
+async def test_track_state_attributes(hass: HomeAssistant) -> None:
+    """Test attributes are only calculated when marked as changed."""
+
+    class TrackedEntity(entity.Entity):
+        """Entity tracking changes of its state attributes."""
+
+        _track_state_attributes = True
+        _attr_extra_state_attributes = {"level": 1}
+        calculated = 0
+
+        @property
+        def state_attributes(self) -> dict[str, Any] | None:
+            """Return the state attributes."""
+            self.calculated += 1
+            return None
+
+    ent = TrackedEntity()
+    ent.entity_id = "test.tracked"
+    ent.hass = hass
+    ent.async_write_ha_state()
+    state = hass.states.get(ent.entity_id)
+    assert state.state == STATE_UNKNOWN
+    assert state.attributes == {"level": 1}
+    assert ent.calculated == 1
+
+    # Only the state changed, the attributes are reused
+    ent._attr_state = "on"
+    ent.async_write_ha_state()
+    new_state = hass.states.get(ent.entity_id)
+    assert new_state.state == "on"
+    assert new_state.attributes is state.attributes
+    assert ent.calculated == 1
+
+    # Setting an _attr_ property marks the attributes as changed
+    ent._attr_extra_state_attributes = {"level": 2}
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).attributes == {"level": 2}
+    assert ent.calculated == 2
+
+    ent.async_mark_state_attributes_changed()
+    ent.async_write_ha_state()
+    assert ent.calculated == 3
+
+    ent._attr_state = "off"
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).state == "off"
+    assert ent.calculated == 3
+
+    # Changing availability calculates the attributes again
+    ent._attr_available = False
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).state == STATE_UNAVAILABLE
+    ent.async_write_ha_state()
+    assert ent.calculated == 3
+    ent._attr_available = True
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).attributes == {"level": 2}
+    assert ent.calculated == 4
+
+
+async def test_track_state_attributes_customize(hass: HomeAssistant) -> None:
+    """Test changed customization is applied to tracked attributes."""
+
+    ent = entity.Entity()
+    ent._track_state_attributes = True
+    ent.entity_id = "test.tracked"
+    ent.hass = hass
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).attributes == {}
+
+    hass.data[DATA_CUSTOMIZE] = EntityValues({"test.tracked": {"hidden": True}})
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).attributes == {"hidden": True}
@@ -1194,6 +1194,111 @@ async def test_device_info_called(
     assert device.via_device_id == via.id
 
 
+async def test_device_info_shared_by_entities(
+    hass: HomeAssistant, device_registry: dr.DeviceRegistry
+) -> None:
+    """Test entities with equal device info create the device once."""
+    config_entry = MockConfigEntry(entry_id="super-mock-id")
+    config_entry.add_to_hass(hass)
+
+    async def async_setup_entry(
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        async_add_entities: AddEntitiesCallback,
+    ) -> None:
+        """Mock setup entry method."""
+        async_add_entities(
+            [
+                MockEntity(
+                    unique_id=f"qwer{idx}",
+                    device_info={
+                        "identifiers": {("hue", "1234")},
+                        "name": "test-name",
+                    },
+                )
+                for idx in range(3)
+            ]
+            + [
+                MockEntity(
+                    unique_id="other",
+                    device_info={
+                        "identifiers": {("hue", "1234")},
+                        "name": "new-name",
+                    },
+                )
+            ]
+        )
+
+    platform = MockPlatform(async_setup_entry=async_setup_entry)
+    entity_platform = MockEntityPlatform(
+        hass, platform_name=config_entry.domain, platform=platform
+    )
+
+    with patch.object(
+        device_registry,
+        "async_get_or_create",
+        wraps=device_registry.async_get_or_create,
+    ) as mock_get_or_create:
+        assert await entity_platform.async_setup_entry(config_entry)
+        await hass.async_block_till_done()
+
+    assert len(hass.states.async_entity_ids()) == 4
+    assert mock_get_or_create.call_count == 2
+    device = device_registry.async_get_device(identifiers={("hue", "1234")})
+    assert device.name == "new-name"
+
+
+async def test_registry_saves_scheduled_once(
+    hass: HomeAssistant,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test adding entities schedules each registry save once."""
+    config_entry = MockConfigEntry(entry_id="super-mock-id")
+    config_entry.add_to_hass(hass)
+
+    async def async_setup_entry(
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        async_add_entities: AddEntitiesCallback,
+    ) -> None:
+        """Mock setup entry method."""
+        async_add_entities(
+            [
+                MockEntity(
+                    unique_id=f"qwer{idx}",
+                    device_info={"identifiers": {("hue", f"{idx}")}},
+                )
+                for idx in range(3)
+            ]
+        )
+
+    platform = MockPlatform(async_setup_entry=async_setup_entry)
+    entity_platform = MockEntityPlatform(
+        hass, platform_name=config_entry.domain, platform=platform
+    )
+
+    with (
+        patch.object(
+            device_registry._store,
+            "async_delay_save",
+            wraps=device_registry._store.async_delay_save,
+        ) as mock_device_save,
+        patch.object(
+            entity_registry._store,
+            "async_delay_save",
+            wraps=entity_registry._store.async_delay_save,
+        ) as mock_entity_save,
+    ):
+        assert await entity_platform.async_setup_entry(config_entry)
+        await hass.async_block_till_done()
+
+    assert len(hass.states.async_entity_ids()) == 3
+    assert len(device_registry.devices) == 3
+    assert mock_device_save.call_count == 1
+    assert mock_entity_save.call_count == 1
+
+
 async def test_device_info_not_overrides(
     hass: HomeAssistant, device_registry: dr.DeviceRegistry
 ) -> None:
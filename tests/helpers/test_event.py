@@ -30,6 +30,7 @@ from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
+    async_get_scheduled_time_changes,
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
     async_track_point_in_time,
@@ -3936,6 +3937,165 @@ async def test_periodic_task_minute(
     assert len(specific_runs) == 2
 
 
+async def test_periodic_task_shared_pattern(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test listeners with the same pattern share one scheduled fire."""
+    runs_1 = []
+    runs_2 = []
+    other_runs = []
+
+    now = dt_util.utcnow()
+
+    time_that_will_not_match_right_away = datetime(
+        now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC
+    )
+    freezer.move_to(time_that_will_not_match_right_away)
+
+    unsub_1 = async_track_utc_time_change(
+        # pylint: disable-next=unnecessary-lambda
+        hass,
+        callback(lambda x: runs_1.append(x)),
+        minute="/5",
+        second=0,
+    )
+    unsub_2 = async_track_utc_time_change(
+        # pylint: disable-next=unnecessary-lambda
+        hass,
+        callback(lambda x: runs_2.append(x)),
+        minute="/5",
+        second="0",
+    )
+    unsub_other = async_track_utc_time_change(
+        # pylint: disable-next=unnecessary-lambda
+        hass,
+        callback(lambda x: other_runs.append(x)),
+        minute="/10",
+        second=0,
+    )
+
+    # Both patterns fire at 12:00, their order depends on the random microsecond
+    scheduled = sorted(
+        async_get_scheduled_time_changes(hass), key=lambda change: change.minutes[1]
+    )
+    assert len(scheduled) == 2
+    assert scheduled[0].minutes == tuple(range(0, 60, 5))
+    assert scheduled[0].seconds == (0,)
+    assert scheduled[0].local is False
+    assert scheduled[0].listeners == 2
+    assert scheduled[0].next_fire.replace(microsecond=0) == datetime(
+        now.year + 1, 5, 24, 12, 0, 0, tzinfo=dt_util.UTC
+    )
+    assert scheduled[1].minutes == tuple(range(0, 60, 10))
+    assert scheduled[1].listeners == 1
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs_1) == 1
+    assert len(runs_2) == 1
+    assert len(other_runs) == 1
+
+    scheduled = async_get_scheduled_time_changes(hass)
+    assert scheduled[0].next_fire.replace(microsecond=0) == datetime(
+        now.year + 1, 5, 24, 12, 5, 0, tzinfo=dt_util.UTC
+    )
+
+    unsub_1()
+    unsub_1()
+    assert async_get_scheduled_time_changes(hass)[0].listeners == 1
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 5, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs_1) == 1
+    assert len(runs_2) == 2
+
+    unsub_2()
+    unsub_other()
+    assert async_get_scheduled_time_changes(hass) == []
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 10, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs_2) == 2
+    assert len(other_runs) == 1
+
+
+async def test_periodic_task_shared_pattern_unsub_from_listener(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test a listener removing another listener of the same pattern."""
+    runs = []
+
+    now = dt_util.utcnow()
+    freezer.move_to(datetime(now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC))
+
+    @callback
+    def first_listener(now: datetime) -> None:
+        runs.append("first")
+        unsub_second()
+
+    unsub_first = async_track_utc_time_change(
+        hass, first_listener, minute="/5", second=0
+    )
+    unsub_second = async_track_utc_time_change(
+        hass, callback(lambda now: runs.append("second")), minute="/5", second=0
+    )
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert runs == ["first"]
+    unsub_first()
+
+
+async def test_periodic_task_shared_pattern_listener_raises(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a listener raising does not skip other listeners of the pattern."""
+    runs = []
+
+    now = dt_util.utcnow()
+    freezer.move_to(datetime(now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC))
+
+    @callback
+    def failing_listener(now: datetime) -> None:
+        raise ValueError("Boom")
+
+    unsub_failing = async_track_utc_time_change(
+        hass, failing_listener, minute="/5", second=0
+    )
+    unsub_second = async_track_utc_time_change(
+        hass, callback(lambda now: runs.append(now)), minute="/5", second=0
+    )
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs) == 1
+    assert "Error while dispatching time pattern change" in caplog.text
+    assert "Boom" in caplog.text
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 5, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs) == 2
+
+    unsub_failing()
+    unsub_second()
+
+
 async def test_periodic_task_hour(
     hass: HomeAssistant,
     freezer: FrozenDateTimeFactory,
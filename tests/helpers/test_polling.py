@@ -0,0 +1,205 @@
+"""Test the polling scheduler."""
+
+import asyncio
+from datetime import timedelta
+import logging
+from typing import Any
+from unittest.mock import AsyncMock
+
+from homeassistant.core import CoreState, HomeAssistant
+from homeassistant.helpers import update_coordinator
+from homeassistant.helpers.entity_component import EntityComponent
+from homeassistant.helpers.polling import (
+    MAX_STARTUP_JITTER,
+    PollingRefresh,
+    PollingScheduler,
+    async_get_polling_scheduler,
+)
+import homeassistant.util.dt as dt_util
+
+from tests.common import (
+    MockEntity,
+    MockPlatform,
+    async_fire_time_changed,
+    mock_platform,
+)
+
+
+async def test_concurrency_limits(hass: HomeAssistant) -> None:
+    """Test refreshes are limited in total and per domain."""
+    scheduler = PollingScheduler(hass, max_concurrent=3, max_concurrent_per_domain=2)
+    release = asyncio.Event()
+    running: list[str] = []
+
+    async def refresh(polling_refresh: PollingRefresh) -> None:
+        async with scheduler.async_run(polling_refresh):
+            running.append(polling_refresh.name)
+            await release.wait()
+
+    refreshes = [
+        PollingRefresh("a1", "a", 10),
+        PollingRefresh("a2", "a", 10),
+        PollingRefresh("a3", "a", 10),
+        PollingRefresh("b1", "b", 10),
+        PollingRefresh("b2", "b", 10),
+    ]
+    tasks = [hass.async_create_task(refresh(item)) for item in refreshes]
+    await asyncio.sleep(0)
+
+    assert running == ["a1", "a2", "b1"]
+    view = scheduler.async_get_refreshes()
+    assert len(view) == 5
+    assert all(item["running"] for item in view)
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert sorted(running) == ["a1", "a2", "a3", "b1", "b2"]
+    assert scheduler.async_get_refreshes() == []
+
+
+async def test_late_and_overlapping_refreshes(hass: HomeAssistant) -> None:
+    """Test late and overlapping refreshes are counted."""
+    scheduler = PollingScheduler(hass)
+    polling_refresh = PollingRefresh("test", "test", 10)
+    release = asyncio.Event()
+
+    async def refresh() -> None:
+        async with scheduler.async_run(polling_refresh):
+            await release.wait()
+
+    scheduler.async_schedule(polling_refresh, hass.loop.time() - 5)
+    (view,) = scheduler.async_get_refreshes()
+    assert view["late"] is True
+    assert view["running"] is False
+
+    first = hass.async_create_task(refresh())
+    await asyncio.sleep(0)
+    assert polling_refresh.late_count == 1
+
+    second = hass.async_create_task(refresh())
+    await asyncio.sleep(0)
+    (view,) = scheduler.async_get_refreshes()
+    assert view["overlapping"] is True
+    assert view["overlap_count"] == 1
+
+    release.set()
+    await asyncio.gather(first, second)
+    assert scheduler.async_get_refreshes() == []
+
+
+async def test_startup_jitter(hass: HomeAssistant) -> None:
+    """Test refreshes are only spread while starting."""
+    scheduler = async_get_polling_scheduler(hass)
+    assert scheduler.async_startup_jitter("key", 30) == 0
+
+    hass.set_state(CoreState.starting)
+    jitter = scheduler.async_startup_jitter("key", 30)
+    assert 0 <= jitter < 30
+    assert scheduler.async_startup_jitter("key", 30) == jitter
+    assert scheduler.async_startup_jitter("other", 30) != jitter
+    assert scheduler.async_startup_jitter("key", 3600) < MAX_STARTUP_JITTER
+
+
+async def test_coordinator_refresh(hass: HomeAssistant) -> None:
+    """Test coordinator refreshes are run through the scheduler."""
+    scheduler = async_get_polling_scheduler(hass)
+    calls = 0
+
+    async def update_method() -> int:
+        nonlocal calls
+        calls += 1
+        return calls
+
+    crd = update_coordinator.DataUpdateCoordinator[int](
+        hass,
+        logging.getLogger(__name__),
+        config_entry=None,
+        name="test",
+        update_method=update_method,
+        update_interval=timedelta(seconds=10),
+    )
+    unsub = crd.async_add_listener(lambda: None)
+
+    (view,) = scheduler.async_get_refreshes()
+    assert view["name"] == "test"
+    assert view["interval"] == 10
+    assert 9 <= view["next_refresh_in"] <= 10.5
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+    assert calls == 1
+    assert len(scheduler.async_get_refreshes()) == 1
+
+    unsub()
+    assert scheduler.async_get_refreshes() == []
+
+
+async def test_platform_polling(hass: HomeAssistant) -> None:
+    """Test polls of entity platforms are run through the scheduler."""
+    scheduler = async_get_polling_scheduler(hass)
+    component = EntityComponent(
+        logging.getLogger(__name__), "test_domain", hass, timedelta(seconds=20)
+    )
+    await component.async_setup({})
+    entity = MockEntity(should_poll=True)
+    entity.async_update = AsyncMock()
+    await component.async_add_entities([entity])
+
+    (view,) = scheduler.async_get_refreshes()
+    assert view["name"] == "test_domain.test_domain"
+    assert view["domain"] == "test_domain"
+    assert view["interval"] == 20
+    assert 19 <= view["next_refresh_in"] <= 20
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert entity.async_update.call_count == 1
+    # The next poll is scheduled once the poll is done
+    (view,) = scheduler.async_get_refreshes()
+    assert view["running"] is False
+    assert view["late_count"] == 0
+    assert 19 <= view["next_refresh_in"] <= 20
+
+    # Move the poll into the past, it is late when it starts
+    (platform,) = component._platforms.values()
+    platform._async_polling_timer.cancel()
+    scheduler.async_schedule(platform._polling_refresh, hass.loop.time() - 5)
+    platform._async_handle_interval_callback()
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert entity.async_update.call_count == 2
+    (view,) = scheduler.async_get_refreshes()
+    assert view["late_count"] == 1
+    assert 19 <= view["next_refresh_in"] <= 20
+
+    await component.async_remove_entity(entity.entity_id)
+    assert scheduler.async_get_refreshes() == []
+
+
+async def test_coordinator_domain_in_platform(hass: HomeAssistant) -> None:
+    """Test coordinators set up by a platform share its domain."""
+    coordinators: list[update_coordinator.DataUpdateCoordinator[int]] = []
+
+    async def async_setup_platform(
+        hass: HomeAssistant, config: Any, async_add_entities: Any, discovery_info=None
+    ) -> None:
+        coordinators.append(
+            update_coordinator.DataUpdateCoordinator[int](
+                hass,
+                logging.getLogger(__name__),
+                config_entry=None,
+                name="test",
+                update_interval=timedelta(seconds=10),
+            )
+        )
+
+    mock_platform(
+        hass,
+        "test_integration.test_domain",
+        MockPlatform(async_setup_platform=async_setup_platform),
+    )
+    component = EntityComponent(logging.getLogger(__name__), "test_domain", hass)
+    await component.async_setup({"test_domain": {"platform": "test_integration"}})
+    await hass.async_block_till_done()
+
+    (crd,) = coordinators
+    assert crd._polling_refresh.domain == "test_integration"
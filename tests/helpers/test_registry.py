@@ -1,5 +1,6 @@
 """Tests for the registry."""
 
+import asyncio
 from typing import Any
 
 from freezegun.api import FrozenDateTimeFactory
@@ -7,7 +8,12 @@ import pytest
 
 from homeassistant.core import CoreState, HomeAssistant
 from homeassistant.helpers import storage
-from homeassistant.helpers.registry import SAVE_DELAY, SAVE_DELAY_LONG, BaseRegistry
+from homeassistant.helpers.registry import (
+    SAVE_DELAY,
+    SAVE_DELAY_LONG,
+    BaseRegistry,
+    async_batch_saves,
+)
 
 from tests.common import async_fire_time_changed
 
@@ -69,3 +75,49 @@ async def test_async_schedule_save(
     async_fire_time_changed(hass)
     await hass.async_block_till_done()
     assert registry.save_calls == 2
+
+
+async def test_async_batch_saves(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test saves are scheduled once the batch exits, only for its own context."""
+    registry = SampleRegistry(hass)
+    other_registry = SampleRegistry(hass)
+    start_other = asyncio.Event()
+    release = asyncio.Event()
+
+    async def change_other() -> None:
+        await start_other.wait()
+        other_registry.async_schedule_save()
+
+    async def change_later() -> None:
+        await release.wait()
+        registry.async_schedule_save()
+
+    other_task = hass.async_create_task(change_other())
+    with async_batch_saves():
+        registry.async_schedule_save()
+        registry.async_schedule_save()
+        later_task = hass.async_create_task(change_later())
+        # Tasks not started in the batch schedule their saves as usual
+        start_other.set()
+        await other_task
+        assert other_registry._store._delay_handle is not None
+        assert registry._store._delay_handle is None
+
+    assert registry._store._delay_handle is not None
+    registry._store._delay_handle.cancel()
+    registry._store._delay_handle = None
+
+    # A task started in the batch schedules its save after the batch exits
+    release.set()
+    await later_task
+    assert registry._store._delay_handle is not None
+
+    freezer.tick(SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert registry.save_calls == 1
+    assert other_registry.save_calls == 1
@@ -375,6 +375,58 @@ async def test_dump_error(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
 
+async def test_stored_states_decoded_on_demand(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test stored states are only decoded when an entity asks for them."""
+    now = dt_util.utcnow()
+    expired = datetime(1985, 10, 26, 1, 22, tzinfo=dt_util.UTC)
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": [
+            json_round_trip(StoredState(State(entity_id, "on"), None, last_seen))
+            for entity_id, last_seen in (
+                ("input_boolean.b0", now),
+                ("input_boolean.b1", now),
+                ("input_boolean.b2", expired),
+            )
+        ],
+    }
+
+    data = async_get(hass)
+    with patch(
+        "homeassistant.helpers.restore_state.StoredState.from_dict",
+        wraps=StoredState.from_dict,
+    ) as mock_from_dict:
+        await data.async_load()
+        assert not mock_from_dict.called
+
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = "input_boolean.b1"
+        state = await entity.async_get_last_state()
+        assert state.state == "on"
+        assert await entity.async_get_last_state() is state
+        assert mock_from_dict.call_count == 1
+
+        with patch(
+            "homeassistant.helpers.restore_state.Store.async_save"
+        ) as mock_write_data:
+            await data.async_dump_states()
+        assert mock_from_dict.call_count == 1
+
+    # b0 is saved as it was loaded, b2 is expired
+    written_states = [
+        json_round_trip(item) for item in mock_write_data.mock_calls[0][1][0]
+    ]
+    assert [item["state"]["entity_id"] for item in written_states] == [
+        "input_boolean.b1",
+        "input_boolean.b0",
+    ]
+    assert written_states[1] == hass_storage[STORAGE_KEY]["data"][0]
+
+
 async def test_load_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     entity = RestoreEntity()
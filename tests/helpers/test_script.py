@@ -333,6 +333,124 @@ async def test_calling_service_template(hass: HomeAssistant) -> None:
     )
 
 
+async def test_trace_disabled(hass: HomeAssistant) -> None:
+    """Test no trace elements are created when tracing is disabled."""
+    events = async_capture_events(hass, "test_event")
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {"event": "test_event"},
+            {"condition": "template", "value_template": "{{ true }}"},
+            {
+                "if": {"condition": "template", "value_template": "{{ true }}"},
+                "then": {"event": "test_event"},
+            },
+        ]
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    with trace.trace_enabled(False):
+        await script_obj.async_run(context=Context())
+    await hass.async_block_till_done()
+
+    assert len(events) == 2
+    assert_action_trace({})
+
+
+async def test_trace_disabled_breakpoint(hass: HomeAssistant) -> None:
+    """Test breakpoints halt execution when tracing is disabled."""
+    events = async_capture_events(hass, "test_event")
+    sequence = cv.SCRIPT_SCHEMA([{"event": "test_event"}, {"event": "test_event"}])
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+    trace.trace_id_set(("script_1", "1"))
+    script.breakpoint_set(hass, "script_1", script.RUN_ID_ANY, "1")
+
+    breakpoint_hit_event = asyncio.Event()
+
+    @callback
+    def breakpoint_hit(*_):
+        breakpoint_hit_event.set()
+
+    async_dispatcher_connect(hass, script.SCRIPT_BREAKPOINT_HIT, breakpoint_hit)
+
+    with trace.trace_enabled(False):
+        task = hass.async_create_task(script_obj.async_run(context=Context()))
+    await breakpoint_hit_event.wait()
+    assert len(events) == 1
+
+    script.debug_continue(hass, "script_1", "1")
+    await task
+    assert len(events) == 2
+
+
+async def test_calling_service_static_params_prepared_once(
+    hass: HomeAssistant,
+) -> None:
+    """Test the parameters of a service call without templates are reused."""
+    calls = async_mock_service(hass, "test", "script")
+
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {
+                "action": "test.script",
+                "target": {"entity_id": "light.kitchen"},
+                "data": {"hello": "world"},
+            },
+            {"action": "test.script", "data": {"hello": "{{ greeting }}"}},
+        ]
+    )
+    script_obj = script.Script(
+        hass, sequence, "Test Name", "test_domain", script_mode="parallel"
+    )
+
+    with patch(
+        "homeassistant.helpers.script.service.async_prepare_call_from_config",
+        wraps=script.service.async_prepare_call_from_config,
+    ) as mock_prepare:
+        for greeting in ("hi", "hello", "hey"):
+            await script_obj.async_run(
+                MappingProxyType({"greeting": greeting}), context=Context()
+            )
+        await hass.async_block_till_done()
+
+    # The static step is prepared once, the templated step on every run
+    assert mock_prepare.call_count == 4
+    assert len(calls) == 6
+    assert [call.data["hello"] for call in calls] == [
+        "world",
+        "hi",
+        "world",
+        "hello",
+        "world",
+        "hey",
+    ]
+    for call in calls[::2]:
+        assert call.data == {"hello": "world", "entity_id": ["light.kitchen"]}
+
+
+async def test_calling_service_entity_uuid_params_not_cached(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test service calls targeting entity registry ids are prepared on every run."""
+    calls = async_mock_service(hass, "test", "script")
+    entry = entity_registry.async_get_or_create("light", "hue", "1234")
+
+    sequence = cv.SCRIPT_SCHEMA(
+        {"action": "test.script", "target": {"entity_id": entry.id}}
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    await script_obj.async_run(context=Context())
+    await hass.async_block_till_done()
+    entity_registry.async_update_entity(entry.entity_id, new_entity_id="light.new")
+    await script_obj.async_run(context=Context())
+    await hass.async_block_till_done()
+
+    assert [call.data["entity_id"] for call in calls] == [
+        [entry.entity_id],
+        ["light.new"],
+    ]
+
+
 async def test_calling_service_response_data(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
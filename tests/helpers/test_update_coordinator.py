@@ -11,8 +11,14 @@ import pytest
 import requests
 
 from homeassistant import config_entries
-from homeassistant.const import EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import CoreState, HomeAssistant, callback
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, EVENT_STATE_CHANGED
+from homeassistant.core import (
+    CoreState,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.exceptions import (
     ConfigEntryAuthFailed,
     ConfigEntryError,
@@ -21,7 +27,7 @@ from homeassistant.exceptions import (
 from homeassistant.helpers import frame, update_coordinator
 from homeassistant.util.dt import utcnow
 
-from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.common import MockConfigEntry, async_capture_events, async_fire_time_changed
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -492,6 +498,37 @@ async def test_async_set_updated_data(
     remove_callbacks()
 
 
+async def test_batch_updates(hass: HomeAssistant) -> None:
+    """Test the states written by listeners are fired as one batch."""
+    crd = get_crd(hass, DEFAULT_UPDATE_INTERVAL)
+    crd.batch_updates = True
+    seen_states = []
+
+    @callback
+    def state_listener(event: Event[EventStateChangedData]) -> None:
+        seen_states.append(
+            (hass.states.get("sensor.one").state, hass.states.get("sensor.two").state)
+        )
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, state_listener)
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    remove_callbacks = [
+        crd.async_add_listener(
+            lambda entity_id=entity_id: hass.states.async_set(entity_id, crd.data)
+        )
+        for entity_id in ("sensor.one", "sensor.two")
+    ]
+    crd.async_set_updated_data(1)
+    await hass.async_block_till_done()
+
+    assert seen_states == [("1", "1"), ("1", "1")]
+    assert events[0].context is events[1].context
+
+    for remove_callback in remove_callbacks:
+        remove_callback()
+
+
 async def test_stop_refresh_on_ha_stop(
     hass: HomeAssistant, crd: update_coordinator.DataUpdateCoordinator[int]
 ) -> None:
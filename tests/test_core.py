@@ -1488,6 +1488,65 @@ async def test_statemachine_remove(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_batch(hass: HomeAssistant) -> None:
+    """Test state changes of a batch are fired when the batch ends."""
+    hass.states.async_set("light.bowl", "on", {})
+    hass.states.async_set("light.lamp", "on", {})
+    seen_states: list[tuple[ha.State | None, str]] = []
+
+    @callback
+    def listener(event: ha.Event[ha.EventStateChangedData]) -> None:
+        # All states of the batch are set when the first event is fired
+        seen_states.append(
+            (hass.states.get("light.bowl"), hass.states.get("light.lamp").state)
+        )
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, listener)
+    changed = async_capture_events(hass, EVENT_STATE_CHANGED)
+    reported: list[ha.Event] = []
+    hass.bus.async_listen(
+        EVENT_STATE_REPORTED, reported.append, event_filter=callback(lambda data: True)
+    )
+    batch_context = ha.Context()
+
+    with hass.states.async_batch(batch_context):
+        hass.states.async_set("light.bowl", "off")
+        with hass.states.async_batch():
+            hass.states.async_set("light.lamp", "off")
+        hass.states.async_set("light.lamp", "off")
+        hass.states.async_remove("light.bowl")
+        assert seen_states == []
+    await hass.async_block_till_done()
+
+    assert seen_states == [(None, "off"), (None, "off"), (None, "off")]
+    assert [
+        (
+            event.data["entity_id"],
+            event.data["new_state"] and event.data["new_state"].state,
+        )
+        for event in changed
+    ] == [("light.bowl", "off"), ("light.lamp", "off"), ("light.bowl", None)]
+    assert changed[0].context is batch_context
+    assert changed[1].context is batch_context
+    assert len(reported) == 1
+    assert reported[0].context is batch_context
+
+
+async def test_statemachine_set_many(hass: HomeAssistant) -> None:
+    """Test setting multiple states as one batch."""
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    hass.states.async_set_many(
+        [("light.bowl", "on", {"brightness": 100}), ("light.lamp", "off", None)]
+    )
+    await hass.async_block_till_done()
+
+    assert hass.states.get("light.bowl").attributes == {"brightness": 100}
+    assert hass.states.get("light.lamp").state == "off"
+    assert len(events) == 2
+    assert events[0].context is events[1].context
+
+
 async def test_state_machine_case_insensitivity(hass: HomeAssistant) -> None:
     """Test setting and getting states entity_id insensitivity."""
     events = async_capture_events(hass, EVENT_STATE_CHANGED)